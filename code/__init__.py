@@ -3,9 +3,13 @@ from models.lista_adjacencia import ListaAdjacencia
 from models.matriz_adjacencia import MatrizAdjacencia
 from models.matriz_incidencia import MatrizIncidencia
 from utils.gexf_exporter import GEXFExporter
+from utils.gexf_importer import GEXFImporter
+from utils.importador_texto import ImportadorTexto
 from utils.ppm_exporter import PPMExporter
 from utils.txt_exporter import TXTExporter
-from tests.teste_desempenho import teste_desempensho
+from utils.formato_binario import FormatoBinario
+from utils.instrumentacao import Instrumentacao
+from tests.teste_desempenho import teste_desempenho
 
 __all__ = [
     "Grafo",
@@ -13,7 +17,11 @@ __all__ = [
     "MatrizAdjacencia",
     "MatrizIncidencia",
     "GEXFExporter",
+    "GEXFImporter",
+    "ImportadorTexto",
     "PPMExporter",
     "TXTExporter",
+    "FormatoBinario",
+    "Instrumentacao",
     "teste_desempenho"
 ]
@@ -1,24 +1,22 @@
-
 IMAGE_DIR="dados/imagens_ppm"
 
 
 OUTPUT_GIF="../../../docs/grafo.gif"
 
+# Para gerar o GIF sem passar por arquivos de quadro, use
+# Grafo.exportar_animacao_gif() ou envie um SaidaPPMStream direto para:
+#   ffmpeg -f image2pipe -c:v ppm -framerate 10 -i - ...
+
 
 cd "$IMAGE_DIR" || exit
 
 
 if ls frame_*.ppm 1> /dev/null 2>&1; then
-    
-    mkdir -p png_frames
-    for img in frame_*.ppm; do
-        ffmpeg -i "$img" "png_frames/${img%.ppm}.png"
-    done
-
-    
-    ffmpeg -f image2 -framerate 10 -i png_frames/frame_%d.png -vf "scale=800:-1:flags=lanczos" -loop 0 "$OUTPUT_GIF"
-    
-    rm -r png_frames
+
+    # Os quadros são concatenados num único fluxo para um só processo ffmpeg.
+    ls frame_*.ppm | sort -t_ -k2 -n | xargs cat | \
+        ffmpeg -f image2pipe -c:v ppm -framerate 10 -i - -vf "scale=800:-1:flags=lanczos" -loop 0 "$OUTPUT_GIF"
+
     echo "GIF criado em $OUTPUT_GIF"
 else
     echo "Nenhuma imagem PPM encontrada no diretório $IMAGE_DIR."
@@ -1,62 +1,217 @@
 from models.lista_adjacencia import ListaAdjacencia
 from models.matriz_adjacencia import MatrizAdjacencia
 from models.matriz_incidencia import MatrizIncidencia
+from models.indice_arestas import IndiceArestas
+from models.indice_pontes import IndicePontes
+from models.condensacao import Condensacao
+from models.estrutura_grafo import EstruturaGrafo
+from models.grafo_csr import GrafoCSR
 from utils.gexf_exporter import GEXFExporter
 from utils.ppm_exporter import PPMExporter
 from utils.txt_exporter import TXTExporter
+from utils.animacao import SaidaGIF
 from utils.desenhador import Desenhador
+from utils.oraculo_pontes import OraculoPontes
+from utils.layout import LayoutForcas
+from utils.formato_binario import FormatoBinario
+from utils.cache_resultados import CacheResultados, memoizar_por_versao, memoizar_com_copia
+from array import array
+from itertools import chain
 import os
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _colunas_arestas(arestas):
+    # Aceita um par (ou trio) de colunas já prontas -- listas, array.array ou
+    # arrays NumPy -- dentro de uma tupla, um array NumPy 2-D de linhas ou
+    # qualquer outro iterável de linhas (u, v) / (u, v, peso). Uma tupla de
+    # listas é sempre lida como colunas, nunca como linhas.
+    tipos_coluna = (list, array, np.ndarray) if np is not None else (list, array)
+    if isinstance(arestas, tuple) and len(arestas) in (2, 3) and all(isinstance(c, tipos_coluna) for c in arestas):
+        if any(len(c) != len(arestas[0]) for c in arestas):
+            raise ValueError("As colunas de arestas devem ter o mesmo comprimento.")
+        origens, destinos = arestas[0], arestas[1]
+        pesos = arestas[2] if len(arestas) == 3 else None
+        if np is not None and isinstance(origens, np.ndarray):
+            # Vértices sempre inteiros, mesmo vindos de colunas float.
+            origens = origens.astype(np.int64, copy=False)
+            destinos = np.asarray(destinos).astype(np.int64, copy=False)
+            if pesos is None:
+                pesos = np.ones(len(origens), dtype=np.int64)
+            return origens, destinos, pesos
+        if pesos is None:
+            pesos = [1] * len(origens)
+        return origens, destinos, pesos
+    if np is not None and isinstance(arestas, np.ndarray) and arestas.ndim == 2:
+        # Linhas (u, v, peso) com pesos fracionários chegam como float: só a
+        # coluna de pesos mantém o tipo original.
+        pesos = arestas[:, 2] if arestas.shape[1] > 2 else np.ones(len(arestas), dtype=np.int64)
+        return arestas[:, 0].astype(np.int64), arestas[:, 1].astype(np.int64), pesos
+    origens, destinos, pesos = [], [], []
+    for aresta in arestas:
+        origens.append(aresta[0])
+        destinos.append(aresta[1])
+        pesos.append(aresta[2] if len(aresta) > 2 else 1)
+    return origens, destinos, pesos
+
+
+def _copiar_componentes(resultado):
+    num_componentes, componente = resultado
+    return num_componentes, list(componente)
+
+
+def _copiar_listas(resultado):
+    return [list(item) for item in resultado]
+
+
+def _copiar_testemunha(resultado):
+    conexo, testemunha = resultado
+    if testemunha is None:
+        return conexo, None
+    return conexo, (list(testemunha[0]), list(testemunha[1]))
+
+
+def _validar_vertices(origens, destinos, num_vertices):
+    # Checa todos os extremos antes de qualquer escrita, para que um lote
+    # inválido não deixe o grafo pela metade.
+    if not len(origens):
+        return
+    if np is not None and isinstance(origens, np.ndarray):
+        menor = min(origens.min(), destinos.min())
+        maior = max(origens.max(), destinos.max())
+    else:
+        menor = min(min(origens), min(destinos))
+        maior = max(max(origens), max(destinos))
+    if menor < 0 or maior >= num_vertices:
+        raise ValueError(f"Vértices válidos estão entre 0 e {num_vertices - 1}.")
+
+
 class Grafo:
-    def __init__(self, num_vertices, dirigido=False, nome=""):
+    def __init__(self, num_vertices, dirigido=False, nome="", debug=False):
         self.num_vertices = num_vertices
         self.dirigido = dirigido
         self.nome = nome
+        self.debug = debug
+        # A lista de adjacência é a representação primária; as matrizes
+        # densas só são construídas quando acessadas e descartadas a cada mutação.
         self.lista_adj = ListaAdjacencia(num_vertices, dirigido)
-        self.matriz_adj = MatrizAdjacencia(num_vertices, dirigido)
-        self.matriz_inc = MatrizIncidencia(num_vertices, dirigido)
-        self.edge_list = []
+        self._matriz_adj = None
+        self._matriz_inc = None
+        self.arestas = IndiceArestas(dirigido)
+        self.edge_list = self.arestas.edge_list
+        self.indice_pontes = None
+        # Todo mutador incrementa a versão; os resultados memoizados valem
+        # apenas para a versão em que foram calculados.
+        self.versao = 0
+        self.cache = CacheResultados()
         self.vertex_labels = {i: f"V{i + 1}" for i in range(num_vertices)}
-        self.tempo = 0
         self.frame_count = 0
         self.desenhador = Desenhador()
 
+    @property
+    def matriz_adj(self):
+        if self._matriz_adj is None:
+            matriz = MatrizAdjacencia(self.num_vertices, self.dirigido)
+            for u, adj in self.lista_adj.adjacencias.items():
+                linha = matriz.adj_matrix[u]
+                for v, peso in adj.items():
+                    linha[v] = peso
+                    matriz.presentes.add((u, v))
+            self._matriz_adj = matriz
+        return self._matriz_adj
+
+    @property
+    def matriz_inc(self):
+        if self._matriz_inc is None:
+            matriz = MatrizIncidencia(self.num_vertices, self.dirigido, self.arestas)
+            for edge in self.edge_list:
+                matriz.adicionar_aresta(edge['u'], edge['v'], edge['peso'], edge['label'], edge['id'])
+            self._matriz_inc = matriz
+        return self._matriz_inc
+
+    def _registrar_mutacao(self):
+        self.versao += 1
+        self._matriz_adj = None
+        self._matriz_inc = None
+
     def adicionar_vertice(self, label=None):
-        v = self.num_vertices
-        self.lista_adj.num_vertices += 1
-        self.matriz_adj.num_vertices += 1
-        self.matriz_inc.num_vertices += 1
+        v = self.lista_adj.adicionar_vertice()
         self.num_vertices += 1
-        self.lista_adj.adjacencias[v] = []
-        for row in self.matriz_adj.adj_matrix:
-            row.append(0)
-        self.matriz_adj.adj_matrix.append([0] * self.matriz_adj.num_vertices)
-        for row in self.matriz_inc.inc_matrix:
-            row.append(0)
         self.vertex_labels[v] = label if label else f"V{v + 1}"
+        self._registrar_mutacao()
+        if self.indice_pontes is not None:
+            self.indice_pontes.adicionar_vertice()
 
     def adicionar_aresta(self, u, v, peso=1, label=None):
+        if not (0 <= u < self.num_vertices and 0 <= v < self.num_vertices):
+            raise ValueError(f"Vértices válidos estão entre 0 e {self.num_vertices - 1}.")
+        if (u, v) in self.arestas:
+            return self.arestas.buscar(u, v)
         self.lista_adj.adicionar_aresta(u, v, peso, label)
-        self.matriz_adj.adicionar_aresta(u, v, peso)
-        self.matriz_inc.adicionar_aresta(u, v, peso, label)
-        self.edge_list.append({'u': u, 'v': v, 'peso': peso, 'label': label})
+        self._registrar_mutacao()
+        if self.indice_pontes is not None and not self.indice_pontes.desatualizado:
+            self.indice_pontes.adicionar_aresta(u, v)
+        return self.arestas.adicionar(u, v, peso, label)
+
+    def adicionar_arestas(self, arestas):
+        origens, destinos, pesos = _colunas_arestas(arestas)
+        _validar_vertices(origens, destinos, self.num_vertices)
+        novas = self.arestas.adicionar_varias(origens, destinos, pesos)
+        self.lista_adj.adicionar_arestas(*novas)
+        self._registrar_mutacao()
+        if self.indice_pontes is not None and not self.indice_pontes.desatualizado:
+            for u, v in zip(novas[0], novas[1]):
+                self.indice_pontes.adicionar_aresta(u, v)
+        return len(novas[0])
+
+    @classmethod
+    def from_edges(cls, num_vertices, arestas, dirigido=False, nome=""):
+        grafo = cls(num_vertices, dirigido, nome)
+        grafo.adicionar_arestas(arestas)
+        return grafo
 
     def remover_aresta(self, u, v):
+        if self.arestas.remover(u, v) is None:
+            return
         self.lista_adj.remover_aresta(u, v)
-        self.matriz_adj.remover_aresta(u, v)
-        self.matriz_inc.remover_aresta(u, v)
-        for i, edge in enumerate(self.edge_list):
-            if edge['u'] == u and edge['v'] == v:
-                del self.edge_list[i]
-                break
-            if not self.dirigido and edge['u'] == v and edge['v'] == u:
-                del self.edge_list[i]
-                break
+        self._registrar_mutacao()
+        if self.indice_pontes is not None:
+            # Remoções não são suportadas incrementalmente; o índice é
+            # reconstruído na próxima consulta.
+            self.indice_pontes.desatualizado = True
+
+    def habilitar_indice_pontes(self):
+        if self.indice_pontes is None:
+            self.indice_pontes = IndicePontes.reconstruir(self.num_vertices, self.edge_list)
+        return self.indice_pontes
+
+    def _indice_pontes_atual(self):
+        if self.indice_pontes is None:
+            raise RuntimeError("Índice de pontes desabilitado; chame habilitar_indice_pontes() antes.")
+        if self.indice_pontes.desatualizado:
+            self.indice_pontes = IndicePontes.reconstruir(self.num_vertices, self.edge_list)
+        return self.indice_pontes
+
+    def pontes_atuais(self):
+        return self._indice_pontes_atual().pontes()
+
+    def componentes_2_aresta_conexas(self):
+        return self._indice_pontes_atual().componentes()
+
+    def estatisticas_cache(self):
+        return self.cache.estatisticas()
 
     def checar_adjacencia_vertices(self, u, v):
-        return (self.lista_adj.checar_adjacencia(u, v) and
-                self.matriz_adj.checar_adjacencia(u, v) and
-                self.matriz_inc.checar_adjacencia(u, v))
+        adjacente = self.lista_adj.checar_adjacencia(u, v)
+        if self.debug:
+            if (adjacente != self.matriz_adj.checar_adjacencia(u, v) or
+                    adjacente != self.matriz_inc.checar_adjacencia(u, v)):
+                raise RuntimeError(f"Representações divergentes para a aresta ({u}, {v}).")
+        return adjacente
 
     def contar_vertices_arestas(self):
         num_vertices = self.num_vertices
@@ -66,250 +221,419 @@ class Grafo:
     def grafo_vazio(self):
         return self.contar_vertices_arestas()[1] == 0
 
+    @memoizar_por_versao
     def grafo_completo(self):
-        for u in range(self.num_vertices):
-            grau = len(self.lista_adj.adjacencias[u])
-            if self.dirigido:
-                if grau != self.num_vertices - 1:
-                    return False
-            else:
-                if grau != self.num_vertices - 1:
-                    return False
-        return True
+        esperado = self.num_vertices - 1
+        if any(grau != esperado for grau in self.lista_adj.grau_saida):
+            return False
+        return all(grau == esperado for grau in self.lista_adj.grau_entrada)
+
+    @memoizar_com_copia(list)
+    def identificar_pontes_naive(self, processos=None, verificar=False):
+        # Oráculo de correção: testa cada aresta sobre um snapshot somente-leitura,
+        # sem mexer na lista de adjacência, distribuindo as arestas entre processos.
+        pontes = OraculoPontes.identificar_pontes(self, processos)
+        if verificar:
+            pontes_tarjan = {(min(u, v), max(u, v)) for u, v in self.identificar_pontes_tarjan()}
+            if {(min(u, v), max(u, v)) for u, v in pontes} != pontes_tarjan:
+                raise RuntimeError("Pontes divergentes entre o método naive e o de Tarjan.")
+        return tuple(pontes)
 
-    def identificar_pontes_naive(self):
+    @memoizar_por_versao
+    def analisar_estrutura(self):
+        # Uma única DFS iterativa de low-link, sobre o grafo subjacente não
+        # dirigido, produz pontes, articulações, blocos biconexos (pilha de
+        # arestas) e componentes 2-aresta-conexas (pilha de vértices).
+        n = self.num_vertices
+        adjacencias = self.lista_adj.adjacencias
+        predecessores = self.lista_adj.predecessores
+        dirigido = self.dirigido
+        num = [0] * n
+        low = [0] * n
+        parent = [-1] * n
+        pulou_pai = bytearray(n)
+        pilha_arestas = []
+        pilha_vertices = []
         pontes = []
-        for u in range(self.num_vertices):
-            adjacentes = list(self.lista_adj.adjacencias[u])
-            for v, peso in adjacentes:
-                if (u < v) or self.dirigido:
-                    self.lista_adj.adjacencias[u] = [w for w in self.lista_adj.adjacencias[u] if w[0] != v]
-                    if not self.dirigido:
-                        self.lista_adj.adjacencias[v] = [w for w in self.lista_adj.adjacencias[v] if w[0] != u]
-                    if not self.grafo_conexo():
+        articulacoes = []
+        eh_articulacao = bytearray(n)
+        blocos = []
+        componentes_2_aresta = []
+        num_componentes = 0
+        tempo = 1
+        for raiz in range(n):
+            if num[raiz]:
+                continue
+            num_componentes += 1
+            filhos_raiz = 0
+            num[raiz] = low[raiz] = tempo
+            tempo += 1
+            pilha_vertices.append(raiz)
+            stack = [(raiz, self._vizinhos_subjacentes(raiz, adjacencias, predecessores, dirigido))]
+            while stack:
+                v, vizinhos = stack[-1]
+                for w in vizinhos:
+                    if w == v:
+                        continue
+                    if w == parent[v] and not pulou_pai[v]:
+                        # Ignora só a aresta da árvore; uma segunda aresta para o
+                        # pai (u->v e v->u num dirigido) é uma aresta de retorno.
+                        pulou_pai[v] = 1
+                        continue
+                    if not num[w]:
+                        parent[w] = v
+                        if v == raiz:
+                            filhos_raiz += 1
+                        num[w] = low[w] = tempo
+                        tempo += 1
+                        pilha_arestas.append((v, w))
+                        pilha_vertices.append(w)
+                        stack.append((w, self._vizinhos_subjacentes(w, adjacencias, predecessores, dirigido)))
+                        break
+                    if num[w] < num[v]:
+                        pilha_arestas.append((v, w))
+                        if num[w] < low[v]:
+                            low[v] = num[w]
+                else:
+                    stack.pop()
+                    u = parent[v]
+                    if u == -1:
+                        continue
+                    if low[v] < low[u]:
+                        low[u] = low[v]
+                    if low[v] >= num[u]:
+                        if (u != raiz or filhos_raiz > 1) and not eh_articulacao[u]:
+                            eh_articulacao[u] = 1
+                            articulacoes.append(u)
+                        bloco = []
+                        while True:
+                            aresta = pilha_arestas.pop()
+                            bloco.append(aresta)
+                            if aresta == (u, v):
+                                break
+                        blocos.append(bloco)
+                    if low[v] > num[u]:
                         pontes.append((u, v))
-                    self.lista_adj.adjacencias[u].append((v, peso))
-                    if not self.dirigido:
-                        self.lista_adj.adjacencias[v].append((u, peso))
-        return pontes
+                        componentes_2_aresta.append(self._desempilhar_ate(pilha_vertices, v))
+            componentes_2_aresta.append(self._desempilhar_ate(pilha_vertices, raiz))
+        return EstruturaGrafo(num_componentes, pontes, articulacoes, blocos, componentes_2_aresta)
+
+    @staticmethod
+    def _vizinhos_subjacentes(v, adjacencias, predecessores, dirigido):
+        if dirigido:
+            return chain(adjacencias[v], predecessores[v])
+        return iter(adjacencias[v])
+
+    @staticmethod
+    def _desempilhar_ate(pilha, v):
+        componente = []
+        while True:
+            w = pilha.pop()
+            componente.append(w)
+            if w == v:
+                return componente
 
     def identificar_pontes_tarjan(self):
-        num = [0] * self.num_vertices
-        low = [0] * self.num_vertices
-        self.tempo = 1
-        pontes = []
-        visited = [False] * self.num_vertices
-        parent = [-1] * self.num_vertices
-        for u in range(self.num_vertices):
-            if not visited[u]:
-                self._tarjan_dfs(u, visited, parent, num, low, pontes)
-        return pontes
-
-    def _tarjan_dfs(self, u, visited, parent, num, low, pontes):
-        stack = [(u, iter(self.lista_adj.adjacencias[u]))]
-        visited[u] = True
-        num[u] = low[u] = self.tempo
-        self.tempo += 1
-        while stack:
-            v, children = stack[-1]
-            try:
-                w, _ = next(children)
-                if not visited[w]:
-                    parent[w] = v
-                    visited[w] = True
-                    num[w] = low[w] = self.tempo
-                    self.tempo += 1
-                    stack.append((w, iter(self.lista_adj.adjacencias[w])))
-                elif w != parent[v]:
-                    low[v] = min(low[v], num[w])
-            except StopIteration:
-                stack.pop()
-                if parent[v] != -1:
-                    low[parent[v]] = min(low[parent[v]], low[v])
-                    if low[v] > num[parent[v]]:
-                        pontes.append((parent[v], v))
+        return list(self.analisar_estrutura().pontes)
 
     def identificar_articulacoes(self):
-        num = [0] * self.num_vertices
-        low = [0] * self.num_vertices
-        parent = [-1] * self.num_vertices
-        self.tempo = 1
-        articulacoes = set()
-        visited = [False] * self.num_vertices
-        for u in range(self.num_vertices):
-            if not visited[u]:
-                self._articulacao_dfs(u, visited, parent, num, low, articulacoes)
-        return list(articulacoes)
-
-    def _articulacao_dfs(self, u, visited, parent, num, low, articulacoes):
-        stack = [(u, iter(self.lista_adj.adjacencias[u]), False)]
-        children = 0
-        visited[u] = True
-        num[u] = low[u] = self.tempo
-        self.tempo += 1
-        while stack:
-            v, children_iter, is_return = stack[-1]
-            if not is_return:
-                stack[-1] = (v, children_iter, True)
-                try:
-                    w, _ = next(children_iter)
-                    if not visited[w]:
-                        parent[w] = v
-                        children += 1
-                        visited[w] = True
-                        num[w] = low[w] = self.tempo
-                        self.tempo += 1
-                        stack.append((w, iter(self.lista_adj.adjacencias[w]), False))
-                    elif w != parent[v]:
-                        low[v] = min(low[v], num[w])
-                except StopIteration:
-                    stack.pop()
-                    if parent[v] != -1:
-                        low[parent[v]] = min(low[parent[v]], low[v])
-                        if low[v] >= num[parent[v]]:
-                            articulacoes.add(parent[v])
-                    else:
-                        if children > 1:
-                            articulacoes.add(v)
-            else:
-                stack.pop()
+        return list(self.analisar_estrutura().articulacoes)
 
+    @memoizar_por_versao
     def grafo_conexo(self):
         if self.num_vertices == 0:
             return True
+        if not self.dirigido:
+            return self.analisar_estrutura().num_componentes == 1
         visitados = [False] * self.num_vertices
         stack = [0]
         visitados[0] = True
         while stack:
             v = stack.pop()
-            for w, _ in self.lista_adj.adjacencias[v]:
+            for w in self.lista_adj.adjacencias[v]:
                 if not visitados[w]:
                     visitados[w] = True
                     stack.append(w)
         return all(visitados)
 
+    @memoizar_com_copia(_copiar_componentes)
+    def componentes_fortemente_conexas(self):
+        # Tarjan iterativo: uma única DFS com pilha explícita, sem recursão.
+        n = self.num_vertices
+        adjacencias = self.lista_adj.adjacencias
+        num = [-1] * n
+        low = [0] * n
+        na_pilha = bytearray(n)
+        pilha = []
+        componente = [-1] * n
+        num_componentes = 0
+        contador = 0
+        for raiz in range(n):
+            if num[raiz] != -1:
+                continue
+            num[raiz] = low[raiz] = contador
+            contador += 1
+            pilha.append(raiz)
+            na_pilha[raiz] = 1
+            dfs = [(raiz, iter(adjacencias[raiz]))]
+            while dfs:
+                v, filhos = dfs[-1]
+                for w in filhos:
+                    if num[w] == -1:
+                        num[w] = low[w] = contador
+                        contador += 1
+                        pilha.append(w)
+                        na_pilha[w] = 1
+                        dfs.append((w, iter(adjacencias[w])))
+                        break
+                    if na_pilha[w] and num[w] < low[v]:
+                        low[v] = num[w]
+                else:
+                    dfs.pop()
+                    if dfs:
+                        pai = dfs[-1][0]
+                        if low[v] < low[pai]:
+                            low[pai] = low[v]
+                    if low[v] == num[v]:
+                        while True:
+                            w = pilha.pop()
+                            na_pilha[w] = 0
+                            componente[w] = num_componentes
+                            if w == v:
+                                break
+                        num_componentes += 1
+        # Tarjan fecha as componentes em ordem topológica reversa; inverter os
+        # ids deixa a condensação em ordem topológica.
+        ultimo = num_componentes - 1
+        return num_componentes, tuple(ultimo - c for c in componente)
+
+    @memoizar_por_versao
+    def condensacao(self):
+        num_componentes, componente = self.componentes_fortemente_conexas()
+        return Condensacao(num_componentes, componente, self.lista_adj.adjacencias)
+
+    @memoizar_com_copia(_copiar_listas)
     def kosaraju_scc(self):
-        visited = [False] * self.num_vertices
-        stack = []
-        def dfs_fill_order(v):
-            visited[v] = True
-            for w, _ in self.lista_adj.adjacencias[v]:
-                if not visited[w]:
-                    dfs_fill_order(w)
-            stack.append(v)
-        for i in range(self.num_vertices):
-            if not visited[i]:
-                dfs_fill_order(i)
-        transposto = {i: [] for i in range(self.num_vertices)}
-        for u in self.lista_adj.adjacencias:
-            for v, peso in self.lista_adj.adjacencias[u]:
-                transposto[v].append((u, peso))
-        visited = [False] * self.num_vertices
-        scc_list = []
-        def dfs_transpose(v, component):
-            visited[v] = True
-            component.append(v)
-            for w, _ in transposto[v]:
-                if not visited[w]:
-                    dfs_transpose(w, component)
-        while stack:
-            v = stack.pop()
-            if not visited[v]:
-                component = []
-                dfs_transpose(v, component)
-                scc_list.append(component)
-        return scc_list
+        # Nome mantido por compatibilidade; usa o Tarjan iterativo acima.
+        num_componentes, componente = self.componentes_fortemente_conexas()
+        scc_list = [[] for _ in range(num_componentes)]
+        for v, c in enumerate(componente):
+            scc_list[c].append(v)
+        return tuple(tuple(scc) for scc in scc_list)
 
+    @memoizar_por_versao
     def grafo_fortemente_conexo(self):
         if not self.dirigido:
             return self.grafo_conexo()
-        scc = self.kosaraju_scc()
-        return len(scc) == 1
+        return self.componentes_fortemente_conexas()[0] == 1
 
+    @memoizar_por_versao
     def grafo_conexo_fraco(self):
         if not self.dirigido:
             return self.grafo_conexo()
+        if self.num_vertices == 0:
+            return True
         visitados = [False] * self.num_vertices
         stack = [0]
         visitados[0] = True
         while stack:
             v = stack.pop()
-            for w, _ in self.lista_adj.adjacencias[v]:
+            for w in self.lista_adj.adjacencias[v]:
                 if not visitados[w]:
                     visitados[w] = True
                     stack.append(w)
-            for u in range(self.num_vertices):
-                if self.lista_adj.checar_adjacencia(u, v) and not visitados[u]:
+            for u in self.lista_adj.predecessores[v]:
+                if not visitados[u]:
                     visitados[u] = True
                     stack.append(u)
         return all(visitados)
 
+    @memoizar_por_versao
     def grafo_semi_fortemente_conexo(self):
+        return self.verificar_semi_fortemente_conexo()[0]
+
+    @memoizar_com_copia(_copiar_testemunha)
+    def verificar_semi_fortemente_conexo(self):
+        # Unilateral em O(V + E): a condensação precisa ter um caminho
+        # hamiltoniano, ou seja, componentes consecutivas na ordem topológica
+        # têm de estar ligadas. A testemunha traz o primeiro par que falha.
         if not self.dirigido:
-            return self.grafo_conexo()
-        for i in range(self.num_vertices):
-            visitados = [False] * self.num_vertices
-            stack = [i]
-            visitados[i] = True
-            while stack:
-                v = stack.pop()
-                for w, _ in self.lista_adj.adjacencias[v]:
-                    if not visitados[w]:
-                        visitados[w] = True
-                        stack.append(w)
-                for u in range(self.num_vertices):
-                    if self.lista_adj.checar_adjacencia(u, v) and not visitados[u]:
-                        visitados[u] = True
-                        stack.append(u)
-            if not all(visitados):
-                return False
-        return True
+            return self.grafo_conexo(), None
+        condensacao = self.condensacao()
+        for c in range(condensacao.num_componentes - 1):
+            if c + 1 not in condensacao.sucessores(c):
+                return False, (tuple(condensacao.vertices(c)), tuple(condensacao.vertices(c + 1)))
+        return True, None
 
     def fleury(self):
+        # Mantido por compatibilidade; o circuito agora vem do Hierholzer.
         if not self.grafo_euleriano():
             print("O grafo não é Euleriano.")
             return []
-        grafo_copia = Grafo(self.num_vertices, self.dirigido, self.nome)
-        grafo_copia.lista_adj.adjacencias = {v: list(self.lista_adj.adjacencias[v]) for v in self.lista_adj.adjacencias}
-        grafo_copia.matriz_adj.adj_matrix = [row.copy() for row in self.matriz_adj.adj_matrix]
-        grafo_copia.matriz_inc.inc_matrix = [row.copy() for row in self.matriz_inc.inc_matrix]
-        grafo_copia.edge_list = list(self.edge_list)
-        grafo_copia.vertex_labels = dict(self.vertex_labels)
-        caminho = []
-        atual = 0
-        while grafo_copia.contar_vertices_arestas()[1] > 0:
-            if not grafo_copia.lista_adj.adjacencias[atual]:
+        return list(self.caminho_euleriano())
+
+    def caminho_euleriano(self, inicio=None):
+        # Devolve um gerador das arestas (u, v) do circuito ou caminho euleriano,
+        # em O(V + E), sem copiar o grafo.
+        extremos = self._extremos_eulerianos(inicio)
+        if extremos is None:
+            raise ValueError("O grafo não possui caminho ou circuito euleriano.")
+        return self._hierholzer(extremos[1])
+
+    def _extremos_eulerianos(self, inicio=None):
+        n = self.num_vertices
+        adjacencias = self.lista_adj.adjacencias
+        grau_saida = self.lista_adj.grau_saida
+        grau_entrada = self.lista_adj.grau_entrada
+        if not self.edge_list:
+            inicio = inicio if inicio is not None else 0
+            return inicio, inicio
+        if self.dirigido:
+            inicios = []
+            fins = []
+            for v in range(n):
+                sobra = grau_saida[v] - grau_entrada[v]
+                if sobra == 1:
+                    inicios.append(v)
+                elif sobra == -1:
+                    fins.append(v)
+                elif sobra != 0:
+                    return None
+        else:
+            # Um laço soma 2 ao grau, mas aparece uma vez só no dict de vizinhos.
+            impares = [v for v in range(n) if (grau_saida[v] + (v in adjacencias[v])) % 2 == 1]
+            inicios = impares[:1]
+            fins = impares[1:]
+            if inicio in impares:
+                inicios, fins = [inicio], [w for w in impares if w != inicio]
+        if len(inicios) != len(fins) or len(inicios) > 1:
+            return None
+        if inicios:
+            if inicio is not None and inicio != inicios[0]:
+                return None
+            inicio, fim = inicios[0], fins[0]
+        else:
+            if inicio is None:
+                inicio = next(v for v in range(n) if grau_saida[v] > 0)
+            elif grau_saida[inicio] + grau_entrada[inicio] == 0:
+                return None
+            fim = inicio
+        if not self._arestas_em_um_componente(inicio):
+            return None
+        return inicio, fim
+
+    def _arestas_em_um_componente(self, raiz):
+        adjacencias = self.lista_adj.adjacencias
+        predecessores = self.lista_adj.predecessores
+        visitados = bytearray(self.num_vertices)
+        visitados[raiz] = 1
+        stack = [raiz]
+        while stack:
+            v = stack.pop()
+            for w in adjacencias[v]:
+                if not visitados[w]:
+                    visitados[w] = 1
+                    stack.append(w)
+            if self.dirigido:
+                for w in predecessores[v]:
+                    if not visitados[w]:
+                        visitados[w] = 1
+                        stack.append(w)
+        grau_saida = self.lista_adj.grau_saida
+        grau_entrada = self.lista_adj.grau_entrada
+        return all(visitados[v] or grau_saida[v] + grau_entrada[v] == 0 for v in range(self.num_vertices))
+
+    def _hierholzer(self, fim):
+        # A busca parte do fim e segue os predecessores (no caso não dirigido,
+        # os próprios vizinhos); assim os vértices desempilhados já saem na
+        # ordem do caminho. Cada vértice guarda um iterador como cursor.
+        if not self.edge_list:
+            return
+        predecessores = self.lista_adj.predecessores
+        buscar = self.arestas.buscar
+        usadas = None if self.dirigido else bytearray(self.arestas.total_ids)
+        cursores = [None] * self.num_vertices
+        stack = [fim]
+        anterior = None
+        while stack:
+            x = stack[-1]
+            cursor = cursores[x]
+            if cursor is None:
+                cursor = cursores[x] = iter(predecessores[x])
+            for w in cursor:
+                if usadas is not None:
+                    k = buscar(w, x)
+                    if usadas[k]:
+                        continue
+                    usadas[k] = 1
+                stack.append(w)
                 break
-            for vizinho, _ in list(grafo_copia.lista_adj.adjacencias[atual]):
-                grafo_copia.remover_aresta(atual, vizinho)
-                if not grafo_copia.grafo_conexo():
-                    grafo_copia.adicionar_aresta(atual, vizinho)
-                else:
-                    caminho.append((atual, vizinho))
-                    atual = vizinho
-                    break
-        return caminho
+            else:
+                stack.pop()
+                if anterior is not None:
+                    yield (anterior, x)
+                anterior = x
 
+    @memoizar_por_versao
     def grafo_euleriano(self):
-        if not self.grafo_conexo():
-            return False
-        graus = [len(self.lista_adj.adjacencias[v]) for v in self.lista_adj.adjacencias]
-        return all(g % 2 == 0 for g in graus)
+        extremos = self._extremos_eulerianos()
+        return extremos is not None and extremos[0] == extremos[1]
+
+    @memoizar_por_versao
+    def posicoes_layout(self, iteracoes=50, semente=0):
+        # Layout por forças compartilhado pelos exportadores; exportações
+        # repetidas da mesma versão do grafo reutilizam as posições.
+        return tuple(LayoutForcas.calcular(self, iteracoes, semente=semente))
+
+    def exportar_para_gexf(self, nome_arquivo="grafo.gexf", comprimir=None, layout=None):
+        GEXFExporter.exportar(self, nome_arquivo, comprimir, layout=layout)
 
-    def exportar_para_gexf(self, nome_arquivo="grafo.gexf"):
-        GEXFExporter.exportar(self, nome_arquivo)
+    def exportar_para_ppm(self, nome_arquivo="grafo.ppm", saida=None, passo=1, max_quadros=None, processos=None,
+                          layout=None):
+        PPMExporter.exportar(self, nome_arquivo, saida, passo, max_quadros, processos, layout)
 
-    def exportar_para_ppm(self, nome_arquivo="grafo.ppm"):
-        PPMExporter.exportar(self, nome_arquivo)
+    def exportar_animacao_gif(self, nome_arquivo="grafo.gif", atraso=10, passo=1, max_quadros=None, processos=None,
+                              layout=None):
+        if not os.path.exists("dados"):
+            os.makedirs("dados")
+        with SaidaGIF(os.path.join("dados", nome_arquivo), atraso) as saida:
+            PPMExporter.exportar(self, nome_arquivo.rsplit(".", 1)[0] + ".ppm", saida, passo, max_quadros,
+                                 processos, layout)
 
-    def exportar_para_txt(self, nome_arquivo="grafo.txt"):
-        TXTExporter.exportar(self, nome_arquivo)
+    def exportar_para_txt(self, nome_arquivo="grafo.txt", esparso=None):
+        TXTExporter.exportar(self, nome_arquivo, esparso)
+
+    def salvar_binario(self, nome_arquivo="grafo.bin"):
+        FormatoBinario.salvar(self, nome_arquivo)
+
+    @classmethod
+    def carregar_binario(cls, caminho, materializar=True):
+        # Sem materializar devolve o GrafoCSR somente-leitura sobre o mmap, que
+        # já responde às análises de conectividade, SCC e pontes (veja o fim
+        # deste arquivo); materializar monta um Grafo completo, mutável e com
+        # exportadores, e fecha o arquivo.
+        visao = FormatoBinario.abrir(caminho)
+        if not materializar:
+            return visao
+        with visao:
+            arestas = visao.colunas_arestas()
+            if visao.pesos.format == 'd':
+                arestas = zip(*(c.tolist() for c in arestas))
+                arestas = ((u, v, int(p) if p.is_integer() else p) for u, v, p in arestas)
+            grafo = cls.from_edges(visao.num_vertices, arestas, visao.dirigido, visao.nome)
+            del arestas
+            for v in range(visao.num_vertices):
+                if visao.rotulos_vertices[v] >= 0:
+                    grafo.vertex_labels[v] = visao.rotulo_vertice(v)
+            for u, v, rotulo in visao.rotulos_definidos():
+                grafo.arestas.aresta(grafo.arestas.buscar(u, v))['label'] = rotulo
+        return grafo
 
     def exibir_lista_adjacencia(self):
         print("Lista de Adjacência:")
         for vertice, adj in self.lista_adj.adjacencias.items():
             vertice_exibicao = vertice + 1
-            adj_exibicao = [(v + 1, peso) for v, peso in adj]
+            adj_exibicao = [(v + 1, peso) for v, peso in adj.items()]
             print(f"{vertice_exibicao}: {adj_exibicao}")
 
     def exibir_matriz_adjacencia(self):
@@ -334,3 +658,14 @@ class Grafo:
         self.exibir_matriz_adjacencia()
         print()
         self.exibir_matriz_incidencia()
+
+
+# As análises estruturais só leem lista_adj, num_vertices, dirigido e o cache,
+# então o GrafoCSR reaproveita as mesmas implementações sem copiar nada.
+for _nome in ("analisar_estrutura", "_vizinhos_subjacentes", "_desempilhar_ate",
+              "identificar_pontes_tarjan", "identificar_articulacoes", "grafo_conexo",
+              "componentes_fortemente_conexas", "condensacao", "kosaraju_scc",
+              "grafo_fortemente_conexo", "grafo_conexo_fraco", "grafo_semi_fortemente_conexo",
+              "verificar_semi_fortemente_conexo"):
+    setattr(GrafoCSR, _nome, vars(Grafo)[_nome])
+del _nome
@@ -0,0 +1,44 @@
+from array import array
+
+class Condensacao:
+    # DAG das componentes fortemente conexas em formato CSR. Os ids das
+    # componentes já seguem uma ordem topológica: toda aresta vai de c para d > c.
+    # Fica no cache do grafo, então os vetores são expostos só para leitura.
+    def __init__(self, num_componentes, componente, adjacencias):
+        self.num_componentes = num_componentes
+        self.componente = tuple(componente)
+        contagem = [0] * (num_componentes + 1)
+        for c in componente:
+            contagem[c + 1] += 1
+        for c in range(num_componentes):
+            contagem[c + 1] += contagem[c]
+        self.offsets_vertices = array('q', contagem)
+        proximo = contagem[:num_componentes]
+        self.vertices_ordenados = array('q', bytes(8 * len(componente)))
+        for v, c in enumerate(componente):
+            self.vertices_ordenados[proximo[c]] = v
+            proximo[c] += 1
+        offsets = array('q', [0])
+        destinos = array('q')
+        marca = [-1] * num_componentes
+        for c in range(num_componentes):
+            for i in range(self.offsets_vertices[c], self.offsets_vertices[c + 1]):
+                for w in adjacencias[self.vertices_ordenados[i]]:
+                    d = componente[w]
+                    if d != c and marca[d] != c:
+                        marca[d] = c
+                        destinos.append(d)
+            offsets.append(len(destinos))
+        self.offsets_vertices = memoryview(self.offsets_vertices).toreadonly()
+        self.vertices_ordenados = memoryview(self.vertices_ordenados).toreadonly()
+        self.offsets = memoryview(offsets).toreadonly()
+        self.destinos = memoryview(destinos).toreadonly()
+
+    def vertices(self, c):
+        return self.vertices_ordenados[self.offsets_vertices[c]:self.offsets_vertices[c + 1]].tolist()
+
+    def sucessores(self, c):
+        return array('q', self.destinos[self.offsets[c]:self.offsets[c + 1]])
+
+    def componentes(self):
+        return [self.vertices(c) for c in range(self.num_componentes)]
@@ -0,0 +1,32 @@
+class EstruturaGrafo:
+    # Resultado de Grafo.analisar_estrutura(): tudo o que sai da mesma DFS de
+    # low-link sobre o grafo subjacente não dirigido. Fica no cache do grafo,
+    # por isso guarda apenas tuplas.
+    def __init__(self, num_componentes, pontes, articulacoes, blocos, componentes_2_aresta):
+        self.num_componentes = num_componentes
+        self.pontes = tuple(pontes)
+        self.articulacoes = tuple(articulacoes)
+        self.blocos = tuple(tuple(bloco) for bloco in blocos)
+        self.componentes_2_aresta = tuple(tuple(componente) for componente in componentes_2_aresta)
+        self.arvore_blocos = tuple(self._montar_arvore_blocos())
+
+    def _montar_arvore_blocos(self):
+        # Árvore bloco-corte como lista de arestas (bloco, articulação), com os
+        # blocos numerados pela posição em self.blocos.
+        eh_articulacao = set(self.articulacoes)
+        arestas = []
+        for b, bloco in enumerate(self.blocos):
+            vertices = set()
+            for u, v in bloco:
+                vertices.add(u)
+                vertices.add(v)
+            for v in sorted(vertices & eh_articulacao):
+                arestas.append((b, v))
+        return arestas
+
+    def vertices_bloco(self, b):
+        vertices = set()
+        for u, v in self.blocos[b]:
+            vertices.add(u)
+            vertices.add(v)
+        return sorted(vertices)
@@ -0,0 +1,152 @@
+from array import array
+from utils.cache_resultados import CacheResultados
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class _VizinhosCSR:
+    # Faz as vezes de ListaAdjacencia.adjacencias/predecessores: vizinhos[v]
+    # é uma fatia (sem cópia) do vetor de destinos.
+    def __init__(self, offsets, destinos):
+        self.offsets = offsets
+        self.destinos = destinos
+
+    def __getitem__(self, v):
+        return self.destinos[self.offsets[v]:self.offsets[v + 1]]
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+
+class _ListaCSR:
+    # O mínimo da ListaAdjacencia que as análises do Grafo usam. Os
+    # predecessores (só em dirigidos) não estão no arquivo: o CSR reverso é
+    # montado na primeira vez que alguma análise pede.
+    def __init__(self, grafo):
+        self._grafo = grafo
+        self.adjacencias = _VizinhosCSR(grafo.offsets, grafo.destinos)
+        self._predecessores = None
+
+    @property
+    def predecessores(self):
+        if not self._grafo.dirigido:
+            return self.adjacencias
+        if self._predecessores is None:
+            grafo = self._grafo
+            n = grafo.num_vertices
+            offsets = array('q', [0]) * (n + 1)
+            for v in grafo.destinos:
+                offsets[v + 1] += 1
+            for v in range(n):
+                offsets[v + 1] += offsets[v]
+            proximo = array('q', offsets)
+            origens = array('q', [0]) * len(grafo.destinos)
+            for u in range(n):
+                for i in range(grafo.offsets[u], grafo.offsets[u + 1]):
+                    v = grafo.destinos[i]
+                    origens[proximo[v]] = u
+                    proximo[v] += 1
+            self._predecessores = _VizinhosCSR(offsets, origens)
+        return self._predecessores
+
+
+class GrafoCSR:
+    # Visão somente-leitura de um grafo salvo em formato binário. Os vetores
+    # são memoryviews sobre o mmap do arquivo: nada é copiado ao abrir e
+    # processos que abrem o mesmo arquivo compartilham as páginas.
+    # Em grafos não dirigidos cada aresta aparece nas duas listas, como na
+    # ListaAdjacencia. As análises estruturais do Grafo (conectividade, SCC,
+    # pontes e articulações) rodam direto sobre a visão; veja grafo.py.
+    def __init__(self, nome, dirigido, num_vertices, offsets, destinos, pesos, rotulos_arestas,
+                 rotulos_vertices, offsets_rotulos, tabela_rotulos, mapa=None):
+        self.nome = nome
+        self.dirigido = dirigido
+        self.num_vertices = num_vertices
+        self.offsets = offsets
+        self.destinos = destinos
+        self.pesos = pesos
+        self.rotulos_arestas = rotulos_arestas
+        self.rotulos_vertices = rotulos_vertices
+        self.offsets_rotulos = offsets_rotulos
+        self.tabela_rotulos = tabela_rotulos
+        self._mapa = mapa
+        # A visão nunca muda, então o cache vale para sempre.
+        self.versao = 0
+        self.cache = CacheResultados()
+        self.lista_adj = _ListaCSR(self)
+
+    @property
+    def num_entradas(self):
+        return len(self.destinos)
+
+    def grau(self, v):
+        return self.offsets[v + 1] - self.offsets[v]
+
+    def vizinhos(self, v):
+        return self.destinos[self.offsets[v]:self.offsets[v + 1]]
+
+    def pesos_vizinhos(self, v):
+        return self.pesos[self.offsets[v]:self.offsets[v + 1]]
+
+    def rotulo(self, indice):
+        if indice < 0:
+            return None
+        return bytes(self.tabela_rotulos[self.offsets_rotulos[indice]:self.offsets_rotulos[indice + 1]]).decode("utf-8")
+
+    def rotulo_vertice(self, v):
+        rotulo = self.rotulo(self.rotulos_vertices[v])
+        return rotulo if rotulo is not None else f"V{v + 1}"
+
+    def colunas_arestas(self):
+        # Colunas (origens, destinos, pesos) com cada aresta uma única vez,
+        # prontas para Grafo.from_edges.
+        if np is not None:
+            offsets = np.frombuffer(self.offsets, dtype=np.int64)
+            destinos = np.frombuffer(self.destinos, dtype=np.int64)
+            pesos = np.frombuffer(self.pesos, dtype=np.float64 if self.pesos.format == 'd' else np.int64)
+            origens = np.repeat(np.arange(self.num_vertices, dtype=np.int64), np.diff(offsets))
+            if not self.dirigido:
+                mascara = origens <= destinos
+                origens, destinos, pesos = origens[mascara], destinos[mascara], pesos[mascara]
+            return origens, destinos, pesos
+        origens = array('q')
+        destinos = array('q')
+        pesos = array(self.pesos.format)
+        for u in range(self.num_vertices):
+            for i in range(self.offsets[u], self.offsets[u + 1]):
+                v = self.destinos[i]
+                if self.dirigido or u <= v:
+                    origens.append(u)
+                    destinos.append(v)
+                    pesos.append(self.pesos[i])
+        return origens, destinos, pesos
+
+    def rotulos_definidos(self):
+        # (u, v, rótulo) das arestas rotuladas, uma vez por aresta.
+        for u in range(self.num_vertices):
+            for i in range(self.offsets[u], self.offsets[u + 1]):
+                indice = self.rotulos_arestas[i]
+                v = self.destinos[i]
+                if indice >= 0 and (self.dirigido or u <= v):
+                    yield u, v, self.rotulo(indice)
+
+    def fechar(self):
+        # As memoryviews precisam ser liberadas antes de fechar o mmap.
+        if self._mapa is None:
+            return
+        self.cache.limpar()
+        self.lista_adj = None
+        for nome in ("offsets", "destinos", "pesos", "rotulos_arestas", "rotulos_vertices",
+                     "offsets_rotulos", "tabela_rotulos"):
+            getattr(self, nome).release()
+        self._mapa.close()
+        self._mapa = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
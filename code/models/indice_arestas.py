@@ -0,0 +1,107 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class IndiceArestas:
+    def __init__(self, dirigido=False):
+        self.dirigido = dirigido
+        self.edge_list = []
+        self._posicoes = {}
+        self._ids = {}
+        self._proximo_id = 0
+
+    def chave(self, u, v):
+        if self.dirigido or u <= v:
+            return (u, v)
+        return (v, u)
+
+    @property
+    def total_ids(self):
+        return self._proximo_id
+
+    def buscar(self, u, v):
+        return self._ids.get(self.chave(u, v))
+
+    def aresta(self, aresta_id):
+        return self.edge_list[self._posicoes[aresta_id]]
+
+    def adicionar(self, u, v, peso=1, label=None):
+        chave = self.chave(u, v)
+        if chave in self._ids:
+            return self._ids[chave]
+        aresta_id = self._proximo_id
+        self._proximo_id += 1
+        self._ids[chave] = aresta_id
+        self._posicoes[aresta_id] = len(self.edge_list)
+        self.edge_list.append({'id': aresta_id, 'u': u, 'v': v, 'peso': peso, 'label': label})
+        return aresta_id
+
+    def adicionar_varias(self, origens, destinos, pesos):
+        # Insere em lote ignorando arestas repetidas; devolve as colunas das
+        # arestas efetivamente adicionadas, na ordem da primeira ocorrência.
+        # Com NumPy a deduplicação do lote é feita de uma vez com np.unique.
+        if np is not None and isinstance(origens, np.ndarray):
+            origens, destinos, pesos = self._deduplicar_numpy(origens, destinos, pesos)
+        ids = self._ids
+        posicoes = self._posicoes
+        edge_list = self.edge_list
+        dirigido = self.dirigido
+        aresta_id = self._proximo_id
+        novas_u, novas_v, novos_pesos = [], [], []
+        for u, v, peso in zip(origens, destinos, pesos):
+            chave = (u, v) if dirigido or u <= v else (v, u)
+            if chave in ids:
+                continue
+            ids[chave] = aresta_id
+            posicoes[aresta_id] = len(edge_list)
+            edge_list.append({'id': aresta_id, 'u': u, 'v': v, 'peso': peso, 'label': None})
+            novas_u.append(u)
+            novas_v.append(v)
+            novos_pesos.append(peso)
+            aresta_id += 1
+        self._proximo_id = aresta_id
+        return novas_u, novas_v, novos_pesos
+
+    def _deduplicar_numpy(self, origens, destinos, pesos):
+        if len(origens) == 0:
+            return [], [], []
+        origens = origens.astype(np.int64, copy=False)
+        destinos = np.asarray(destinos).astype(np.int64, copy=False)
+        pesos = np.asarray(pesos)
+        if self.dirigido:
+            a, b = origens, destinos
+        else:
+            a, b = np.minimum(origens, destinos), np.maximum(origens, destinos)
+        base = int(max(a.max(), b.max())) + 1
+        chaves = a.astype(np.int64) * base + b.astype(np.int64)
+        _, primeiras = np.unique(chaves, return_index=True)
+        # np.unique devolve as chaves ordenadas; reordenar os índices mantém a
+        # ordem de inserção, a mesma do caminho sem NumPy.
+        primeiras.sort()
+        return origens[primeiras].tolist(), destinos[primeiras].tolist(), pesos[primeiras].tolist()
+
+    def remover(self, u, v):
+        aresta_id = self._ids.pop(self.chave(u, v), None)
+        if aresta_id is None:
+            return None
+        # Troca com a última posição para remover em O(1); a ordem de
+        # edge_list muda, mas os ids continuam estáveis.
+        posicao = self._posicoes.pop(aresta_id)
+        ultima = self.edge_list.pop()
+        if ultima['id'] == aresta_id:
+            return ultima
+        removida = self.edge_list[posicao]
+        self.edge_list[posicao] = ultima
+        self._posicoes[ultima['id']] = posicao
+        return removida
+
+    def __contains__(self, chave):
+        return self.chave(*chave) in self._ids
+
+    def __len__(self):
+        return len(self.edge_list)
+
+    def __iter__(self):
+        return iter(self.edge_list)
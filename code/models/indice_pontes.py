@@ -0,0 +1,138 @@
+class IndicePontes:
+    # Mantém pontes e componentes 2-aresta-conexas sob inserção de arestas
+    # (algoritmo online com duas union-find sobre uma floresta geradora).
+    # Arestas dirigidas são tratadas como não dirigidas, como no oráculo naive.
+    def __init__(self, num_vertices):
+        self.num_vertices = 0
+        self.desatualizado = False
+        self._par = []
+        self._aresta_par = []
+        self._dsu_2ecc = []
+        self._dsu_cc = []
+        self._tamanho_cc = []
+        self._ultima_visita = []
+        self._iteracao_lca = 0
+        self._pontes = set()
+        for _ in range(num_vertices):
+            self.adicionar_vertice()
+
+    def adicionar_vertice(self):
+        v = self.num_vertices
+        self.num_vertices += 1
+        self._par.append(-1)
+        self._aresta_par.append(None)
+        self._dsu_2ecc.append(v)
+        self._dsu_cc.append(v)
+        self._tamanho_cc.append(1)
+        self._ultima_visita.append(0)
+
+    def _find_2ecc(self, v):
+        if v == -1:
+            return -1
+        dsu = self._dsu_2ecc
+        raiz = v
+        while dsu[raiz] != raiz:
+            raiz = dsu[raiz]
+        while dsu[v] != raiz:
+            dsu[v], v = raiz, dsu[v]
+        return raiz
+
+    def _find_cc(self, v):
+        v = self._find_2ecc(v)
+        dsu = self._dsu_cc
+        caminho = []
+        while dsu[v] != v:
+            caminho.append(v)
+            v = self._find_2ecc(dsu[v])
+        for x in caminho:
+            dsu[x] = v
+        return v
+
+    def _tornar_raiz(self, v):
+        raiz = v
+        filho = -1
+        aresta_filho = None
+        while v != -1:
+            p = self._find_2ecc(self._par[v])
+            self._par[v] = filho
+            self._aresta_par[v], aresta_filho = aresta_filho, self._aresta_par[v]
+            self._dsu_cc[v] = raiz
+            filho = v
+            v = p
+        self._tamanho_cc[raiz] = self._tamanho_cc[filho]
+
+    def _unir_caminho(self, a, b):
+        self._iteracao_lca += 1
+        iteracao = self._iteracao_lca
+        visita = self._ultima_visita
+        caminho_a = []
+        caminho_b = []
+        lca = -1
+        while lca == -1:
+            if a != -1:
+                a = self._find_2ecc(a)
+                caminho_a.append(a)
+                if visita[a] == iteracao:
+                    lca = a
+                    break
+                visita[a] = iteracao
+                a = self._par[a]
+            if b != -1:
+                b = self._find_2ecc(b)
+                caminho_b.append(b)
+                if visita[b] == iteracao:
+                    lca = b
+                    break
+                visita[b] = iteracao
+                b = self._par[b]
+        for caminho in (caminho_a, caminho_b):
+            for v in caminho:
+                self._dsu_2ecc[v] = lca
+                if v == lca:
+                    break
+                self._pontes.discard(self._aresta_par[v])
+
+    def adicionar_aresta(self, u, v):
+        a = self._find_2ecc(u)
+        b = self._find_2ecc(v)
+        if a == b:
+            return
+        ca = self._find_cc(a)
+        cb = self._find_cc(b)
+        if ca != cb:
+            if self._tamanho_cc[ca] > self._tamanho_cc[cb]:
+                a, b = b, a
+                ca, cb = cb, ca
+            self._tornar_raiz(a)
+            self._par[a] = b
+            self._dsu_cc[a] = b
+            self._aresta_par[a] = (u, v)
+            self._tamanho_cc[cb] += self._tamanho_cc[a]
+            self._pontes.add((u, v))
+        else:
+            self._unir_caminho(a, b)
+
+    def pontes(self):
+        return list(self._pontes)
+
+    def quantidade_pontes(self):
+        return len(self._pontes)
+
+    def eh_ponte(self, u, v):
+        return (u, v) in self._pontes or (v, u) in self._pontes
+
+    def componente(self, v):
+        return self._find_2ecc(v)
+
+    def componentes(self):
+        grupos = {}
+        for v in range(self.num_vertices):
+            grupos.setdefault(self._find_2ecc(v), []).append(v)
+        return list(grupos.values())
+
+    @staticmethod
+    def reconstruir(num_vertices, edge_list):
+        indice = IndicePontes(num_vertices)
+        for edge in edge_list:
+            indice.adicionar_aresta(edge['u'], edge['v'])
+        return indice
@@ -0,0 +1,73 @@
+class ListaAdjacencia:
+    def __init__(self, num_vertices, dirigido=False):
+        self.num_vertices = num_vertices
+        self.dirigido = dirigido
+        # Cada vértice mapeia vizinho -> peso; o dict preserva a ordem de inserção.
+        self.adjacencias = {i: {} for i in range(num_vertices)}
+        # Em grafos não dirigidos predecessores e sucessores coincidem, então
+        # o índice reverso e os graus de entrada apenas apontam para os diretos.
+        self.grau_saida = [0] * num_vertices
+        if dirigido:
+            self.predecessores = {i: {} for i in range(num_vertices)}
+            self.grau_entrada = [0] * num_vertices
+        else:
+            self.predecessores = self.adjacencias
+            self.grau_entrada = self.grau_saida
+
+    def adicionar_vertice(self):
+        v = self.num_vertices
+        self.num_vertices += 1
+        self.adjacencias[v] = {}
+        self.grau_saida.append(0)
+        if self.dirigido:
+            self.predecessores[v] = {}
+            self.grau_entrada.append(0)
+        return v
+
+    def adicionar_aresta(self, u, v, peso=1, label=None):
+        if v not in self.adjacencias[u]:
+            self.adjacencias[u][v] = peso
+            self.grau_saida[u] += 1
+            if self.dirigido:
+                self.predecessores[v][u] = peso
+                self.grau_entrada[v] += 1
+            elif u != v:
+                self.adjacencias[v][u] = peso
+                self.grau_saida[v] += 1
+
+    def adicionar_arestas(self, origens, destinos, pesos):
+        adjacencias = self.adjacencias
+        predecessores = self.predecessores
+        grau_saida = self.grau_saida
+        grau_entrada = self.grau_entrada
+        for u, v, peso in zip(origens, destinos, pesos):
+            adjacencias[u][v] = peso
+            grau_saida[u] += 1
+            if self.dirigido:
+                predecessores[v][u] = peso
+                grau_entrada[v] += 1
+            elif u != v:
+                adjacencias[v][u] = peso
+                grau_saida[v] += 1
+
+    def remover_aresta(self, u, v):
+        if v not in self.adjacencias[u]:
+            return
+        del self.adjacencias[u][v]
+        self.grau_saida[u] -= 1
+        if self.dirigido:
+            del self.predecessores[v][u]
+            self.grau_entrada[v] -= 1
+        elif u != v:
+            del self.adjacencias[v][u]
+            self.grau_saida[v] -= 1
+
+    def checar_adjacencia(self, u, v):
+        return v in self.adjacencias[u]
+
+    def obter_peso(self, u, v):
+        return self.adjacencias[u].get(v)
+
+    def exibir(self):
+        for vertice, adj in self.adjacencias.items():
+            print(f"{vertice}: {list(adj.items())}")
@@ -0,0 +1,30 @@
+# grafo_lib/representacoes/matriz_adjacencia.py
+
+class MatrizAdjacencia:
+    def __init__(self, num_vertices, dirigido=False):
+        self.num_vertices = num_vertices
+        self.dirigido = dirigido
+        self.adj_matrix = [[0] * num_vertices for _ in range(num_vertices)]
+        # Pares (u, v) presentes: uma aresta de peso 0 existe mesmo com 0 na célula.
+        self.presentes = set()
+
+    def adicionar_aresta(self, u, v, peso=1):
+        self.adj_matrix[u][v] = peso
+        self.presentes.add((u, v))
+        if not self.dirigido:
+            self.adj_matrix[v][u] = peso
+            self.presentes.add((v, u))
+
+    def remover_aresta(self, u, v):
+        self.adj_matrix[u][v] = 0
+        self.presentes.discard((u, v))
+        if not self.dirigido:
+            self.adj_matrix[v][u] = 0
+            self.presentes.discard((v, u))
+
+    def checar_adjacencia(self, u, v):
+        return (u, v) in self.presentes
+
+    def exibir(self):
+        for row in self.adj_matrix:
+            print(row)
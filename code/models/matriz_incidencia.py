@@ -0,0 +1,58 @@
+# grafo_lib/representacoes/matriz_incidencia.py
+
+from models.indice_arestas import IndiceArestas
+
+class MatrizIncidencia:
+    def __init__(self, num_vertices, dirigido=False, indice=None):
+        self.num_vertices = num_vertices
+        self.dirigido = dirigido
+        # Armazenamento esparso: cada aresta guarda seus extremos e cada
+        # vértice guarda apenas as entradas não nulas da sua linha. O índice
+        # (u, v) -> id pode ser compartilhado com o Grafo.
+        self.arestas = {}
+        self.incidencias = {i: {} for i in range(num_vertices)}
+        self._indice_proprio = indice is None
+        self.indice = IndiceArestas(dirigido) if indice is None else indice
+
+    def adicionar_aresta(self, u, v, peso=1, label=None, aresta_id=None):
+        if aresta_id is None:
+            aresta_id = self.indice.adicionar(u, v, peso, label)
+            if aresta_id in self.arestas:
+                return aresta_id
+        self.arestas[aresta_id] = (u, v, peso, label)
+        self.incidencias[u][aresta_id] = 1
+        if not self.dirigido:
+            self.incidencias[v][aresta_id] = 1
+        else:
+            self.incidencias[v][aresta_id] = -1
+        return aresta_id
+
+    def remover_aresta(self, u, v):
+        aresta_id = self.indice.buscar(u, v)
+        if aresta_id in self.arestas:
+            self.remover_aresta_id(aresta_id)
+        if self._indice_proprio:
+            self.indice.remover(u, v)
+
+    def remover_aresta_id(self, aresta_id):
+        u, v, _, _ = self.arestas.pop(aresta_id)
+        self.incidencias[u].pop(aresta_id, None)
+        self.incidencias[v].pop(aresta_id, None)
+
+    def checar_adjacencia(self, u, v):
+        return self.indice.buscar(u, v) in self.arestas
+
+    @property
+    def inc_matrix(self):
+        colunas = {aresta_id: j for j, aresta_id in enumerate(self.arestas)}
+        matriz = [[0] * len(colunas) for _ in range(self.num_vertices)]
+        for v, incidentes in self.incidencias.items():
+            linha = matriz[v]
+            for aresta_id, valor in incidentes.items():
+                linha[colunas[aresta_id]] = valor
+        return matriz
+
+    def exibir(self):
+        print("Matriz de Incidência:")
+        for row in self.inc_matrix:
+            print(row)
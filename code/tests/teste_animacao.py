@@ -0,0 +1,135 @@
+import os
+import random
+import struct
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.animacao import PALETA_PADRAO, SaidaGIF, _comprimir_lzw
+from utils.canvas import Canvas
+
+
+def _descomprimir_lzw(dados, tamanho_minimo):
+    # Decodificador de referência, estrito: qualquer código inválido ou a
+    # falta do código de fim é erro.
+    limpar = 1 << tamanho_minimo
+    fim = limpar + 1
+    acumulador = int.from_bytes(dados, "little")
+    total_bits = len(dados) * 8
+    posicao = 0
+    tamanho = tamanho_minimo + 1
+    tabela = {}
+    proximo = fim + 1
+    anterior = None
+    saida = []
+    while posicao + tamanho <= total_bits:
+        codigo = (acumulador >> posicao) & ((1 << tamanho) - 1)
+        posicao += tamanho
+        if codigo == limpar:
+            tabela = {i: [i] for i in range(limpar)}
+            proximo = fim + 1
+            tamanho = tamanho_minimo + 1
+            anterior = None
+            continue
+        if codigo == fim:
+            return saida
+        if codigo in tabela:
+            entrada = tabela[codigo]
+        elif codigo == proximo and anterior is not None:
+            entrada = anterior + anterior[:1]
+        else:
+            raise ValueError(f"Código LZW inválido: {codigo}.")
+        saida += entrada
+        if anterior is not None and proximo < 4096:
+            tabela[proximo] = anterior + entrada[:1]
+            proximo += 1
+            if proximo == (1 << tamanho) and tamanho < 12:
+                tamanho += 1
+        anterior = entrada
+    raise ValueError("Fluxo LZW sem código de fim.")
+
+
+def _decodificar_gif(caminho):
+    # Reconstrói cada quadro sobre uma tela persistente (disposição 1).
+    with open(caminho, "rb") as arquivo:
+        dados = arquivo.read()
+    assert dados[:6] == b"GIF89a"
+    largura, altura, flags, _, _ = struct.unpack("<HHBBB", dados[6:13])
+    posicao = 13
+    cores = 2 << (flags & 7)
+    paleta = [bytes(dados[posicao + 3 * i:posicao + 3 * i + 3]) for i in range(cores)]
+    posicao += 3 * cores
+    tela = [b"\x00\x00\x00"] * (largura * altura)
+    quadros = []
+    while True:
+        bloco = dados[posicao]
+        posicao += 1
+        if bloco == 0x3b:
+            return largura, altura, quadros
+        if bloco == 0x21:
+            posicao += 1
+            while dados[posicao]:
+                posicao += dados[posicao] + 1
+            posicao += 1
+            continue
+        x, y, w, h, _ = struct.unpack("<HHHHB", dados[posicao:posicao + 9])
+        posicao += 9
+        tamanho_minimo = dados[posicao]
+        posicao += 1
+        comprimido = bytearray()
+        while dados[posicao]:
+            comprimido += dados[posicao + 1:posicao + 1 + dados[posicao]]
+            posicao += dados[posicao] + 1
+        posicao += 1
+        indices = _descomprimir_lzw(bytes(comprimido), tamanho_minimo)
+        assert len(indices) == w * h
+        for j in range(h):
+            for i in range(w):
+                tela[(y + j) * largura + x + i] = paleta[indices[j * w + i]]
+        quadros.append(b"".join(tela))
+
+
+class TesteLZW(unittest.TestCase):
+    def test_ida_e_volta_aleatoria(self):
+        rng = random.Random(17)
+        for _ in range(1500):
+            tamanho_minimo = rng.choice([2, 3, 4, 8])
+            cores = rng.randint(1, 1 << tamanho_minimo)
+            indices = [rng.randrange(cores) for _ in range(rng.randint(1, 3000))]
+            if rng.random() < 0.3:
+                indices.sort()
+            comprimido = _comprimir_lzw(bytes(indices), tamanho_minimo)
+            self.assertEqual(_descomprimir_lzw(comprimido, tamanho_minimo), indices)
+
+    def test_tabela_cheia(self):
+        # Força vários códigos de limpeza com a tabela de 12 bits cheia.
+        rng = random.Random(170)
+        indices = bytes(rng.randrange(256) for _ in range(60000))
+        self.assertEqual(_descomprimir_lzw(_comprimir_lzw(indices, 8), 8), list(indices))
+
+
+class TesteSaidaGIF(unittest.TestCase):
+    def test_quadros_reconstruidos(self):
+        rng = random.Random(1017)
+        largura, altura = 23, 17
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, "animacao.gif")
+            esperados = []
+            canvas = Canvas(largura, altura)
+            with SaidaGIF(caminho) as saida:
+                for _ in range(12):
+                    # Alguns quadros repetem o anterior (retângulo vazio).
+                    for _ in range(rng.choice([0, 1, 5])):
+                        canvas.pixel(rng.randrange(largura), rng.randrange(altura), rng.choice(PALETA_PADRAO))
+                    saida.adicionar_quadro(canvas)
+                    esperados.append(bytes(canvas.pixels))
+            self.assertEqual(saida.quadros, 12)
+            obtida_largura, obtida_altura, quadros = _decodificar_gif(caminho)
+        self.assertEqual((obtida_largura, obtida_altura), (largura, altura))
+        self.assertEqual(quadros, esperados)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grafo import Grafo
+
+
+def _alcancaveis(grafo):
+    # Fecho transitivo ingênuo: uma busca a partir de cada vértice.
+    alcance = []
+    for raiz in range(grafo.num_vertices):
+        visitados = {raiz}
+        stack = [raiz]
+        while stack:
+            v = stack.pop()
+            for w in grafo.lista_adj.adjacencias[v]:
+                if w not in visitados:
+                    visitados.add(w)
+                    stack.append(w)
+        alcance.append(visitados)
+    return alcance
+
+
+def _grafo_aleatorio(rng, n, arestas):
+    grafo = Grafo(n, dirigido=True)
+    for _ in range(arestas):
+        grafo.adicionar_aresta(rng.randrange(n), rng.randrange(n))
+    return grafo
+
+
+class TesteComponentesFortes(unittest.TestCase):
+    def test_aleatorio_contra_alcance(self):
+        rng = random.Random(10)
+        for _ in range(300):
+            n = rng.randint(1, 12)
+            grafo = _grafo_aleatorio(rng, n, rng.randint(0, 3 * n))
+            alcance = _alcancaveis(grafo)
+            num_componentes, componente = grafo.componentes_fortemente_conexas()
+            self.assertEqual(sorted(set(componente)), list(range(num_componentes)))
+            for a in range(n):
+                for b in range(n):
+                    mesma = b in alcance[a] and a in alcance[b]
+                    self.assertEqual(componente[a] == componente[b], mesma)
+            self.assertEqual(grafo.grafo_fortemente_conexo(), num_componentes == 1)
+            self.assertEqual(sorted(map(sorted, grafo.kosaraju_scc())),
+                             sorted(sorted(v for v in range(n) if componente[v] == c)
+                                    for c in range(num_componentes)))
+
+    def test_condensacao(self):
+        rng = random.Random(100)
+        for _ in range(200):
+            n = rng.randint(1, 12)
+            grafo = _grafo_aleatorio(rng, n, rng.randint(0, 3 * n))
+            condensacao = grafo.condensacao()
+            componente = condensacao.componente
+            esperado = {(componente[edge['u']], componente[edge['v']]) for edge in grafo.edge_list
+                        if componente[edge['u']] != componente[edge['v']]}
+            obtido = set()
+            for c in range(condensacao.num_componentes):
+                for v in condensacao.vertices(c):
+                    self.assertEqual(componente[v], c)
+                sucessores = condensacao.sucessores(c).tolist()
+                self.assertEqual(len(sucessores), len(set(sucessores)))
+                for d in sucessores:
+                    # Os ids seguem a ordem topológica.
+                    self.assertGreater(d, c)
+                    obtido.add((c, d))
+            self.assertEqual(obtido, esperado)
+            self.assertEqual(sum(len(vs) for vs in condensacao.componentes()), n)
+
+    def test_tipos_publicos(self):
+        grafo = Grafo.from_edges(4, [(0, 1), (1, 0), (2, 3)], dirigido=True)
+        scc = grafo.kosaraju_scc()
+        self.assertIsInstance(scc, list)
+        self.assertTrue(all(isinstance(c, list) for c in scc))
+        scc[0].append(99)
+        self.assertNotIn(99, grafo.kosaraju_scc()[0])
+        num_componentes, componente = grafo.componentes_fortemente_conexas()
+        self.assertIsInstance(componente, list)
+
+    def test_cadeia_longa_sem_recursao(self):
+        n = 20000
+        grafo = Grafo.from_edges(n, [(v, v + 1) for v in range(n - 1)], dirigido=True)
+        self.assertEqual(grafo.componentes_fortemente_conexas()[0], n)
+        grafo.adicionar_aresta(n - 1, 0)
+        self.assertTrue(grafo.grafo_fortemente_conexo())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import os
+import sys
+import unittest
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grafo import Grafo
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+ESPERADO = [(0, 1, 1), (1, 2, 1), (2, 3, 1)]
+ESPERADO_PESOS = [(0, 1, 5), (1, 2, 6), (2, 3, 7)]
+
+
+def _arestas(grafo):
+    return [(edge['u'], edge['v'], edge['peso']) for edge in grafo.edge_list]
+
+
+class TesteFormatosEntrada(unittest.TestCase):
+    # Um caso para cada formato aceito por Grafo.adicionar_arestas.
+    def test_lista_de_pares(self):
+        self.assertEqual(_arestas(Grafo.from_edges(4, [(0, 1), (1, 2), (2, 3)])), ESPERADO)
+
+    def test_lista_de_trios(self):
+        self.assertEqual(_arestas(Grafo.from_edges(4, [(0, 1, 5), (1, 2, 6), (2, 3, 7)])), ESPERADO_PESOS)
+
+    def test_gerador_de_linhas(self):
+        self.assertEqual(_arestas(Grafo.from_edges(4, ((i, i + 1) for i in range(3)))), ESPERADO)
+
+    def test_colunas_em_listas(self):
+        self.assertEqual(_arestas(Grafo.from_edges(4, ([0, 1, 2], [1, 2, 3]))), ESPERADO)
+        self.assertEqual(_arestas(Grafo.from_edges(4, ([0, 1, 2], [1, 2, 3], [5, 6, 7]))), ESPERADO_PESOS)
+
+    def test_colunas_em_array(self):
+        colunas = (array('q', [0, 1, 2]), array('q', [1, 2, 3]), array('q', [5, 6, 7]))
+        self.assertEqual(_arestas(Grafo.from_edges(4, colunas)), ESPERADO_PESOS)
+
+    def test_colunas_de_tamanhos_diferentes(self):
+        with self.assertRaises(ValueError):
+            Grafo.from_edges(4, ([0, 1, 2], [1, 2]))
+
+    @unittest.skipIf(np is None, "NumPy não está instalado")
+    def test_numpy_linhas(self):
+        grafo = Grafo.from_edges(3, np.array([[0, 1, 0.5], [1, 2, 1.5]]))
+        self.assertEqual(_arestas(grafo), [(0, 1, 0.5), (1, 2, 1.5)])
+        self.assertTrue(all(type(edge['u']) is int for edge in grafo.edge_list))
+
+    @unittest.skipIf(np is None, "NumPy não está instalado")
+    def test_numpy_colunas(self):
+        colunas = (np.array([0, 1, 2]), np.array([1, 2, 3]), np.array([5, 6, 7]))
+        self.assertEqual(_arestas(Grafo.from_edges(4, colunas)), ESPERADO_PESOS)
+
+    def test_ordem_de_insercao_com_repetidas(self):
+        linhas = [(2, 3), (0, 1), (3, 2), (1, 2), (0, 1)]
+        esperado = [(2, 3, 1), (0, 1, 1), (1, 2, 1)]
+        self.assertEqual(_arestas(Grafo.from_edges(4, linhas)), esperado)
+        if np is not None:
+            self.assertEqual(_arestas(Grafo.from_edges(4, np.array(linhas))), esperado)
+
+
+class TesteVerticesInvalidos(unittest.TestCase):
+    def test_lote_invalido_nao_altera_o_grafo(self):
+        grafo = Grafo(3)
+        with self.assertRaises(ValueError):
+            grafo.adicionar_arestas([(0, 1), (1, 5)])
+        self.assertEqual(grafo.edge_list, [])
+        self.assertEqual(grafo.lista_adj.adjacencias[1], {})
+        self.assertEqual(grafo.versao, 0)
+
+    def test_aresta_invalida(self):
+        grafo = Grafo(3)
+        with self.assertRaises(ValueError):
+            grafo.adicionar_aresta(-1, 2)
+        self.assertEqual(grafo.versao, 0)
+
+
+class TesteConferenciaDebug(unittest.TestCase):
+    def test_aresta_de_peso_zero(self):
+        # No modo debug a matriz densa é conferida pela presença da aresta,
+        # não pelo valor do peso.
+        for dirigido in (False, True):
+            grafo = Grafo(3, dirigido=dirigido, debug=True)
+            grafo.adicionar_aresta(0, 1, peso=0)
+            self.assertTrue(grafo.checar_adjacencia_vertices(0, 1))
+            self.assertEqual(grafo.checar_adjacencia_vertices(1, 0), not dirigido)
+            grafo.remover_aresta(0, 1)
+            self.assertFalse(grafo.checar_adjacencia_vertices(0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,314 @@
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from array import array
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grafo import Grafo
+from utils.gerar_grafos import GeradorGrafos
+from utils.ppm_exporter import PPMExporter
+
+TAMANHOS_PADRAO = [100, 1000, 10000]
+REPETICOES_PADRAO = 5
+AQUECIMENTO_PADRAO = 1
+TOLERANCIA_PADRAO = 0.20
+SAIDA_PADRAO = os.path.join("dados", "desempenho.json")
+# Casos caros demais para rodar em qualquer tamanho.
+LIMITE_ARESTAS_NAIVE = 2000
+LIMITE_VERTICES_LAYOUT = 1000
+ITERACOES_LAYOUT = 10
+
+FAMILIAS = {
+    "cadeia_ciclos": lambda n: GeradorGrafos.gerar_cadeia_ciclos(n, num_componentes=5),
+    "ciclo": lambda n: GeradorGrafos.gerar_cadeia_ciclos(n, num_componentes=1),
+    "aleatorio": lambda n: GeradorGrafos.gerar_grafo_aleatorio(n, min(1.0, 8 / n), False, semente=1),
+    "aleatorio_dirigido": lambda n: GeradorGrafos.gerar_grafo_aleatorio(n, min(1.0, 8 / n), True, semente=1),
+    "grade": lambda n: GeradorGrafos.gerar_grade(math.isqrt(n), math.isqrt(n)),
+    "barabasi_albert": lambda n: GeradorGrafos.gerar_barabasi_albert(n, 3, semente=1),
+}
+
+
+def _sem_cache(grafo):
+    # As análises são memoizadas por versão; sem limpar o cache as repetições
+    # mediriam apenas acertos.
+    grafo.cache.limpar()
+    return grafo
+
+
+def _com_layout(grafo):
+    grafo.posicoes_layout()
+    return grafo
+
+
+def _preparar_ppm(grafo):
+    # Reinicia a numeração para que as repetições sobrescrevam os mesmos quadros.
+    grafo.frame_count = 0
+    return _com_layout(grafo)
+
+
+def _colunas(grafo):
+    origens = array('q', (edge['u'] for edge in grafo.edge_list))
+    destinos = array('q', (edge['v'] for edge in grafo.edge_list))
+    pesos = array('q', (edge['peso'] for edge in grafo.edge_list))
+    return grafo.num_vertices, (origens, destinos, pesos), grafo.dirigido
+
+
+def _construir_incremental(contexto):
+    num_vertices, (origens, destinos, pesos), dirigido = contexto
+    grafo = Grafo(num_vertices, dirigido)
+    for u, v, peso in zip(origens, destinos, pesos):
+        grafo.adicionar_aresta(u, v, peso)
+    return grafo
+
+
+def _pares_consulta(grafo):
+    rng = random.Random(1)
+    pares = [(edge['u'], edge['v']) for edge in rng.sample(grafo.edge_list, min(5000, len(grafo.edge_list)))]
+    pares += [(rng.randrange(grafo.num_vertices), rng.randrange(grafo.num_vertices)) for _ in range(5000)]
+    return grafo, pares
+
+
+def _consultar_adjacencias(contexto):
+    grafo, pares = contexto
+    for u, v in pares:
+        grafo.checar_adjacencia_vertices(u, v)
+
+
+def _preparar_remocao(grafo):
+    num_vertices, colunas, dirigido = _colunas(grafo)
+    copia = Grafo.from_edges(num_vertices, colunas, dirigido)
+    rng = random.Random(1)
+    removidas = [(edge['u'], edge['v']) for edge in rng.sample(copia.edge_list, len(copia.edge_list) // 10)]
+    return copia, removidas
+
+
+def _remover_arestas(contexto):
+    grafo, removidas = contexto
+    for u, v in removidas:
+        grafo.remover_aresta(u, v)
+
+
+def _preparar_indice_pontes(grafo):
+    grafo.indice_pontes = None
+    return grafo
+
+
+def _indice_pontes(grafo):
+    grafo.habilitar_indice_pontes()
+    return grafo.pontes_atuais()
+
+
+def _sempre(grafo):
+    return True
+
+
+# nome -> (preparar, executar, aplicável). 'preparar' roda fora da medição e
+# devolve o argumento de 'executar'.
+CASOS = {
+    "construcao_em_lote": (_colunas, lambda c: Grafo.from_edges(*c), _sempre),
+    "construcao_incremental": (_colunas, _construir_incremental, _sempre),
+    "consulta_adjacencia": (_pares_consulta, _consultar_adjacencias, lambda g: len(g.edge_list) > 0),
+    "remocao_arestas": (_preparar_remocao, _remover_arestas, _sempre),
+    "grafo_conexo": (_sem_cache, lambda g: g.grafo_conexo(), _sempre),
+    "grafo_conexo_fraco": (_sem_cache, lambda g: g.grafo_conexo_fraco(), _sempre),
+    "grafo_fortemente_conexo": (_sem_cache, lambda g: g.grafo_fortemente_conexo(), _sempre),
+    "grafo_semi_fortemente_conexo": (_sem_cache, lambda g: g.grafo_semi_fortemente_conexo(), _sempre),
+    "componentes_fortemente_conexas": (_sem_cache, lambda g: g.componentes_fortemente_conexas(), _sempre),
+    "condensacao": (_sem_cache, lambda g: g.condensacao(), _sempre),
+    "pontes_naive": (_sem_cache, lambda g: g.identificar_pontes_naive(),
+                     lambda g: len(g.edge_list) <= LIMITE_ARESTAS_NAIVE),
+    "pontes_tarjan": (_sem_cache, lambda g: g.identificar_pontes_tarjan(), _sempre),
+    "articulacoes": (_sem_cache, lambda g: g.identificar_articulacoes(), _sempre),
+    "indice_pontes": (_preparar_indice_pontes, _indice_pontes, _sempre),
+    "euleriano": (_sem_cache, lambda g: g.grafo_euleriano(), _sempre),
+    "fleury": (_sem_cache, lambda g: g.fleury(), lambda g: g.grafo_euleriano()),
+    "layout": (_sem_cache, lambda g: g.posicoes_layout(ITERACOES_LAYOUT), lambda g: g.num_vertices <= LIMITE_VERTICES_LAYOUT),
+    "exportar_gexf": (_com_layout, lambda g: g.exportar_para_gexf("desempenho.gexf"),
+                      lambda g: g.num_vertices <= LIMITE_VERTICES_LAYOUT),
+    "exportar_ppm": (_preparar_ppm, lambda g: PPMExporter.exportar(g, "desempenho.ppm", max_quadros=10),
+                     lambda g: g.num_vertices <= LIMITE_VERTICES_LAYOUT),
+    "exportar_txt": (lambda g: g, lambda g: g.exportar_para_txt("desempenho.txt"), _sempre),
+    "salvar_binario": (lambda g: g, lambda g: g.salvar_binario("desempenho.bin"), _sempre),
+}
+
+
+def _medir(preparar, executar, grafo, repeticoes, aquecimento, medir_memoria):
+    for _ in range(aquecimento):
+        executar(preparar(grafo))
+    tempos = []
+    for _ in range(repeticoes):
+        contexto = preparar(grafo)
+        gc_ativo = gc.isenabled()
+        gc.disable()
+        try:
+            inicio = time.perf_counter_ns()
+            executar(contexto)
+            tempos.append(time.perf_counter_ns() - inicio)
+        finally:
+            # Um caso que falha não pode deixar o coletor desligado no processo.
+            if gc_ativo:
+                gc.enable()
+    pico = None
+    if medir_memoria:
+        # Execução separada: o tracemalloc distorce o tempo medido.
+        contexto = preparar(grafo)
+        tracemalloc.start()
+        try:
+            executar(contexto)
+            pico = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return {
+        "repeticoes": repeticoes,
+        "min_ns": min(tempos),
+        "mediana_ns": int(statistics.median(tempos)),
+        "media_ns": int(statistics.fmean(tempos)),
+        "max_ns": max(tempos),
+        "pico_memoria_bytes": pico,
+    }
+
+
+def executar_benchmarks(familias=None, tamanhos=None, casos=None, repeticoes=REPETICOES_PADRAO,
+                        aquecimento=AQUECIMENTO_PADRAO, medir_memoria=True, exibir=True):
+    familias = familias or list(FAMILIAS)
+    tamanhos = tamanhos or TAMANHOS_PADRAO
+    casos = casos or list(CASOS)
+    resultados = []
+    # Os exportadores imprimem uma linha por arquivo; durante a medição a
+    # saída padrão é descartada.
+    stdout = sys.stdout
+    for familia in familias:
+        for tamanho in tamanhos:
+            grafo = FAMILIAS[familia](tamanho)
+            for caso in casos:
+                preparar, executar, aplicavel = CASOS[caso]
+                registro = {
+                    "familia": familia,
+                    "tamanho": tamanho,
+                    "vertices": grafo.num_vertices,
+                    "arestas": len(grafo.edge_list),
+                    "caso": caso,
+                }
+                if not aplicavel(grafo):
+                    registro["ignorado"] = True
+                else:
+                    with open(os.devnull, "w") as nulo:
+                        sys.stdout = nulo
+                        try:
+                            registro.update(_medir(preparar, executar, grafo, repeticoes, aquecimento, medir_memoria))
+                        finally:
+                            sys.stdout = stdout
+                resultados.append(registro)
+                if exibir:
+                    _exibir_registro(registro)
+    return {
+        "metadados": {
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "processador": platform.processor(),
+            "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeticoes": repeticoes,
+            "aquecimento": aquecimento,
+        },
+        "resultados": resultados,
+    }
+
+
+def _exibir_registro(registro, comparacao=None):
+    prefixo = f"{registro['familia']:<20} {registro['tamanho']:>7} {registro['caso']:<30}"
+    if registro.get("ignorado"):
+        print(f"{prefixo} {'ignorado':>12}")
+        return
+    linha = f"{prefixo} {registro['mediana_ns'] / 1e6:>9.3f} ms"
+    if registro["pico_memoria_bytes"] is not None:
+        linha += f" {registro['pico_memoria_bytes'] / 1e6:>9.2f} MB"
+    if comparacao is not None:
+        linha += f"  x{comparacao['razao']:.2f}"
+        if comparacao["regressao"]:
+            linha += "  REGRESSÃO"
+    print(linha)
+
+
+def comparar_com_base(relatorio, base, tolerancia=TOLERANCIA_PADRAO):
+    # Compara as medianas caso a caso; razões acima de 1 + tolerância são
+    # marcadas como regressão.
+    medianas = {(r["familia"], r["tamanho"], r["caso"]): r["mediana_ns"]
+                for r in base["resultados"] if not r.get("ignorado")}
+    comparacoes = []
+    for registro in relatorio["resultados"]:
+        chave = (registro["familia"], registro["tamanho"], registro["caso"])
+        if registro.get("ignorado") or chave not in medianas or not medianas[chave]:
+            continue
+        razao = registro["mediana_ns"] / medianas[chave]
+        comparacoes.append({
+            "familia": chave[0],
+            "tamanho": chave[1],
+            "caso": chave[2],
+            "base_ns": medianas[chave],
+            "atual_ns": registro["mediana_ns"],
+            "razao": razao,
+            "regressao": razao > 1 + tolerancia,
+        })
+    return comparacoes
+
+
+def salvar_relatorio(relatorio, caminho=SAIDA_PADRAO):
+    diretorio = os.path.dirname(caminho)
+    if diretorio and not os.path.exists(diretorio):
+        os.makedirs(diretorio)
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump(relatorio, f, indent=2, ensure_ascii=False)
+
+
+def teste_desempenho(tamanhos=None, familias=None, casos=None, repeticoes=REPETICOES_PADRAO,
+                     aquecimento=AQUECIMENTO_PADRAO, saida=SAIDA_PADRAO, base=None, tolerancia=TOLERANCIA_PADRAO,
+                     medir_memoria=True):
+    # Ponto de entrada usado pelo Menu e pela linha de comando.
+    relatorio = executar_benchmarks(familias, tamanhos, casos, repeticoes, aquecimento, medir_memoria,
+                                    exibir=base is None)
+    if base is not None:
+        with open(base, encoding="utf-8") as f:
+            comparacoes = comparar_com_base(relatorio, json.load(f), tolerancia)
+        relatorio["comparacao"] = {"base": base, "tolerancia": tolerancia, "casos": comparacoes}
+        por_chave = {(c["familia"], c["tamanho"], c["caso"]): c for c in comparacoes}
+        for registro in relatorio["resultados"]:
+            _exibir_registro(registro, por_chave.get((registro["familia"], registro["tamanho"], registro["caso"])))
+        regressoes = [c for c in comparacoes if c["regressao"]]
+        print(f"\n{len(regressoes)} regressão(ões) acima de {tolerancia:.0%} em {len(comparacoes)} casos comparados.")
+    if saida:
+        salvar_relatorio(relatorio, saida)
+        print(f"Resultados salvos em {saida}")
+    return relatorio
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks da biblioteca de grafos.")
+    parser.add_argument("--familias", nargs="+", choices=list(FAMILIAS), help="famílias de grafos (padrão: todas)")
+    parser.add_argument("--tamanhos", nargs="+", type=int, help=f"números de vértices (padrão: {TAMANHOS_PADRAO})")
+    parser.add_argument("--casos", nargs="+", choices=list(CASOS), help="operações medidas (padrão: todas)")
+    parser.add_argument("--repeticoes", type=int, default=REPETICOES_PADRAO)
+    parser.add_argument("--aquecimento", type=int, default=AQUECIMENTO_PADRAO)
+    parser.add_argument("--saida", default=SAIDA_PADRAO, help="arquivo JSON de resultados")
+    parser.add_argument("--base", help="JSON de uma execução anterior para comparação")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA_PADRAO,
+                        help="aumento relativo da mediana tolerado antes de acusar regressão")
+    parser.add_argument("--sem-memoria", action="store_true", help="não mede o pico de memória")
+    args = parser.parse_args(argv)
+    relatorio = teste_desempenho(args.tamanhos, args.familias, args.casos, args.repeticoes, args.aquecimento,
+                                 args.saida, args.base, args.tolerancia, not args.sem_memoria)
+    comparacoes = relatorio.get("comparacao", {}).get("casos", [])
+    return 1 if any(c["regressao"] for c in comparacoes) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
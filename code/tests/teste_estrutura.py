@@ -0,0 +1,121 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grafo import Grafo
+
+
+def _subjacente(grafo):
+    # Multigrafo não dirigido subjacente, sem laços: u->v e v->u contam como
+    # duas arestas paralelas.
+    return [(edge['u'], edge['v']) for edge in grafo.edge_list if edge['u'] != edge['v']]
+
+
+def _componentes(vertices, arestas):
+    vizinhos = {v: [] for v in vertices}
+    for u, v in arestas:
+        vizinhos[u].append(v)
+        vizinhos[v].append(u)
+    grupos = []
+    vistos = set()
+    for raiz in vertices:
+        if raiz in vistos:
+            continue
+        vistos.add(raiz)
+        grupo = [raiz]
+        stack = [raiz]
+        while stack:
+            v = stack.pop()
+            for w in vizinhos[v]:
+                if w not in vistos:
+                    vistos.add(w)
+                    grupo.append(w)
+                    stack.append(w)
+        grupos.append(sorted(grupo))
+    return sorted(grupos)
+
+
+def _pontes_ingenuas(n, arestas):
+    total = len(_componentes(range(n), arestas))
+    return sorted((min(u, v), max(u, v)) for i, (u, v) in enumerate(arestas)
+                  if len(_componentes(range(n), arestas[:i] + arestas[i + 1:])) > total)
+
+
+def _articulacoes_ingenuas(n, arestas):
+    total = len(_componentes(range(n), arestas))
+    articulacoes = []
+    for v in range(n):
+        restantes = [w for w in range(n) if w != v]
+        sem_v = [(a, b) for a, b in arestas if v not in (a, b)]
+        isolado = all(v not in aresta for aresta in arestas)
+        if len(_componentes(restantes, sem_v)) > total - isolado:
+            articulacoes.append(v)
+    return articulacoes
+
+
+def _normalizar(arestas):
+    return sorted((min(u, v), max(u, v)) for u, v in arestas)
+
+
+class TesteAnalisarEstrutura(unittest.TestCase):
+    def _conferir(self, grafo):
+        n = grafo.num_vertices
+        arestas = _subjacente(grafo)
+        estrutura = grafo.analisar_estrutura()
+        pontes = _pontes_ingenuas(n, arestas)
+        articulacoes = _articulacoes_ingenuas(n, arestas)
+        self.assertEqual(estrutura.num_componentes, len(_componentes(range(n), arestas)))
+        self.assertEqual(_normalizar(estrutura.pontes), pontes)
+        self.assertEqual(sorted(estrutura.articulacoes), articulacoes)
+        self.assertEqual(_normalizar(grafo.identificar_pontes_tarjan()), pontes)
+        self.assertEqual(sorted(grafo.identificar_articulacoes()), articulacoes)
+        # 2-aresta-conexas: componentes do grafo sem as pontes.
+        sem_pontes = [a for a in arestas if (min(a), max(a)) not in set(pontes)]
+        self.assertEqual(sorted(sorted(c) for c in estrutura.componentes_2_aresta),
+                         _componentes(range(n), sem_pontes))
+        # Os blocos particionam as arestas, cada um é biconexo e dois blocos só
+        # se tocam numa articulação.
+        self.assertEqual(sorted(_normalizar(a for bloco in estrutura.blocos for a in bloco)), _normalizar(arestas))
+        vertices_blocos = [set(estrutura.vertices_bloco(b)) for b in range(len(estrutura.blocos))]
+        for b, bloco in enumerate(estrutura.blocos):
+            vertices = sorted(vertices_blocos[b])
+            indice = {v: i for i, v in enumerate(vertices)}
+            locais = [(indice[u], indice[v]) for u, v in bloco]
+            self.assertEqual(len(_componentes(range(len(vertices)), locais)), 1)
+            if len(vertices) > 2:
+                self.assertEqual(_articulacoes_ingenuas(len(vertices), locais), [])
+            for c in range(b):
+                comum = vertices_blocos[b] & vertices_blocos[c]
+                self.assertLessEqual(len(comum), 1)
+                self.assertTrue(comum <= set(articulacoes))
+        esperado = sorted((b, v) for b in range(len(estrutura.blocos)) for v in vertices_blocos[b]
+                          if v in set(articulacoes))
+        self.assertEqual(sorted(estrutura.arvore_blocos), esperado)
+
+    def test_aleatorio(self):
+        rng = random.Random(14)
+        for _ in range(250):
+            n = rng.randint(1, 10)
+            grafo = Grafo(n, dirigido=rng.random() < 0.4)
+            for _ in range(rng.randint(0, 2 * n)):
+                grafo.adicionar_aresta(rng.randrange(n), rng.randrange(n))
+            self._conferir(grafo)
+
+    def test_dirigido_ida_e_volta_nao_e_ponte(self):
+        grafo = Grafo.from_edges(3, [(0, 1), (1, 0), (1, 2)], dirigido=True)
+        self.assertEqual(_normalizar(grafo.identificar_pontes_tarjan()), [(1, 2)])
+        self._conferir(grafo)
+
+    def test_caminho_longo_sem_recursao(self):
+        n = 20000
+        grafo = Grafo.from_edges(n, [(v, v + 1) for v in range(n - 1)])
+        estrutura = grafo.analisar_estrutura()
+        self.assertEqual(len(estrutura.pontes), n - 1)
+        self.assertEqual(len(estrutura.articulacoes), n - 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grafo import Grafo
+
+
+def _arestas(grafo):
+    return [(edge['u'], edge['v']) for edge in grafo.edge_list]
+
+
+def _possui_trilha(grafo, inicio=None, circuito=False):
+    # Busca exaustiva por uma trilha que use cada aresta uma vez; só serve
+    # para grafos pequenos.
+    arestas = _arestas(grafo)
+    usadas = [False] * len(arestas)
+
+    def estender(v, restantes, origem):
+        if restantes == 0:
+            return not circuito or v == origem
+        for i, (a, b) in enumerate(arestas):
+            if usadas[i]:
+                continue
+            if a == v:
+                proximo = b
+            elif b == v and not grafo.dirigido:
+                proximo = a
+            else:
+                continue
+            usadas[i] = True
+            achou = estender(proximo, restantes - 1, origem)
+            usadas[i] = False
+            if achou:
+                return True
+        return False
+
+    inicios = [inicio] if inicio is not None else range(grafo.num_vertices)
+    return any(estender(v, len(arestas), v) for v in inicios)
+
+
+class TesteCaminhoEuleriano(unittest.TestCase):
+    def _conferir_trilha(self, grafo, trilha, inicio=None):
+        self.assertEqual(len(trilha), len(grafo.edge_list))
+        if inicio is not None and trilha:
+            self.assertEqual(trilha[0][0], inicio)
+        for (_, v), (u, _) in zip(trilha, trilha[1:]):
+            self.assertEqual(v, u)
+        if grafo.dirigido:
+            self.assertEqual(sorted(trilha), sorted(_arestas(grafo)))
+        else:
+            normalizar = lambda pares: sorted((min(u, v), max(u, v)) for u, v in pares)
+            self.assertEqual(normalizar(trilha), normalizar(_arestas(grafo)))
+
+    def _grafo_aleatorio(self, rng):
+        n = rng.randint(1, 6)
+        grafo = Grafo(n, dirigido=rng.random() < 0.5)
+        for _ in range(rng.randint(1, 8)):
+            grafo.adicionar_aresta(rng.randrange(n), rng.randrange(n))
+        return grafo
+
+    def test_aleatorio_contra_busca_exaustiva(self):
+        rng = random.Random(9)
+        for _ in range(400):
+            grafo = self._grafo_aleatorio(rng)
+            try:
+                trilha = list(grafo.caminho_euleriano())
+            except ValueError:
+                self.assertFalse(_possui_trilha(grafo))
+                continue
+            self._conferir_trilha(grafo, trilha)
+            self.assertEqual(grafo.grafo_euleriano(), _possui_trilha(grafo, circuito=True))
+
+    def test_inicio_escolhido(self):
+        rng = random.Random(90)
+        for _ in range(200):
+            grafo = self._grafo_aleatorio(rng)
+            inicio = rng.randrange(grafo.num_vertices)
+            try:
+                trilha = list(grafo.caminho_euleriano(inicio))
+            except ValueError:
+                self.assertFalse(_possui_trilha(grafo, inicio))
+                continue
+            self._conferir_trilha(grafo, trilha, inicio)
+
+    def test_fleury_compativel(self):
+        grafo = Grafo.from_edges(4, [(0, 1), (1, 2), (2, 3), (3, 0)])
+        circuito = grafo.fleury()
+        self.assertIsInstance(circuito, list)
+        self._conferir_trilha(grafo, circuito)
+        self.assertEqual(circuito[0][0], circuito[-1][1])
+
+    def test_caminho_longo_sem_recursao(self):
+        n = 20000
+        grafo = Grafo.from_edges(n, [(v, (v + 1) % n) for v in range(n)], dirigido=True)
+        self._conferir_trilha(grafo, list(grafo.caminho_euleriano()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import models.grafo_csr
+from grafo import Grafo
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _grafo_exemplo(dirigido):
+    grafo = Grafo.from_edges(6, [(0, 1, 2), (1, 2, 0.5), (2, 0, 3), (2, 3, 1), (4, 5, 7)], dirigido, "exemplo")
+    grafo.vertex_labels[3] = "centro"
+    grafo.arestas.aresta(grafo.arestas.buscar(2, 3))['label'] = "ponte"
+    grafo.arestas.aresta(grafo.arestas.buscar(4, 5))['label'] = "ponte"
+    return grafo
+
+
+def _arestas(grafo):
+    # O CSR guarda as arestas por origem, e as não dirigidas como u <= v.
+    arestas = set()
+    for edge in grafo.edge_list:
+        u, v = edge['u'], edge['v']
+        if not grafo.dirigido and u > v:
+            u, v = v, u
+        arestas.add((u, v, edge['peso'], edge['label']))
+    return arestas
+
+
+def _sem_ordem(pares):
+    return sorted(tuple(sorted(par)) for par in pares)
+
+
+class TesteFormatoBinario(unittest.TestCase):
+    def setUp(self):
+        # FormatoBinario.salvar grava em dados/ relativo ao diretório atual.
+        self._pasta = tempfile.TemporaryDirectory()
+        self._anterior = os.getcwd()
+        os.chdir(self._pasta.name)
+
+    def tearDown(self):
+        os.chdir(self._anterior)
+        self._pasta.cleanup()
+
+    def _salvar(self, grafo):
+        grafo.salvar_binario("grafo.bin")
+        return os.path.join("dados", "grafo.bin")
+
+    def _ida_e_volta(self, dirigido):
+        original = _grafo_exemplo(dirigido)
+        copia = Grafo.carregar_binario(self._salvar(original))
+        self.assertEqual(copia.nome, "exemplo")
+        self.assertEqual(copia.dirigido, dirigido)
+        self.assertEqual(_arestas(copia), _arestas(original))
+        self.assertEqual(copia.vertex_labels, original.vertex_labels)
+
+    def test_ida_e_volta(self):
+        for dirigido in (False, True):
+            self._ida_e_volta(dirigido)
+
+    def test_ida_e_volta_sem_numpy(self):
+        # Força o laço em Python de GrafoCSR.colunas_arestas.
+        anterior = models.grafo_csr.np
+        models.grafo_csr.np = None
+        try:
+            for dirigido in (False, True):
+                self._ida_e_volta(dirigido)
+        finally:
+            models.grafo_csr.np = anterior
+
+    @unittest.skipIf(np is None, "NumPy não está instalado")
+    def test_colunas_com_e_sem_numpy(self):
+        for dirigido in (False, True):
+            with Grafo.carregar_binario(self._salvar(_grafo_exemplo(dirigido)), materializar=False) as visao:
+                com_numpy = [coluna.tolist() for coluna in visao.colunas_arestas()]
+                anterior = models.grafo_csr.np
+                models.grafo_csr.np = None
+                try:
+                    sem_numpy = [coluna.tolist() for coluna in visao.colunas_arestas()]
+                finally:
+                    models.grafo_csr.np = anterior
+                self.assertEqual(com_numpy, sem_numpy)
+                del com_numpy
+
+    def test_visao(self):
+        original = _grafo_exemplo(False)
+        with Grafo.carregar_binario(self._salvar(original), materializar=False) as visao:
+            self.assertEqual(visao.num_vertices, 6)
+            self.assertEqual(visao.num_entradas, 10)
+            self.assertEqual(list(visao.vizinhos(2)), [1, 0, 3])
+            self.assertEqual(list(visao.pesos_vizinhos(1)), [2, 0.5])
+            self.assertEqual(visao.rotulo_vertice(3), "centro")
+            self.assertEqual(visao.rotulo_vertice(0), "V1")
+            self.assertEqual(list(visao.rotulos_definidos()), [(2, 3, "ponte"), (4, 5, "ponte")])
+
+    def test_analises_na_visao(self):
+        for dirigido in (False, True):
+            original = _grafo_exemplo(dirigido)
+            with Grafo.carregar_binario(self._salvar(original), materializar=False) as visao:
+                for metodo in ("grafo_conexo", "grafo_fortemente_conexo", "grafo_conexo_fraco",
+                               "grafo_semi_fortemente_conexo", "verificar_semi_fortemente_conexo",
+                               "componentes_fortemente_conexas", "kosaraju_scc"):
+                    self.assertEqual(getattr(visao, metodo)(), getattr(original, metodo)(), metodo)
+                self.assertEqual(_sem_ordem(visao.identificar_pontes_tarjan()),
+                                 _sem_ordem(original.identificar_pontes_tarjan()))
+                self.assertEqual(sorted(visao.identificar_articulacoes()),
+                                 sorted(original.identificar_articulacoes()))
+                self.assertEqual(visao.condensacao().num_componentes, original.condensacao().num_componentes)
+                self.assertEqual(visao.analisar_estrutura().num_componentes, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
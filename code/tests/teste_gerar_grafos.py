@@ -0,0 +1,44 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.gerar_grafos import GeradorGrafos
+
+
+class TesteGrafoAleatorio(unittest.TestCase):
+    def _media_arestas(self, n, p, dirigido, amostras=30):
+        total = 0
+        for semente in range(amostras):
+            total += len(GeradorGrafos.gerar_grafo_aleatorio(n, p, dirigido, semente=semente).edge_list)
+        return total / amostras
+
+    def test_dirigido_sorteia_pares_ordenados(self):
+        n, p = 100, 0.1
+        self.assertAlmostEqual(self._media_arestas(n, p, True), p * n * (n - 1), delta=0.05 * p * n * (n - 1))
+
+    def test_nao_dirigido_sorteia_pares(self):
+        n, p = 100, 0.1
+        esperado = p * n * (n - 1) / 2
+        self.assertAlmostEqual(self._media_arestas(n, p, False), esperado, delta=0.05 * esperado)
+
+    def test_dirigido_permite_as_duas_orientacoes(self):
+        grafo = GeradorGrafos.gerar_grafo_aleatorio(60, 0.5, True, semente=1)
+        arestas = {(edge['u'], edge['v']) for edge in grafo.edge_list}
+        self.assertTrue(any((v, u) in arestas for u, v in arestas))
+        self.assertTrue(all(u != v for u, v in arestas))
+
+    def test_completo_dirigido(self):
+        grafo = GeradorGrafos.gerar_grafo_aleatorio(6, 1, True)
+        self.assertEqual(len(grafo.edge_list), 30)
+        self.assertTrue(grafo.grafo_completo())
+
+    def test_mesma_semente_mesmo_grafo(self):
+        a = GeradorGrafos.gerar_grafo_aleatorio(50, 0.2, True, semente=7)
+        b = GeradorGrafos.gerar_grafo_aleatorio(50, 0.2, True, semente=7)
+        self.assertEqual(a.edge_list, b.edge_list)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import gzip
+import os
+import random
+import sys
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grafo import Grafo
+from utils.gexf_exporter import GEXFExporter
+from utils.gexf_importer import GEXFImporter
+
+
+def _ler_ingenuo(caminho):
+    # Referência: carrega a árvore XML inteira de uma vez.
+    with open(caminho, "rb") as arquivo:
+        dados = arquivo.read()
+    if dados[:2] == b"\x1f\x8b":
+        dados = gzip.decompress(dados)
+    raiz = ET.fromstring(dados)
+    nome = lambda elem: elem.tag.rsplit("}", 1)[-1]
+    grafo = next(elem for elem in raiz.iter() if nome(elem) == "graph")
+    nos = [elem for elem in raiz.iter() if nome(elem) == "node"]
+    arestas = [elem for elem in raiz.iter() if nome(elem) == "edge"]
+    indices = {}
+    for elem in nos:
+        indices.setdefault(elem.get("id"), len(indices))
+    for elem in arestas:
+        indices.setdefault(elem.get("source"), len(indices))
+        indices.setdefault(elem.get("target"), len(indices))
+    labels = {v: f"V{v + 1}" for v in range(len(indices))}
+    labels.update((indices[elem.get("id")], elem.get("label")) for elem in nos if elem.get("label") is not None)
+    lista = [(indices[elem.get("source")], indices[elem.get("target")], float(elem.get("weight", 1)),
+              elem.get("label") or None) for elem in arestas]
+    return grafo.get("defaultedgetype") == "directed", len(indices), labels, lista
+
+
+def _resumo(grafo):
+    arestas = [(edge['u'], edge['v'], float(edge['peso']), edge['label'] or None) for edge in grafo.edge_list]
+    return grafo.dirigido, grafo.num_vertices, dict(grafo.vertex_labels), arestas
+
+
+def _grafo_aleatorio(rng, dirigido):
+    n = rng.randint(1, 15)
+    grafo = Grafo(n, dirigido=dirigido)
+    textos = ["a", "São Paulo", 'aspas "duplas"', "<tag> & 'simples'", "ação"]
+    for _ in range(rng.randint(0, 2 * n)):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if grafo.arestas.buscar(u, v) is None:
+            grafo.adicionar_aresta(u, v, rng.choice([1, 3, 0.25, 2.5]), rng.choice([None, rng.choice(textos)]))
+    for v in range(n):
+        if rng.random() < 0.3:
+            grafo.vertex_labels[v] = rng.choice(textos)
+    return grafo
+
+
+class TesteGEXF(unittest.TestCase):
+    def setUp(self):
+        # O exportador grava em dados/ relativo ao diretório atual.
+        self._pasta = tempfile.TemporaryDirectory()
+        self._anterior = os.getcwd()
+        os.chdir(self._pasta.name)
+
+    def tearDown(self):
+        os.chdir(self._anterior)
+        self._pasta.cleanup()
+
+    def test_ida_e_volta_contra_leitura_ingenua(self):
+        rng = random.Random(20)
+        for caso in range(60):
+            grafo = _grafo_aleatorio(rng, dirigido=caso % 2 == 1)
+            for nome_arquivo, tamanho_buffer in (("grafo.gexf", 64), ("grafo.gexf.gz", 1 << 20)):
+                GEXFExporter.exportar(grafo, nome_arquivo, tamanho_buffer=tamanho_buffer, layout=caso % 3 == 0)
+                caminho = os.path.join("dados", nome_arquivo)
+                importado = GEXFImporter.importar(caminho)
+                self.assertEqual(_resumo(importado), _ler_ingenuo(caminho))
+                self.assertEqual(_resumo(importado), _resumo(grafo))
+                self.assertEqual([type(edge['peso']) for edge in importado.edge_list],
+                                 [type(edge['peso']) for edge in grafo.edge_list])
+
+    def test_comprimir_explicito(self):
+        grafo = Grafo.from_edges(3, [(0, 1), (1, 2)])
+        GEXFExporter.exportar(grafo, "sem_extensao.gexf", comprimir=True)
+        caminho = os.path.join("dados", "sem_extensao.gexf")
+        with open(caminho, "rb") as arquivo:
+            self.assertEqual(arquivo.read(2), b"\x1f\x8b")
+        self.assertEqual(_resumo(GEXFImporter.importar(caminho)), _resumo(grafo))
+
+    def test_ids_arbitrarios_e_filhos(self):
+        # Ids que não são 0..n-1, nós com filhos e uma aresta para um nó não
+        # declarado.
+        caminho = "externo.gexf"
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            arquivo.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                          '<gexf xmlns="http://www.gexf.net/1.2draft" version="1.2">\n'
+                          '  <graph defaultedgetype="directed">\n'
+                          '    <attributes class="node"><attribute id="0" title="x" type="string"/></attributes>\n'
+                          '    <nodes>\n'
+                          '      <node id="n7" label="Sete"><attvalues><attvalue for="0" value="a"/></attvalues></node>\n'
+                          '      <node id="n2" label="Dois"/>\n'
+                          '    </nodes>\n'
+                          '    <edges>\n'
+                          '      <edge id="e0" source="n2" target="n7" weight="1.5" label="x"/>\n'
+                          '      <edge id="e1" source="n7" target="n9"/>\n'
+                          '    </edges>\n'
+                          '  </graph>\n'
+                          '</gexf>\n')
+        grafo = GEXFImporter.importar(caminho)
+        self.assertEqual(_resumo(grafo), _ler_ingenuo(caminho))
+        self.assertEqual(_resumo(grafo), (True, 3, {0: "Sete", 1: "Dois", 2: "V3"},
+                                          [(1, 0, 1.5, "x"), (0, 2, 1.0, None)]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.importador_texto import ImportadorTexto
+
+
+class TesteLinhasVazias(unittest.TestCase):
+    # Linhas só com espaços e arquivos CRLF com linhas vazias não podem
+    # passar pelo caminho rápido de _linhas_de_dados como se fossem dados.
+    def _importar(self, conteudo):
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, "arestas.txt")
+            with open(caminho, "wb") as arquivo:
+                arquivo.write(conteudo)
+            grafo = ImportadorTexto.importar_lista_arestas(caminho)
+        return grafo.num_vertices, [(edge['u'], edge['v']) for edge in grafo.edge_list]
+
+    def test_linha_so_com_espacos(self):
+        self.assertEqual(self._importar(b"1 2\n   \n2 3\n"), (3, [(0, 1), (1, 2)]))
+
+    def test_crlf_com_linhas_vazias(self):
+        self.assertEqual(self._importar(b"1 2\r\n\r\n2 3\r\n"), (3, [(0, 1), (1, 2)]))
+
+
+if __name__ == "__main__":
+    unittest.main()
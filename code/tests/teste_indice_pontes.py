@@ -0,0 +1,86 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grafo import Grafo
+
+
+def _normalizar(pontes):
+    return sorted((min(u, v), max(u, v)) for u, v in pontes)
+
+
+def _componentes_sem_pontes(grafo, pontes):
+    # 2-aresta-conexas ingênuas: componentes do grafo subjacente sem as pontes.
+    pontes = set(_normalizar(pontes))
+    vizinhos = [set() for _ in range(grafo.num_vertices)]
+    for edge in grafo.edge_list:
+        u, v = edge['u'], edge['v']
+        if (min(u, v), max(u, v)) not in pontes:
+            vizinhos[u].add(v)
+            vizinhos[v].add(u)
+    componente = [-1] * grafo.num_vertices
+    grupos = []
+    for raiz in range(grafo.num_vertices):
+        if componente[raiz] != -1:
+            continue
+        componente[raiz] = len(grupos)
+        grupo = [raiz]
+        stack = [raiz]
+        while stack:
+            v = stack.pop()
+            for w in vizinhos[v]:
+                if componente[w] == -1:
+                    componente[w] = len(grupos)
+                    grupo.append(w)
+                    stack.append(w)
+        grupos.append(sorted(grupo))
+    return sorted(grupos)
+
+
+class TesteIndicePontes(unittest.TestCase):
+    # O índice online precisa concordar com o oráculo naive depois de cada
+    # inserção, remoção (que força a reconstrução) e novo vértice.
+    def _conferir(self, grafo):
+        pontes = grafo.identificar_pontes_naive(processos=1)
+        self.assertEqual(_normalizar(grafo.pontes_atuais()), _normalizar(pontes))
+        self.assertEqual(sorted(sorted(c) for c in grafo.componentes_2_aresta_conexas()),
+                         _componentes_sem_pontes(grafo, pontes))
+
+    def test_aleatorio(self):
+        rng = random.Random(8)
+        for _ in range(40):
+            n = rng.randint(2, 25)
+            grafo = Grafo(n, dirigido=rng.random() < 0.3)
+            grafo.habilitar_indice_pontes()
+            for _ in range(rng.randint(1, 60)):
+                sorteio = rng.random()
+                if sorteio < 0.15 and grafo.edge_list:
+                    edge = rng.choice(grafo.edge_list)
+                    grafo.remover_aresta(edge['u'], edge['v'])
+                elif sorteio < 0.2:
+                    grafo.adicionar_vertice()
+                else:
+                    n = grafo.num_vertices
+                    grafo.adicionar_aresta(rng.randrange(n), rng.randrange(n))
+                self._conferir(grafo)
+
+    def test_ciclo_fecha_pontes(self):
+        grafo = Grafo(4)
+        grafo.habilitar_indice_pontes()
+        for u, v in [(0, 1), (1, 2), (2, 3)]:
+            grafo.adicionar_aresta(u, v)
+        self.assertEqual(_normalizar(grafo.pontes_atuais()), [(0, 1), (1, 2), (2, 3)])
+        grafo.adicionar_aresta(3, 1)
+        self.assertEqual(_normalizar(grafo.pontes_atuais()), [(0, 1)])
+        self.assertEqual(sorted(sorted(c) for c in grafo.componentes_2_aresta_conexas()), [[0], [1, 2, 3]])
+
+    def test_indice_desabilitado(self):
+        with self.assertRaises(RuntimeError):
+            Grafo(3).pontes_atuais()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import math
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grafo import Grafo
+from utils.layout import LayoutForcas
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _iterar_ingenuo(xs, ys, origens, destinos, iteracoes):
+    # Fruchterman-Reingold com a repulsão exata, par a par, em O(n^2).
+    xs = list(xs)
+    ys = list(ys)
+    n = len(xs)
+    k = math.sqrt(1.0 / n)
+    temperatura = 0.1
+    resfriamento = temperatura / (iteracoes + 1)
+    for _ in range(iteracoes):
+        fx = [0.0] * n
+        fy = [0.0] * n
+        for v in range(n):
+            for u in range(n):
+                dx = xs[v] - xs[u]
+                dy = ys[v] - ys[u]
+                d2 = dx * dx + dy * dy
+                if d2 > 0:
+                    fx[v] += dx * k * k / d2
+                    fy[v] += dy * k * k / d2
+        for u, v in zip(origens, destinos):
+            dx = xs[u] - xs[v]
+            dy = ys[u] - ys[v]
+            f = math.sqrt(dx * dx + dy * dy) / k
+            fx[u] -= dx * f
+            fy[u] -= dy * f
+            fx[v] += dx * f
+            fy[v] += dy * f
+        for v in range(n):
+            dx = fx[v] - k * (xs[v] - 0.5)
+            dy = fy[v] - k * (ys[v] - 0.5)
+            d = math.sqrt(dx * dx + dy * dy)
+            if d > 0:
+                passo = min(d, temperatura) / d
+                xs[v] += dx * passo
+                ys[v] += dy * passo
+        temperatura -= resfriamento
+    return xs, ys
+
+
+def _entrada(semente, n, arestas):
+    rng = random.Random(semente)
+    xs = [rng.random() for _ in range(n)]
+    ys = [rng.random() for _ in range(n)]
+    origens = [rng.randrange(n) for _ in range(arestas)]
+    destinos = [(u + 1 + rng.randrange(n - 1)) % n for u in origens]
+    return xs, ys, origens, destinos
+
+
+class TesteBarnesHut(unittest.TestCase):
+    def _distancia_maxima(self, a, b):
+        return max(max(abs(p - q) for p, q in zip(a[0], b[0])), max(abs(p - q) for p, q in zip(a[1], b[1])))
+
+    def test_theta_zero_igual_ao_ingenuo(self):
+        # Com theta = 0 todo nó é aberto até as folhas e a repulsão é exata.
+        for semente in range(5):
+            xs, ys, origens, destinos = _entrada(semente, 60, 90)
+            esperado = _iterar_ingenuo(xs, ys, origens, destinos, 10)
+            obtido = LayoutForcas._iterar(list(xs), list(ys), origens, destinos, 10, 0.0)
+            self.assertLess(self._distancia_maxima(obtido, esperado), 1e-9)
+
+    def test_aproximacao_proxima_do_ingenuo(self):
+        xs, ys, origens, destinos = _entrada(19, 200, 300)
+        esperado = _iterar_ingenuo(xs, ys, origens, destinos, 1)
+        obtido = LayoutForcas._iterar(list(xs), list(ys), origens, destinos, 1, 0.5)
+        # O passo é limitado pela temperatura (0,1); o erro tem de ficar bem abaixo.
+        self.assertLess(self._distancia_maxima(obtido, esperado), 0.01)
+
+    @unittest.skipIf(np is None, "NumPy não está instalado")
+    def test_numpy_igual_ao_python(self):
+        for theta in (0.0, 0.8):
+            xs, ys, origens, destinos = _entrada(190, 150, 200)
+            python = LayoutForcas._iterar(list(xs), list(ys), origens, destinos, 10, theta)
+            vetorizado = LayoutForcas._iterar_numpy(list(xs), list(ys), origens, destinos, 10, theta)
+            self.assertLess(self._distancia_maxima(python, vetorizado), 1e-9)
+
+    def test_calcular(self):
+        grafo = Grafo.from_edges(30, [(v, (v + 1) % 30) for v in range(30)])
+        posicoes = LayoutForcas.calcular(grafo, usar_numpy=False)
+        self.assertEqual(len(posicoes), 30)
+        self.assertTrue(all(0 <= x <= 1 and 0 <= y <= 1 for x, y in posicoes))
+        self.assertEqual(posicoes, LayoutForcas.calcular(grafo, usar_numpy=False))
+        self.assertEqual(LayoutForcas.calcular(Grafo(1)), [(0.5, 0.5)])
+        self.assertEqual(LayoutForcas.calcular(Grafo(0)), [])
+
+    def test_posicoes_respeita_layout(self):
+        grafo = Grafo(3)
+        self.assertEqual(list(LayoutForcas.posicoes(grafo, layout=False)), list(LayoutForcas.grade(3)))
+        self.assertEqual(list(LayoutForcas.posicoes(grafo, layout=True)), list(grafo.posicoes_layout()))
+
+
+if __name__ == "__main__":
+    unittest.main()
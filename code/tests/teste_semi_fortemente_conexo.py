@@ -0,0 +1,76 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grafo import Grafo
+
+
+def _alcancaveis(grafo):
+    alcance = []
+    for raiz in range(grafo.num_vertices):
+        visitados = {raiz}
+        stack = [raiz]
+        while stack:
+            v = stack.pop()
+            for w in grafo.lista_adj.adjacencias[v]:
+                if w not in visitados:
+                    visitados.add(w)
+                    stack.append(w)
+        alcance.append(visitados)
+    return alcance
+
+
+def _semi_forte_ingenuo(grafo):
+    # Definição direta: para todo par, um alcança o outro.
+    alcance = _alcancaveis(grafo)
+    n = grafo.num_vertices
+    return all(b in alcance[a] or a in alcance[b] for a in range(n) for b in range(n))
+
+
+class TesteSemiFortementeConexo(unittest.TestCase):
+    def test_aleatorio_contra_pares(self):
+        rng = random.Random(11)
+        for _ in range(400):
+            n = rng.randint(1, 10)
+            grafo = Grafo(n, dirigido=True)
+            # Um caminho hamiltoniano parcial deixa os casos positivos frequentes.
+            ordem = list(range(n))
+            rng.shuffle(ordem)
+            for u, v in zip(ordem, ordem[1:]):
+                if rng.random() < 0.85:
+                    grafo.adicionar_aresta(u, v)
+            for _ in range(rng.randint(0, n)):
+                grafo.adicionar_aresta(rng.randrange(n), rng.randrange(n))
+            esperado = _semi_forte_ingenuo(grafo)
+            self.assertEqual(grafo.grafo_semi_fortemente_conexo(), esperado)
+            resultado, testemunha = grafo.verificar_semi_fortemente_conexo()
+            self.assertEqual(resultado, esperado)
+            if esperado:
+                self.assertIsNone(testemunha)
+                continue
+            # Nenhum vértice de um lado da testemunha alcança o outro lado, em
+            # nenhum dos dois sentidos.
+            alcance = _alcancaveis(grafo)
+            primeiro, segundo = testemunha
+            self.assertTrue(primeiro and segundo)
+            for a in primeiro:
+                for b in segundo:
+                    self.assertNotIn(b, alcance[a])
+                    self.assertNotIn(a, alcance[b])
+
+    def test_nao_dirigido(self):
+        self.assertEqual(Grafo.from_edges(3, [(0, 1), (1, 2)]).verificar_semi_fortemente_conexo(), (True, None))
+        self.assertEqual(Grafo.from_edges(3, [(0, 1)]).verificar_semi_fortemente_conexo(), (False, None))
+
+    def test_caminho_longo(self):
+        n = 20000
+        grafo = Grafo.from_edges(n, [(v, v + 1) for v in range(n - 1)], dirigido=True)
+        self.assertTrue(grafo.grafo_semi_fortemente_conexo())
+        self.assertFalse(grafo.grafo_fortemente_conexo())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+import struct
+import sys
+
+PALETA_PADRAO = [(255, 255, 255), (0, 0, 255), (0, 0, 0)]
+
+
+class SaidaPPMStream:
+    # Concatena os quadros como PPMs (P6) num único fluxo binário, pronto para
+    # "ffmpeg -f image2pipe -c:v ppm -i -".
+    def __init__(self, destino=None):
+        self.destino = destino if destino is not None else sys.stdout.buffer
+        self.quadros = 0
+
+    def adicionar_quadro(self, imagem):
+        self.destino.write(imagem.cabecalho_ppm())
+        self.destino.write(memoryview(imagem.pixels))
+        self.quadros += 1
+
+    def fechar(self):
+        self.destino.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+
+class SaidaGIF:
+    # Codifica um GIF animado em Python puro. Só a primeira imagem vai inteira;
+    # os quadros seguintes trazem apenas o retângulo que mudou.
+    def __init__(self, nome_arquivo, atraso=10, paleta=None, repetir=0):
+        self.nome_arquivo = nome_arquivo
+        self.atraso = atraso
+        self.paleta = list(paleta if paleta is not None else PALETA_PADRAO)
+        if len(self.paleta) > 256:
+            raise ValueError("A paleta do GIF comporta no máximo 256 cores.")
+        self.repetir = repetir
+        self.quadros = 0
+        self._bits_paleta = max(1, (len(self.paleta) - 1).bit_length())
+        self._codificador = None
+        self._anterior = None
+        self._arquivo = None
+
+    def _abrir(self, largura, altura):
+        self._arquivo = open(self.nome_arquivo, "wb")
+        self._codificador = CodificadorGIF(largura, altura, self.paleta, self._bits_paleta, self.atraso)
+        tabela = bytearray()
+        for cor in self.paleta:
+            tabela += bytes(cor)
+        tabela += bytes(3 * ((1 << self._bits_paleta) - len(self.paleta)))
+        self._arquivo.write(b"GIF89a")
+        self._arquivo.write(struct.pack("<HHBBB", largura, altura, 0x80 | 0x70 | (self._bits_paleta - 1), 0, 0))
+        self._arquivo.write(tabela)
+        self._arquivo.write(b"\x21\xff\x0bNETSCAPE2.0\x03\x01" + struct.pack("<H", self.repetir) + b"\x00")
+
+    def adicionar_quadro(self, imagem):
+        if self._arquivo is None:
+            self._abrir(imagem.largura, imagem.altura)
+        self._arquivo.write(self._codificador.codificar(imagem.pixels, self._anterior))
+        self._anterior = bytes(imagem.pixels)
+        self.quadros += 1
+
+    def codificador(self, largura, altura):
+        # Para a renderização paralela: devolve o codificador (serializável) e
+        # o último quadro gravado, para que os processos do pool codifiquem
+        # seus quadros e o principal só escreva os bytes prontos.
+        if self._arquivo is None:
+            self._abrir(largura, altura)
+        return self._codificador, self._anterior
+
+    def adicionar_codificado(self, dados, pixels=None):
+        # 'pixels' é o quadro que 'dados' representa; basta passá-lo no último
+        # quadro de uma sequência para o próximo adicionar_quadro comparar certo.
+        self._arquivo.write(dados)
+        if pixels is not None:
+            self._anterior = pixels
+        self.quadros += 1
+
+    def fechar(self):
+        if self._arquivo is not None:
+            self._arquivo.write(b"\x3b")
+            self._arquivo.close()
+            self._arquivo = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+
+class CodificadorGIF:
+    # Transforma um quadro (comparado ao anterior) nos bytes de uma imagem
+    # do GIF, sem depender do arquivo de saída.
+    def __init__(self, largura, altura, paleta, bits_paleta, atraso):
+        self.largura = largura
+        self.altura = altura
+        self.paleta = paleta
+        self.bits_paleta = bits_paleta
+        self.atraso = atraso
+        self._indices = {bytes(cor): i for i, cor in enumerate(paleta)}
+
+    def codificar(self, pixels, anterior=None):
+        if anterior is None:
+            retangulo = (0, 0, self.largura - 1, self.altura - 1)
+        else:
+            retangulo = self._retangulo_alterado(pixels, anterior)
+        return self._quadro(pixels, *retangulo)
+
+    def _retangulo_alterado(self, atual, anterior):
+        largura3 = self.largura * 3
+        linhas = [y for y in range(self.altura)
+                  if atual[y * largura3:(y + 1) * largura3] != anterior[y * largura3:(y + 1) * largura3]]
+        if not linhas:
+            # Quadro sem mudanças: um pixel basta para carregar o atraso.
+            return 0, 0, 0, 0
+        x0 = self.largura - 1
+        x1 = 0
+        for y in linhas:
+            inicio = y * largura3
+            for x in range(0, x0):
+                i = inicio + x * 3
+                if atual[i:i + 3] != anterior[i:i + 3]:
+                    x0 = x
+                    break
+            for x in range(self.largura - 1, x1, -1):
+                i = inicio + x * 3
+                if atual[i:i + 3] != anterior[i:i + 3]:
+                    x1 = x
+                    break
+        x1 = max(x0, x1)
+        return x0, linhas[0], x1, linhas[-1]
+
+    def _indice_cor(self, cor):
+        indice = self._indices.get(cor)
+        if indice is None:
+            r, g, b = cor
+            indice = min(range(len(self.paleta)), key=lambda i: (self.paleta[i][0] - r) ** 2 +
+                         (self.paleta[i][1] - g) ** 2 + (self.paleta[i][2] - b) ** 2)
+            self._indices[cor] = indice
+        return indice
+
+    def _quadro(self, pixels, x0, y0, x1, y1):
+        largura3 = self.largura * 3
+        indices = bytearray()
+        indices_cor = self._indices
+        for y in range(y0, y1 + 1):
+            linha = bytes(pixels[y * largura3 + x0 * 3:y * largura3 + (x1 + 1) * 3])
+            for i in range(0, len(linha), 3):
+                cor = linha[i:i + 3]
+                indice = indices_cor.get(cor)
+                indices.append(indice if indice is not None else self._indice_cor(cor))
+        saida = bytearray()
+        # Controle gráfico: disposição 1 mantém o quadro anterior por baixo.
+        saida += b"\x21\xf9\x04\x04" + struct.pack("<H", self.atraso) + b"\x00\x00"
+        saida += b"\x2c" + struct.pack("<HHHHB", x0, y0, x1 - x0 + 1, y1 - y0 + 1, 0)
+        tamanho_minimo = max(2, self.bits_paleta)
+        dados = _comprimir_lzw(indices, tamanho_minimo)
+        saida.append(tamanho_minimo)
+        for i in range(0, len(dados), 255):
+            bloco = dados[i:i + 255]
+            saida.append(len(bloco))
+            saida += bloco
+        saida.append(0)
+        return bytes(saida)
+
+
+def _comprimir_lzw(indices, tamanho_minimo):
+    limpar = 1 << tamanho_minimo
+    fim = limpar + 1
+    tamanho = tamanho_minimo + 1
+    proximo = fim + 1
+    codigos = {}
+    saida = bytearray()
+    acumulador = 0
+    bits = 0
+
+    acumulador |= limpar << bits
+    bits += tamanho
+    prefixo = indices[0]
+    for k in indices[1:]:
+        chave = (prefixo << 8) | k
+        codigo = codigos.get(chave)
+        if codigo is not None:
+            prefixo = codigo
+            continue
+        acumulador |= prefixo << bits
+        bits += tamanho
+        while bits >= 8:
+            saida.append(acumulador & 0xFF)
+            acumulador >>= 8
+            bits -= 8
+        if proximo < 4096:
+            codigos[chave] = proximo
+            proximo += 1
+            if proximo > (1 << tamanho) and tamanho < 12:
+                tamanho += 1
+        else:
+            # Tabela cheia: emite um código de limpeza e recomeça o dicionário.
+            acumulador |= limpar << bits
+            bits += tamanho
+            codigos.clear()
+            tamanho = tamanho_minimo + 1
+            proximo = fim + 1
+        prefixo = k
+    acumulador |= prefixo << bits
+    bits += tamanho
+    # O decodificador acrescenta uma entrada ao ler o último código; se a
+    # tabela dele chega a 1 << tamanho, o fim já é lido com um bit a mais.
+    if proximo == (1 << tamanho) and tamanho < 12:
+        tamanho += 1
+    acumulador |= fim << bits
+    bits += tamanho
+    while bits > 0:
+        saida.append(acumulador & 0xFF)
+        acumulador >>= 8
+        bits -= 8
+    return bytes(saida)
@@ -0,0 +1,74 @@
+from collections import OrderedDict
+from functools import wraps
+
+_AUSENTE = object()
+
+class CacheResultados:
+    def __init__(self, capacidade=32):
+        self.capacidade = capacidade
+        self.versao = None
+        self._entradas = OrderedDict()
+        self.acertos = 0
+        self.falhas = 0
+
+    def obter(self, versao, chave):
+        if versao != self.versao:
+            self._entradas.clear()
+            self.versao = versao
+        valor = self._entradas.get(chave, _AUSENTE)
+        if valor is _AUSENTE:
+            self.falhas += 1
+        else:
+            self.acertos += 1
+            self._entradas.move_to_end(chave)
+        return valor
+
+    def guardar(self, chave, valor):
+        self._entradas[chave] = valor
+        if len(self._entradas) > self.capacidade:
+            self._entradas.popitem(last=False)
+
+    def limpar(self):
+        self._entradas.clear()
+        self.acertos = 0
+        self.falhas = 0
+
+    def estatisticas(self):
+        return {
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'entradas': len(self._entradas),
+            'capacidade': self.capacidade,
+            'versao': self.versao,
+        }
+
+
+def memoizar_por_versao(metodo):
+    # Memoiza o resultado enquanto grafo.versao não muda. O objeto devolvido
+    # é compartilhado entre as chamadas, então precisa ser imutável (tuplas ou
+    # objetos congelados); veja também memoizar_com_copia.
+    @wraps(metodo)
+    def envoltorio(self, *args, **kwargs):
+        chave = (metodo.__name__, args, tuple(sorted(kwargs.items())))
+        valor = self.cache.obter(self.versao, chave)
+        if valor is _AUSENTE:
+            valor = metodo(self, *args, **kwargs)
+            self.cache.guardar(chave, valor)
+        return valor
+    # Permite à instrumentação distinguir acertos de falhas do cache.
+    envoltorio.memoizado = True
+    return envoltorio
+
+
+def memoizar_com_copia(copiar):
+    # Para métodos públicos que sempre devolveram listas: o cache guarda a
+    # versão imutável e cada chamador recebe a cópia feita por 'copiar'.
+    def decorador(metodo):
+        memoizado = memoizar_por_versao(metodo)
+
+        @wraps(metodo)
+        def envoltorio(self, *args, **kwargs):
+            return copiar(memoizado(self, *args, **kwargs))
+        envoltorio.memoizado = True
+        return envoltorio
+    return decorador
@@ -0,0 +1,58 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class Canvas:
+    # Imagem RGB H x W x 3 num único bytearray, linha após linha.
+    def __init__(self, largura, altura, cor=(255, 255, 255), pixels=None):
+        self.largura = largura
+        self.altura = altura
+        if pixels is None:
+            self.pixels = bytearray(bytes(cor) * (largura * altura))
+        else:
+            self.pixels = bytearray(pixels)
+
+    def copiar(self):
+        copia = Canvas.__new__(Canvas)
+        copia.largura = self.largura
+        copia.altura = self.altura
+        copia.pixels = bytearray(self.pixels)
+        return copia
+
+    def indice(self, x, y):
+        return (y * self.largura + x) * 3
+
+    def pixel(self, x, y, cor):
+        if 0 <= x < self.largura and 0 <= y < self.altura:
+            i = (y * self.largura + x) * 3
+            self.pixels[i:i + 3] = bytes(cor)
+
+    def span(self, y, x0, x1, cor):
+        # Preenche a faixa horizontal [x0, x1] da linha y com uma só atribuição.
+        if y < 0 or y >= self.altura:
+            return
+        x0 = max(x0, 0)
+        x1 = min(x1, self.largura - 1)
+        if x0 > x1:
+            return
+        inicio = (y * self.largura + x0) * 3
+        self.pixels[inicio:inicio + (x1 - x0 + 1) * 3] = bytes(cor) * (x1 - x0 + 1)
+
+    def linha(self, y):
+        inicio = y * self.largura * 3
+        return memoryview(self.pixels)[inicio:inicio + self.largura * 3]
+
+    def preencher_linha(self, y, dados):
+        inicio = y * self.largura * 3
+        self.pixels[inicio:inicio + self.largura * 3] = dados
+
+    def cabecalho_ppm(self):
+        return f"P6\n{self.largura} {self.altura}\n255\n".encode()
+
+    def como_numpy(self):
+        # Visão uint8 (altura, largura, 3) sobre o mesmo buffer, sem cópia.
+        if np is None:
+            raise ImportError("NumPy não está instalado.")
+        return np.frombuffer(self.pixels, dtype=np.uint8).reshape(self.altura, self.largura, 3)
@@ -0,0 +1,97 @@
+import math
+
+class Desenhador:
+    @staticmethod
+    def desenhar_linha_basica(imagem, x1, y1, x2, y2, cor):
+        x1 = int(x1)
+        y1 = int(y1)
+        x2 = int(x2)
+        y2 = int(y2)
+        largura = imagem.largura
+        altura = imagem.altura
+        if not (0 <= x1 < largura and 0 <= y1 < altura and 0 <= x2 < largura and 0 <= y2 < altura):
+            recorte = Desenhador._recortar(x1, y1, x2, y2, largura - 1, altura - 1)
+            if recorte is None:
+                return
+            x1, y1, x2, y2 = recorte
+        # Depois do recorte todos os pontos estão dentro da tela, então o laço
+        # de Bresenham escreve direto no buffer sem testar limites.
+        pixels = imagem.pixels
+        cor = bytes(cor)
+        dx = abs(x2 - x1)
+        dy = abs(y2 - y1)
+        x, y = x1, y1
+        sx = 1 if x2 > x1 else -1
+        sy = 1 if y2 > y1 else -1
+        if dx > dy:
+            err = dx // 2
+            while x != x2:
+                i = (y * largura + x) * 3
+                pixels[i:i + 3] = cor
+                err -= dy
+                if err < 0:
+                    y += sy
+                    err += dx
+                x += sx
+        else:
+            err = dy // 2
+            while y != y2:
+                i = (y * largura + x) * 3
+                pixels[i:i + 3] = cor
+                err -= dx
+                if err < 0:
+                    x += sx
+                    err += dy
+                y += sy
+        i = (y2 * largura + x2) * 3
+        pixels[i:i + 3] = cor
+
+    @staticmethod
+    def _recortar(x1, y1, x2, y2, x_max, y_max):
+        # Liang-Barsky: recorta o segmento ao retângulo [0, x_max] x [0, y_max].
+        dx = x2 - x1
+        dy = y2 - y1
+        t0, t1 = 0.0, 1.0
+        for p, q in ((-dx, x1), (dx, x_max - x1), (-dy, y1), (dy, y_max - y1)):
+            if p == 0:
+                if q < 0:
+                    return None
+                continue
+            t = q / p
+            if p < 0:
+                if t > t1:
+                    return None
+                t0 = max(t0, t)
+            else:
+                if t < t0:
+                    return None
+                t1 = min(t1, t)
+        return (min(max(round(x1 + t0 * dx), 0), x_max), min(max(round(y1 + t0 * dy), 0), y_max),
+                min(max(round(x1 + t1 * dx), 0), x_max), min(max(round(y1 + t1 * dy), 0), y_max))
+
+    @staticmethod
+    def desenhar_seta(imagem, x1, y1, x2, y2, cor):
+        Desenhador.desenhar_linha_basica(imagem, x1, y1, x2, y2, cor)
+        Desenhador.desenhar_cabeca_seta(imagem, x1, y1, x2, y2, cor)
+
+    @staticmethod
+    def desenhar_cabeca_seta(imagem, x1, y1, x2, y2, cor):
+        angulo = math.atan2(y2 - y1, x2 - x1)
+        tamanho_seta = 10
+        angulo1 = angulo + math.pi / 6
+        angulo2 = angulo - math.pi / 6
+        x3 = int(x2 - tamanho_seta * math.cos(angulo1))
+        y3 = int(y2 - tamanho_seta * math.sin(angulo1))
+        x4 = int(x2 - tamanho_seta * math.cos(angulo2))
+        y4 = int(y2 - tamanho_seta * math.sin(angulo2))
+        Desenhador.desenhar_linha_basica(imagem, x2, y2, x3, y3, cor)
+        Desenhador.desenhar_linha_basica(imagem, x2, y2, x4, y4, cor)
+
+    @staticmethod
+    def desenhar_circulo(imagem, x0, y0, raio, cor):
+        # Preenche o disco linha a linha: cada linha é um único span.
+        x0 = int(x0)
+        y0 = int(y0)
+        for dy in range(-raio, raio + 1):
+            meia_largura = math.isqrt(raio * raio - dy * dy)
+            imagem.span(y0 + dy, x0 - meia_largura, x0 + meia_largura, cor)
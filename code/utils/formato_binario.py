@@ -0,0 +1,111 @@
+from array import array
+import mmap
+import os
+import struct
+import sys
+from models.grafo_csr import GrafoCSR
+
+# Layout (little-endian, seções alinhadas em 8 bytes):
+#   cabeçalho: MAGICO, versão, flags, n, entradas, nº de rótulos, tamanho do nome
+#   nome (utf-8) | offsets int64[n+1] | destinos int64[entradas]
+#   pesos int64/float64[entradas] | rótulos das entradas int32[entradas]
+#   rótulos dos vértices int32[n] | offsets dos rótulos int64[r+1] | rótulos (utf-8)
+MAGICO = b"GRAFOCSR"
+VERSAO = 1
+CABECALHO = struct.Struct("<8sIIqqqq")
+FLAG_DIRIGIDO = 1
+FLAG_PESOS_REAIS = 2
+
+
+def _alinhar(tamanho):
+    return (tamanho + 7) & ~7
+
+
+class FormatoBinario:
+    @staticmethod
+    def salvar(grafo, nome_arquivo="grafo.bin"):
+        # O CSR é a própria lista de adjacência; rótulos repetidos são gravados
+        # uma vez só e referenciados por índice (-1 = sem rótulo/padrão).
+        dados_dir = "dados"
+        if not os.path.exists(dados_dir):
+            os.makedirs(dados_dir)
+        n = grafo.num_vertices
+        adjacencias = grafo.lista_adj.adjacencias
+        reais = any(isinstance(peso, float) for adj in adjacencias.values() for peso in adj.values())
+        offsets = array('q', [0]) * (n + 1)
+        destinos = array('q')
+        pesos = array('d' if reais else 'q')
+        for u in range(n):
+            adj = adjacencias[u]
+            destinos.extend(adj.keys())
+            pesos.extend(adj.values())
+            offsets[u + 1] = len(destinos)
+        rotulos = {}
+        rotulo_por_par = {}
+        for edge in grafo.edge_list:
+            if edge['label']:
+                indice = rotulos.setdefault(edge['label'], len(rotulos))
+                rotulo_por_par[(edge['u'], edge['v'])] = indice
+                if not grafo.dirigido:
+                    rotulo_por_par[(edge['v'], edge['u'])] = indice
+        if rotulo_por_par:
+            rotulos_arestas = array('i', (rotulo_por_par.get((u, v), -1) for u in range(n) for v in adjacencias[u]))
+        else:
+            rotulos_arestas = array('i', [-1]) * len(destinos)
+        rotulos_vertices = array('i', [-1]) * n
+        for v, rotulo in grafo.vertex_labels.items():
+            if rotulo != f"V{v + 1}":
+                rotulos_vertices[v] = rotulos.setdefault(rotulo, len(rotulos))
+        codificados = [rotulo.encode("utf-8") for rotulo in rotulos]
+        offsets_rotulos = array('q', [0])
+        for rotulo in codificados:
+            offsets_rotulos.append(offsets_rotulos[-1] + len(rotulo))
+        nome = grafo.nome.encode("utf-8")
+        flags = (FLAG_DIRIGIDO if grafo.dirigido else 0) | (FLAG_PESOS_REAIS if reais else 0)
+        secoes = [nome, offsets, destinos, pesos, rotulos_arestas, rotulos_vertices, offsets_rotulos,
+                  b"".join(codificados)]
+        if sys.byteorder != "little":
+            for secao in secoes:
+                if isinstance(secao, array):
+                    secao.byteswap()
+        with open(os.path.join(dados_dir, nome_arquivo), "wb") as f:
+            f.write(CABECALHO.pack(MAGICO, VERSAO, flags, n, len(destinos), len(rotulos), len(nome)))
+            for secao in secoes:
+                dados = memoryview(secao).cast('B')
+                f.write(dados)
+                f.write(bytes(_alinhar(len(dados)) - len(dados)))
+
+    @staticmethod
+    def abrir(caminho):
+        # Mapeia o arquivo somente para leitura e devolve um GrafoCSR cujos
+        # vetores apontam direto para o mapa.
+        with open(caminho, "rb") as f:
+            mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magico, versao, flags, n, entradas, num_rotulos, tamanho_nome = CABECALHO.unpack_from(mapa, 0)
+        if magico != MAGICO:
+            mapa.close()
+            raise ValueError(f"{caminho} não é um grafo em formato binário.")
+        if versao != VERSAO:
+            mapa.close()
+            raise ValueError(f"Versão {versao} do formato binário não suportada.")
+        visao = memoryview(mapa)
+        posicao = CABECALHO.size
+        secoes = []
+        for tamanho, formato in ((tamanho_nome, 'B'), (n + 1, 'q'), (entradas, 'q'),
+                                 (entradas, 'd' if flags & FLAG_PESOS_REAIS else 'q'), (entradas, 'i'),
+                                 (n, 'i'), (num_rotulos + 1, 'q')):
+            tamanho_bytes = tamanho * struct.calcsize(formato)
+            secoes.append(visao[posicao:posicao + tamanho_bytes].cast(formato))
+            posicao += _alinhar(tamanho_bytes)
+        nome = bytes(secoes[0]).decode("utf-8")
+        secoes[0].release()
+        if sys.byteorder != "little":
+            # Em máquinas big-endian os vetores precisam ser convertidos (com cópia).
+            for i in range(1, 7):
+                convertido = array(secoes[i].format, secoes[i])
+                convertido.byteswap()
+                secoes[i].release()
+                secoes[i] = memoryview(convertido)
+        tabela = visao[posicao:posicao + secoes[6][num_rotulos]]
+        visao.release()
+        return GrafoCSR(nome, bool(flags & FLAG_DIRIGIDO), n, *secoes[1:], tabela, mapa)
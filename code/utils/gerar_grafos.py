@@ -0,0 +1,172 @@
+from grafo import Grafo
+from array import array
+import math
+import random
+
+class GeradorGrafos:
+    @staticmethod
+    def gerar_grafos_prontos(semente=None):
+        rng = random.Random(semente)
+        grafos = []
+        for i in range(1, 9):
+            num_vertices = rng.randint(10, 20)
+            dirigido = rng.choice([True, False])
+            probabilidade_aresta = rng.uniform(0.3, 0.7)
+            grafo = GeradorGrafos.gerar_grafo_aleatorio(num_vertices, probabilidade_aresta, dirigido,
+                                                        semente=rng.getrandbits(64))
+            grafo.nome = f"Grafo {i}"
+            grafos.append(grafo)
+        return grafos
+
+    @staticmethod
+    def gerar_grafo_aleatorio(num_vertices, probabilidade_aresta, dirigido, semente=None):
+        # G(n, p) em O(n + m): em vez de sortear cada par, salta direto para o
+        # próximo par sorteado com um passo geométrico (Batagelj e Brandes, 2005).
+        # Dirigido, o sorteio corre sobre os n(n - 1) pares ordenados, então
+        # u->v e v->u são independentes.
+        rng = random.Random(semente)
+        origens = array('q')
+        destinos = array('q')
+        if probabilidade_aresta >= 1:
+            if dirigido:
+                pares = ((u, v) for u in range(num_vertices) for v in range(num_vertices) if u != v)
+            else:
+                pares = ((u, v) for v in range(num_vertices) for u in range(v))
+        elif probabilidade_aresta <= 0:
+            pares = ()
+        elif dirigido:
+            pares = GeradorGrafos._pares_ordenados_geometricos(num_vertices, probabilidade_aresta, rng)
+        else:
+            pares = GeradorGrafos._pares_geometricos(num_vertices, probabilidade_aresta, rng)
+        for u, v in pares:
+            origens.append(u)
+            destinos.append(v)
+        return Grafo.from_edges(num_vertices, (origens, destinos), dirigido, nome="Grafo Aleatório")
+
+    @staticmethod
+    def _pares_geometricos(num_vertices, probabilidade_aresta, rng):
+        log_q = math.log(1.0 - probabilidade_aresta)
+        v = 1
+        w = -1
+        while v < num_vertices:
+            w += 1 + int(math.log(1.0 - rng.random()) / log_q)
+            while w >= v and v < num_vertices:
+                w -= v
+                v += 1
+            if v < num_vertices:
+                yield w, v
+
+    @staticmethod
+    def _pares_ordenados_geometricos(num_vertices, probabilidade_aresta, rng):
+        # Cada origem u tem n - 1 destinos possíveis; o índice w pula u.
+        log_q = math.log(1.0 - probabilidade_aresta)
+        largura = num_vertices - 1
+        u = 0
+        w = -1
+        while u < num_vertices:
+            w += 1 + int(math.log(1.0 - rng.random()) / log_q)
+            while w >= largura and u < num_vertices:
+                w -= largura
+                u += 1
+            if u < num_vertices:
+                yield u, w if w < u else w + 1
+
+    @staticmethod
+    def gerar_cadeia_ciclos(num_vertices, num_componentes=5, dirigido=False):
+        # Ciclos de mesmo tamanho ligados em sequência por uma única aresta,
+        # que é uma ponte; os vértices que sobram da divisão ficam isolados.
+        origens = array('q')
+        destinos = array('q')
+        tamanho_componente = num_vertices // num_componentes
+        if tamanho_componente > 0:
+            for i in range(num_componentes):
+                inicio = i * tamanho_componente
+                for j in range(tamanho_componente):
+                    origens.append(inicio + j)
+                    destinos.append(inicio + (j + 1) % tamanho_componente)
+            for i in range(num_componentes - 1):
+                origens.append((i + 1) * tamanho_componente - 1)
+                destinos.append((i + 1) * tamanho_componente)
+        return Grafo.from_edges(num_vertices, (origens, destinos), dirigido, nome="Cadeia de Ciclos")
+
+    @staticmethod
+    def gerar_grade(linhas, colunas, dirigido=False):
+        origens = array('q')
+        destinos = array('q')
+        for r in range(linhas):
+            for c in range(colunas):
+                v = r * colunas + c
+                if c + 1 < colunas:
+                    origens.append(v)
+                    destinos.append(v + 1)
+                if r + 1 < linhas:
+                    origens.append(v)
+                    destinos.append(v + colunas)
+        return Grafo.from_edges(linhas * colunas, (origens, destinos), dirigido, nome="Grade")
+
+    @staticmethod
+    def gerar_barabasi_albert(num_vertices, m, semente=None):
+        if m < 1 or m >= num_vertices:
+            raise ValueError("O parâmetro m deve satisfazer 1 <= m < num_vertices.")
+        rng = random.Random(semente)
+        origens = array('q')
+        destinos = array('q')
+        # Cada vértice aparece em 'repetidos' uma vez por aresta incidente, então
+        # sortear dessa lista é a ligação preferencial proporcional ao grau.
+        repetidos = []
+        alvos = list(range(m))
+        for novo in range(m, num_vertices):
+            for alvo in alvos:
+                origens.append(novo)
+                destinos.append(alvo)
+            repetidos.extend(alvos)
+            repetidos.extend([novo] * m)
+            escolhidos = set()
+            while len(escolhidos) < m:
+                escolhidos.add(rng.choice(repetidos))
+            alvos = list(escolhidos)
+        return Grafo.from_edges(num_vertices, (origens, destinos), nome="Barabási-Albert")
+
+    @staticmethod
+    def gerar_regular_aleatorio(num_vertices, grau, semente=None):
+        if grau >= num_vertices or (num_vertices * grau) % 2 != 0:
+            raise ValueError("É preciso grau < num_vertices e num_vertices * grau par.")
+        rng = random.Random(semente)
+        arestas = None
+        while arestas is None:
+            arestas = GeradorGrafos._emparelhar_pontas(num_vertices, grau, rng)
+        origens = array('q', (u for u, _ in arestas))
+        destinos = array('q', (v for _, v in arestas))
+        return Grafo.from_edges(num_vertices, (origens, destinos), nome="Regular Aleatório")
+
+    @staticmethod
+    def _emparelhar_pontas(num_vertices, grau, rng):
+        # Modelo de configuração: embaralha as pontas e emparelha; as pontas que
+        # formariam laço ou aresta repetida voltam para uma nova rodada.
+        arestas = set()
+        pontas = list(range(num_vertices)) * grau
+        while pontas:
+            rng.shuffle(pontas)
+            sobras = []
+            iterador = iter(pontas)
+            for u, v in zip(iterador, iterador):
+                if u > v:
+                    u, v = v, u
+                if u != v and (u, v) not in arestas:
+                    arestas.add((u, v))
+                else:
+                    sobras.append(u)
+                    sobras.append(v)
+            if sobras and not GeradorGrafos._sobras_emparelhaveis(sobras, arestas):
+                return None
+            pontas = sobras
+        return sorted(arestas)
+
+    @staticmethod
+    def _sobras_emparelhaveis(sobras, arestas):
+        vertices = sorted(set(sobras))
+        for i, u in enumerate(vertices):
+            for v in vertices[i + 1:]:
+                if (u, v) not in arestas:
+                    return True
+        return False
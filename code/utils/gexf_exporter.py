@@ -0,0 +1,59 @@
+import gzip
+import io
+import os
+from xml.sax.saxutils import quoteattr
+from utils.layout import LayoutForcas
+
+TAMANHO_BUFFER = 1 << 20
+
+
+class GEXFExporter:
+    @staticmethod
+    def exportar(grafo, nome_arquivo="grafo.gexf", comprimir=None, tamanho_buffer=TAMANHO_BUFFER, layout=None):
+        # As linhas são acumuladas e gravadas em blocos de ~tamanho_buffer
+        # bytes; com 'comprimir' (padrão: nome terminado em .gz) o fluxo passa
+        # por gzip. Com a grade (layout=False, ou automático em grafos grandes)
+        # as posições são geradas durante a escrita, sem passar pelo layout.
+        dados_dir = "dados"
+        if not os.path.exists(dados_dir):
+            os.makedirs(dados_dir)
+        caminho = os.path.join(dados_dir, nome_arquivo)
+        if comprimir is None:
+            comprimir = nome_arquivo.endswith(".gz")
+        if comprimir:
+            destino = io.BufferedWriter(gzip.open(caminho, "wb", compresslevel=6), tamanho_buffer)
+        else:
+            destino = open(caminho, "wb", buffering=tamanho_buffer)
+        with destino:
+            partes = []
+            acumulado = 0
+            for linha in GEXFExporter._linhas(grafo, layout):
+                partes.append(linha)
+                acumulado += len(linha)
+                if acumulado >= tamanho_buffer:
+                    destino.write("".join(partes).encode("utf-8"))
+                    partes.clear()
+                    acumulado = 0
+            destino.write("".join(partes).encode("utf-8"))
+
+    @staticmethod
+    def _linhas(grafo, layout=None):
+        yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+        yield '<gexf xmlns="http://www.gexf.net/1.3draft" xmlns:viz="http://www.gephi.org/gexf/viz/0.1" version="1.3">\n'
+        yield '  <graph mode="static" defaultedgetype="{}">\n'.format("directed" if grafo.dirigido else "undirected")
+        yield "    <nodes>\n"
+        for vertice, (x, y) in enumerate(LayoutForcas.posicoes(grafo, layout)):
+            label = quoteattr(str(grafo.vertex_labels.get(vertice, f"V{vertice + 1}")))
+            # Posição normalizada, centrada na origem
+            yield (f'      <node id="{vertice}" label={label}>\n'
+                   f'        <viz:position x="{(x - 0.5) * 1000:.2f}" y="{(0.5 - y) * 1000:.2f}" z="0" />\n'
+                   '      </node>\n')
+        yield "    </nodes>\n"
+        yield "    <edges>\n"
+        for edge in grafo.edge_list:
+            label = quoteattr(str(edge['label']) if edge['label'] else "")
+            yield (f'      <edge id="{edge["id"]}" source="{edge["u"]}" target="{edge["v"]}" '
+                   f'weight="{edge["peso"]}" label={label} />\n')
+        yield "    </edges>\n"
+        yield "  </graph>\n"
+        yield "</gexf>\n"
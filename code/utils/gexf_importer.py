@@ -0,0 +1,72 @@
+from array import array
+import gzip
+import xml.etree.ElementTree as ET
+from grafo import Grafo
+
+
+def _nome_local(tag):
+    return tag.rsplit("}", 1)[-1]
+
+
+class GEXFImporter:
+    @staticmethod
+    def importar(caminho, nome=None):
+        # Lê o arquivo em fluxo com iterparse: cada <node>/<edge> é convertido
+        # em colunas e descartado assim que termina, então a memória fica
+        # proporcional ao grafo e não à árvore XML. Ids de nós arbitrários são
+        # renumerados para 0..n-1 na ordem em que aparecem.
+        with open(caminho, "rb") as arquivo:
+            comprimido = arquivo.read(2) == b"\x1f\x8b"
+        fonte = gzip.open(caminho, "rb") if comprimido else open(caminho, "rb")
+        indices = {}
+        labels_vertices = {}
+        origens = array('q')
+        destinos = array('q')
+        pesos = array('d')
+        pesos_inteiros = True
+        labels_arestas = {}
+        dirigido = False
+        pilha = []
+        with fonte:
+            for evento, elem in ET.iterparse(fonte, events=("start", "end")):
+                tag = _nome_local(elem.tag)
+                if evento == "start":
+                    pilha.append(elem)
+                    if tag == "graph":
+                        dirigido = elem.get("defaultedgetype", "undirected") == "directed"
+                    continue
+                pilha.pop()
+                if tag == "node":
+                    v = indices.setdefault(elem.get("id"), len(indices))
+                    if elem.get("label") is not None:
+                        labels_vertices[v] = elem.get("label")
+                elif tag == "edge":
+                    u = indices.setdefault(elem.get("source"), len(indices))
+                    v = indices.setdefault(elem.get("target"), len(indices))
+                    origens.append(u)
+                    destinos.append(v)
+                    peso = float(elem.get("weight", 1))
+                    pesos_inteiros = pesos_inteiros and peso.is_integer()
+                    pesos.append(peso)
+                    if elem.get("label"):
+                        labels_arestas[(u, v)] = elem.get("label")
+                else:
+                    continue
+                # Solta o elemento e a referência que o pai guarda dele.
+                elem.clear()
+                if pilha:
+                    pilha[-1].clear()
+        # Pesos inteiros voltam como int; com algum peso fracionário as
+        # arestas seguem linha a linha para manter os inteiros como int.
+        if pesos_inteiros:
+            arestas = (origens, destinos, array('q', map(int, pesos)))
+        else:
+            arestas = zip(origens, destinos, (int(p) if p.is_integer() else p for p in pesos))
+        grafo = Grafo.from_edges(len(indices), arestas, dirigido,
+                                 nome=nome if nome is not None else "Grafo GEXF")
+        grafo.vertex_labels.update(labels_vertices)
+        for (u, v), label in labels_arestas.items():
+            aresta_id = grafo.arestas.buscar(u, v)
+            if aresta_id is not None:
+                grafo.arestas.aresta(aresta_id)['label'] = label
+        return grafo
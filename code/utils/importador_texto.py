@@ -0,0 +1,207 @@
+from array import array
+import gzip
+import re
+from grafo import Grafo
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+TAMANHO_BLOCO = 1 << 22
+# Linha vazia ou só com espaços (inclui "\r" de arquivos CRLF).
+LINHA_VAZIA = re.compile(rb"(?:^|\n)[ \t\r\f\v]*\n")
+
+
+def _abrir(caminho):
+    with open(caminho, "rb") as arquivo:
+        comprimido = arquivo.read(2) == b"\x1f\x8b"
+    return gzip.open(caminho, "rb") if comprimido else open(caminho, "rb")
+
+
+def _blocos(caminho, tamanho_bloco):
+    # Lê o arquivo em blocos de tamanho fixo cortados no último '\n'; o
+    # pedaço de linha que sobra vai para o início do bloco seguinte.
+    with _abrir(caminho) as arquivo:
+        resto = b""
+        while True:
+            bloco = arquivo.read(tamanho_bloco)
+            if not bloco:
+                break
+            bloco = resto + bloco
+            corte = bloco.rfind(b"\n") + 1
+            resto = bloco[corte:]
+            if corte:
+                yield bloco[:corte]
+        if resto.strip():
+            yield resto + b"\n"
+
+
+class _Colunas:
+    # Acumula as colunas numéricas de todos os blocos (arrays NumPy ou
+    # array.array), de modo que a memória acompanha o número de arestas.
+    def __init__(self, num_colunas):
+        self.num_colunas = num_colunas
+        self.partes = [[] for _ in range(num_colunas)]
+        self.reais = False
+
+    def adicionar(self, texto, num_linhas, caminho):
+        if not num_linhas:
+            return
+        reais = any(c in texto for c in (b".", b"e", b"E"))
+        self.reais = self.reais or reais
+        if np is not None:
+            valores = np.fromstring(texto, dtype=np.float64 if reais else np.int64, sep=" ")
+            if len(valores) != num_linhas * self.num_colunas:
+                raise ValueError(f"Linha malformada em {caminho}.")
+            valores = valores.reshape(num_linhas, self.num_colunas)
+            for j in range(self.num_colunas):
+                self.partes[j].append(np.ascontiguousarray(valores[:, j]))
+            return
+        tokens = texto.split()
+        if len(tokens) != num_linhas * self.num_colunas:
+            raise ValueError(f"Linha malformada em {caminho}.")
+        for j in range(self.num_colunas):
+            coluna = tokens[j::self.num_colunas]
+            self.partes[j].append(array('d', map(float, coluna)) if reais else array('q', map(int, coluna)))
+
+    def coluna(self, j, inteira=True):
+        partes = self.partes[j]
+        self.partes[j] = []
+        if np is not None:
+            if not partes:
+                return np.zeros(0, dtype=np.int64)
+            coluna = np.concatenate(partes)
+            if inteira:
+                return coluna.astype(np.int64, copy=False)
+            if coluna.dtype == np.float64 and np.all(coluna == np.floor(coluna)):
+                return coluna.astype(np.int64)
+            return coluna
+        if inteira or not self.reais:
+            coluna = array('q')
+            for parte in partes:
+                coluna.extend(parte if parte.typecode == 'q' else map(int, parte))
+            return coluna
+        coluna = array('d')
+        for parte in partes:
+            coluna.extend(parte if parte.typecode == 'd' else map(float, parte))
+        if all(p.is_integer() for p in coluna):
+            return array('q', map(int, coluna))
+        return coluna
+
+
+def _tem_linha_vazia(bloco):
+    # Uma linha em branco começa o bloco ou segue um '\n' com espaço ou outro
+    # '\n'; só nesses casos vale pagar a busca pela expressão regular.
+    if not bloco[:1].isspace() and not any(s in bloco for s in (b"\n\n", b"\n\r", b"\n ", b"\n\t")):
+        return False
+    return LINHA_VAZIA.search(bloco) is not None
+
+
+def _linhas_de_dados(bloco, comentarios):
+    # Descarta linhas vazias e comentários; sem nada a filtrar o bloco segue
+    # inteiro, sem dividir em linhas.
+    if not any(c in bloco for c in comentarios) and not _tem_linha_vazia(bloco):
+        return bloco, bloco.count(b"\n")
+    linhas = [linha for linha in bloco.split(b"\n") if linha.strip() and linha.lstrip()[:1] not in comentarios]
+    return b"\n".join(linhas) + b"\n", len(linhas)
+
+
+def _compactar_ids(origens, destinos):
+    # Renumera ids arbitrários para 0..n-1 preservando a ordem dos ids
+    # originais; devolve também a lista de ids originais.
+    if np is not None:
+        unicos, inversos = np.unique(np.concatenate([origens, destinos]), return_inverse=True)
+        return inversos[:len(origens)], inversos[len(origens):], unicos.tolist()
+    unicos = sorted(set(origens).union(destinos))
+    mapa = {x: i for i, x in enumerate(unicos)}
+    return array('q', map(mapa.__getitem__, origens)), array('q', map(mapa.__getitem__, destinos)), unicos
+
+
+class ImportadorTexto:
+    @staticmethod
+    def importar_lista_arestas(caminho, dirigido=False, nome=None, comentarios=b"#%", tamanho_bloco=TAMANHO_BLOCO):
+        # Uma aresta por linha, "u v" ou "u v peso", separados por espaços
+        # ou tabulações. Os ids podem ser quaisquer inteiros.
+        return ImportadorTexto._importar_compactado(caminho, dirigido, nome or "Lista de Arestas", comentarios,
+                                                    tamanho_bloco, usar_pesos=True)
+
+    @staticmethod
+    def importar_snap(caminho, dirigido=None, nome=None, tamanho_bloco=TAMANHO_BLOCO):
+        # Formato do SNAP: cabeçalho em comentários '#' que diz se o grafo é
+        # dirigido, seguido de "FromNodeId ToNodeId" por linha. Colunas extras
+        # (como marcas de tempo) são ignoradas.
+        if dirigido is None:
+            dirigido = True
+            for bloco in _blocos(caminho, tamanho_bloco):
+                for linha in bloco.split(b"\n"):
+                    if not linha.startswith(b"#"):
+                        break
+                    if b"Undirected graph" in linha:
+                        dirigido = False
+                break
+        return ImportadorTexto._importar_compactado(caminho, dirigido, nome or "Grafo SNAP", b"#",
+                                                    tamanho_bloco, usar_pesos=False)
+
+    @staticmethod
+    def _importar_compactado(caminho, dirigido, nome, comentarios, tamanho_bloco, usar_pesos):
+        colunas = None
+        for bloco in _blocos(caminho, tamanho_bloco):
+            texto, num_linhas = _linhas_de_dados(bloco, comentarios)
+            if not num_linhas:
+                continue
+            if colunas is None:
+                num_colunas = len(texto[:texto.index(b"\n")].split())
+                if num_colunas < 2:
+                    raise ValueError(f"Linha malformada em {caminho}.")
+                colunas = _Colunas(num_colunas)
+            colunas.adicionar(texto, num_linhas, caminho)
+        if colunas is None:
+            return Grafo(0, dirigido, nome=nome)
+        origens, destinos, ids = _compactar_ids(colunas.coluna(0), colunas.coluna(1))
+        arestas = (origens, destinos)
+        if usar_pesos and colunas.num_colunas > 2:
+            arestas = (origens, destinos, colunas.coluna(2, inteira=False))
+        del colunas
+        grafo = Grafo.from_edges(len(ids), arestas, dirigido, nome=nome)
+        if ids[0] != 0 or ids[-1] != len(ids) - 1:
+            # Ids fora de 0..n-1 ficam registrados como rótulos dos vértices.
+            grafo.vertex_labels = {i: str(x) for i, x in enumerate(ids)}
+        return grafo
+
+    @staticmethod
+    def importar_dimacs(caminho, nome=None, tamanho_bloco=TAMANHO_BLOCO):
+        # .gr (caminhos mínimos): "p sp n m" e arcos "a u v peso", dirigido.
+        # .col (coloração): "p edge n m" e arestas "e u v", não dirigido.
+        # Vértices numerados de 1 a n; linhas 'c' são comentários.
+        num_vertices = None
+        marcador = None
+        colunas = None
+        for bloco in _blocos(caminho, tamanho_bloco):
+            if num_vertices is None:
+                for linha in bloco.split(b"\n"):
+                    if linha.startswith(b"p"):
+                        campos = linha.split()
+                        num_vertices = int(campos[2])
+                        marcador = b"a" if campos[1] == b"sp" else b"e"
+                        colunas = _Colunas(3 if marcador == b"a" else 2)
+                        break
+            if marcador is None:
+                continue
+            linhas = [linha[1:] for linha in bloco.split(b"\n") if linha.startswith(marcador)]
+            colunas.adicionar(b"\n".join(linhas) + b"\n", len(linhas), caminho)
+        if num_vertices is None:
+            raise ValueError(f"{caminho} não tem a linha 'p' do formato DIMACS.")
+        origens = colunas.coluna(0)
+        destinos = colunas.coluna(1)
+        if np is not None:
+            origens -= 1
+            destinos -= 1
+        else:
+            origens = array('q', (u - 1 for u in origens))
+            destinos = array('q', (v - 1 for v in destinos))
+        arestas = (origens, destinos)
+        if marcador == b"a":
+            arestas = (origens, destinos, colunas.coluna(2, inteira=False))
+        dirigido = marcador == b"a"
+        return Grafo.from_edges(num_vertices, arestas, dirigido, nome=nome or "Grafo DIMACS")
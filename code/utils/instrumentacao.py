@@ -0,0 +1,201 @@
+import cProfile
+import inspect
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter_ns
+
+# (classe, nome) -> atributo original, preenchido apenas enquanto habilitado.
+_originais = {}
+# "Classe.metodo" -> [chamadas, tempo_total_ns, tempo_max_ns, arestas, vertices]
+_metricas = {}
+
+# Operações que tocam uma quantidade fixa de arestas/vértices; as demais que
+# recebem um grafo percorrem-no inteiro.
+OPERACOES_LOCAIS = {
+    "adicionar_aresta": (1, 2),
+    "remover_aresta": (1, 2),
+    "remover_aresta_id": (1, 2),
+    "checar_adjacencia_vertices": (1, 2),
+    "checar_adjacencia": (1, 2),
+    "obter_peso": (1, 2),
+    "buscar": (1, 2),
+    "aresta": (1, 2),
+    "adicionar": (1, 2),
+    "remover": (1, 2),
+    "eh_ponte": (1, 2),
+    "adicionar_vertice": (0, 1),
+    "componente": (0, 1),
+    "grau": (0, 1),
+    "vizinhos": (0, 1),
+}
+OPERACOES_EM_LOTE = ("adicionar_arestas", "adicionar_varias")
+# Métodos do próprio grafo que o percorrem inteiro a cada chamada. Nos demais
+# o tamanho do grafo só é contado quando há trabalho de fato: falha do cache
+# num método memoizado ou construção de uma matriz preguiçosa.
+OPERACOES_PERCURSO = ("fleury", "caminho_euleriano", "habilitar_indice_pontes", "exibir_lista_adjacencia",
+                      "exibir_matriz_adjacencia", "exibir_matriz_incidencia")
+CONSTRUCOES_PREGUICOSAS = {"matriz_adj": "_matriz_adj", "matriz_inc": "_matriz_inc"}
+
+
+def _alvos_padrao():
+    from grafo import Grafo
+    from models.lista_adjacencia import ListaAdjacencia
+    from models.matriz_adjacencia import MatrizAdjacencia
+    from models.matriz_incidencia import MatrizIncidencia
+    from models.indice_arestas import IndiceArestas
+    from models.indice_pontes import IndicePontes
+    from models.grafo_csr import GrafoCSR
+    from utils.gexf_exporter import GEXFExporter
+    from utils.gexf_importer import GEXFImporter
+    from utils.ppm_exporter import PPMExporter
+    from utils.txt_exporter import TXTExporter
+    from utils.formato_binario import FormatoBinario
+    from utils.importador_texto import ImportadorTexto
+    from utils.layout import LayoutForcas
+    return [Grafo, ListaAdjacencia, MatrizAdjacencia, MatrizIncidencia, IndiceArestas, IndicePontes, GrafoCSR,
+            GEXFExporter, GEXFImporter, PPMExporter, TXTExporter, FormatoBinario, ImportadorTexto, LayoutForcas]
+
+
+def _eh_grafo(objeto):
+    return hasattr(objeto, "edge_list") and hasattr(objeto, "num_vertices")
+
+
+def _tocados(nome, argumentos, resultado):
+    # 'argumentos' já vem sem self/cls: um grafo recebido como argumento (ou
+    # devolvido) é percorrido inteiro pela operação.
+    if nome in OPERACOES_LOCAIS:
+        return OPERACOES_LOCAIS[nome]
+    if nome in OPERACOES_EM_LOTE:
+        if isinstance(resultado, int):
+            return resultado, 0
+        if isinstance(resultado, tuple) and resultado:
+            return len(resultado[0]), 0
+        return 0, 0
+    for arg in argumentos[:2]:
+        if _eh_grafo(arg):
+            return len(arg.edge_list), arg.num_vertices
+    if _eh_grafo(resultado):
+        return len(resultado.edge_list), resultado.num_vertices
+    return 0, 0
+
+
+def _envolver(chave, nome, funcao, ligado):
+    # 'ligado' indica que o primeiro argumento é self/cls.
+    memoizado = getattr(funcao, "memoizado", False)
+    preguicoso = CONSTRUCOES_PREGUICOSAS.get(nome)
+    percurso = nome in OPERACOES_PERCURSO
+
+    @wraps(funcao)
+    def envoltorio(*args, **kwargs):
+        resultado = None
+        dono = args[0] if ligado and _eh_grafo(args[0]) else None
+        if dono is not None:
+            falhas = dono.cache.falhas if memoizado else 0
+            pendente = preguicoso is not None and getattr(dono, preguicoso) is None
+        inicio = perf_counter_ns()
+        try:
+            resultado = funcao(*args, **kwargs)
+            return resultado
+        finally:
+            duracao = perf_counter_ns() - inicio
+            metrica = _metricas.get(chave)
+            if metrica is None:
+                metrica = _metricas[chave] = [0, 0, 0, 0, 0]
+            arestas, vertices = _tocados(nome, args[1:] if ligado else args, resultado)
+            if dono is not None and (percurso or pendente or (memoizado and dono.cache.falhas > falhas)):
+                arestas += len(dono.edge_list)
+                vertices += dono.num_vertices
+            metrica[0] += 1
+            metrica[1] += duracao
+            if duracao > metrica[2]:
+                metrica[2] = duracao
+            metrica[3] += arestas
+            metrica[4] += vertices
+    return envoltorio
+
+
+class Instrumentacao:
+    # Instrumentação sob demanda: habilitar() troca os métodos públicos das
+    # classes-alvo por versões medidas e desabilitar() devolve os originais,
+    # então desabilitada ela não custa nada.
+    @staticmethod
+    def habilitada():
+        return bool(_originais)
+
+    @staticmethod
+    def habilitar(alvos=None):
+        if _originais:
+            return
+        for classe in alvos if alvos is not None else _alvos_padrao():
+            for nome, atributo in list(vars(classe).items()):
+                if nome.startswith("_"):
+                    continue
+                chave = f"{classe.__name__}.{nome}"
+                if isinstance(atributo, staticmethod):
+                    envolvido = staticmethod(_envolver(chave, nome, atributo.__func__, False))
+                elif isinstance(atributo, classmethod):
+                    envolvido = classmethod(_envolver(chave, nome, atributo.__func__, True))
+                elif inspect.isfunction(atributo):
+                    envolvido = _envolver(chave, nome, atributo, True)
+                elif isinstance(atributo, property) and atributo.fget is not None:
+                    envolvido = property(_envolver(chave, nome, atributo.fget, True), atributo.fset,
+                                         atributo.fdel, atributo.__doc__)
+                else:
+                    continue
+                _originais[(classe, nome)] = atributo
+                setattr(classe, nome, envolvido)
+
+    @staticmethod
+    def desabilitar():
+        for (classe, nome), atributo in _originais.items():
+            setattr(classe, nome, atributo)
+        _originais.clear()
+
+    @staticmethod
+    def limpar():
+        _metricas.clear()
+
+    @staticmethod
+    def snapshot():
+        # Dicionário simples (só tipos JSON) pronto para envio a um sistema de métricas.
+        metodos = {}
+        for chave, (chamadas, total, maximo, arestas, vertices) in sorted(_metricas.items()):
+            metodos[chave] = {
+                "chamadas": chamadas,
+                "tempo_total_ns": total,
+                "tempo_medio_ns": total // chamadas if chamadas else 0,
+                "tempo_max_ns": maximo,
+                "arestas_tocadas": arestas,
+                "vertices_tocados": vertices,
+            }
+        return {"habilitada": Instrumentacao.habilitada(), "metodos": metodos}
+
+    @staticmethod
+    @contextmanager
+    def coletar(alvos=None):
+        # Coleta escopada: zera as métricas, habilita durante o bloco e, na
+        # saída, preenche o dicionário devolvido com o snapshot.
+        resultado = {}
+        ja_habilitada = Instrumentacao.habilitada()
+        Instrumentacao.limpar()
+        Instrumentacao.habilitar(alvos)
+        try:
+            yield resultado
+        finally:
+            resultado.update(Instrumentacao.snapshot())
+            if not ja_habilitada:
+                Instrumentacao.desabilitar()
+
+    @staticmethod
+    @contextmanager
+    def perfilar(caminho=None):
+        # Gancho para o cProfile: perfila o bloco e, se 'caminho' for dado,
+        # grava as estatísticas (abrir com pstats ou snakeviz).
+        perfil = cProfile.Profile()
+        perfil.enable()
+        try:
+            yield perfil
+        finally:
+            perfil.disable()
+            if caminho is not None:
+                perfil.dump_stats(caminho)
@@ -0,0 +1,272 @@
+import math
+import random
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Profundidade da quadtree: cada coordenada é quantizada em 2^16 posições.
+PROFUNDIDADE = 16
+# Acima disso os exportadores usam a grade, salvo pedido explícito (layout=True).
+LIMITE_VERTICES_AUTOMATICO = 2000
+
+
+def _espalhar_bits(v):
+    # Intercala zeros entre os 16 bits de v (funciona em int e em arrays NumPy).
+    v = (v | (v << 8)) & 0x00FF00FF
+    v = (v | (v << 4)) & 0x0F0F0F0F
+    v = (v | (v << 2)) & 0x33333333
+    v = (v | (v << 1)) & 0x55555555
+    return v
+
+
+class LayoutForcas:
+    # Fruchterman-Reingold com repulsão aproximada por Barnes-Hut. A quadtree é
+    # montada de baixo para cima a partir dos códigos de Morton dos vértices:
+    # cada nível guarda massa, centro de massa e o intervalo dos filhos no
+    # nível seguinte, o que permite percorrê-la vértice a vértice ou, com
+    # NumPy, todos os vértices de uma vez nível a nível.
+    @staticmethod
+    def calcular(grafo, iteracoes=50, theta=0.8, semente=0, usar_numpy=None):
+        # Devolve uma lista de (x, y) normalizados em [0, 1], indexada pelo vértice.
+        n = grafo.num_vertices
+        if n == 0:
+            return []
+        if n == 1:
+            return [(0.5, 0.5)]
+        if usar_numpy is None:
+            usar_numpy = np is not None
+        rng = random.Random(semente)
+        xs = [rng.random() for _ in range(n)]
+        ys = [rng.random() for _ in range(n)]
+        origens = []
+        destinos = []
+        for edge in grafo.edge_list:
+            if edge['u'] != edge['v']:
+                origens.append(edge['u'])
+                destinos.append(edge['v'])
+        if usar_numpy:
+            xs, ys = LayoutForcas._iterar_numpy(xs, ys, origens, destinos, iteracoes, theta)
+        else:
+            xs, ys = LayoutForcas._iterar(xs, ys, origens, destinos, iteracoes, theta)
+        return LayoutForcas._normalizar(xs, ys)
+
+    @staticmethod
+    def posicoes(grafo, layout=None):
+        # Posições para os exportadores. layout=True força o layout por forças
+        # (memoizado no grafo), False usa a grade e None decide pelo tamanho.
+        if layout is None:
+            layout = grafo.num_vertices <= LIMITE_VERTICES_AUTOMATICO
+        if layout:
+            return grafo.posicoes_layout()
+        return LayoutForcas.grade(grafo.num_vertices)
+
+    @staticmethod
+    def grade(n):
+        # Posicionamento antigo em grade, gerado vértice a vértice sem memória extra.
+        colunas = int(n ** 0.5) + 1
+        linhas = n // colunas + 1
+        for v in range(n):
+            yield (v % colunas + 1) / (colunas + 1), (v // colunas + 1) / (linhas + 1)
+
+    @staticmethod
+    def _normalizar(xs, ys):
+        min_x, max_x = min(xs), max(xs)
+        min_y, max_y = min(ys), max(ys)
+        escala = max(max_x - min_x, max_y - min_y) or 1.0
+        desloc_x = (1.0 - (max_x - min_x) / escala) / 2
+        desloc_y = (1.0 - (max_y - min_y) / escala) / 2
+        return [((x - min_x) / escala + desloc_x, (y - min_y) / escala + desloc_y) for x, y in zip(xs, ys)]
+
+    @staticmethod
+    def _codigos_morton(xs, ys):
+        min_x, min_y = min(xs), min(ys)
+        lado = max(max(xs) - min_x, max(ys) - min_y) or 1.0
+        maximo = (1 << PROFUNDIDADE) - 1
+        fator = maximo / lado
+        codigos = [_espalhar_bits(min(maximo, int((x - min_x) * fator))) |
+                   (_espalhar_bits(min(maximo, int((y - min_y) * fator))) << 1) for x, y in zip(xs, ys)]
+        return codigos, lado
+
+    @staticmethod
+    def _quadtree(xs, ys):
+        # níveis[L] = (massa, soma_x, soma_y, primeiro_filho, num_filhos, prefixos).
+        codigos, lado = LayoutForcas._codigos_morton(xs, ys)
+        ordem = sorted(range(len(xs)), key=codigos.__getitem__)
+        massa, soma_x, soma_y, primeiro, quantos, prefixos = [], [], [], [], [], []
+        for i in ordem:
+            if prefixos and prefixos[-1] == codigos[i]:
+                massa[-1] += 1
+                soma_x[-1] += xs[i]
+                soma_y[-1] += ys[i]
+            else:
+                prefixos.append(codigos[i])
+                massa.append(1)
+                soma_x.append(xs[i])
+                soma_y.append(ys[i])
+        niveis = [(massa, soma_x, soma_y, None, None, prefixos)]
+        for _ in range(PROFUNDIDADE):
+            filhos = niveis[-1]
+            massa, soma_x, soma_y, primeiro, quantos, prefixos = [], [], [], [], [], []
+            for j, prefixo in enumerate(filhos[5]):
+                prefixo >>= 2
+                if prefixos and prefixos[-1] == prefixo:
+                    massa[-1] += filhos[0][j]
+                    soma_x[-1] += filhos[1][j]
+                    soma_y[-1] += filhos[2][j]
+                    quantos[-1] += 1
+                else:
+                    prefixos.append(prefixo)
+                    massa.append(filhos[0][j])
+                    soma_x.append(filhos[1][j])
+                    soma_y.append(filhos[2][j])
+                    primeiro.append(j)
+                    quantos.append(1)
+            niveis.append((massa, soma_x, soma_y, primeiro, quantos, prefixos))
+        niveis.reverse()
+        return niveis, lado
+
+    @staticmethod
+    def _iterar(xs, ys, origens, destinos, iteracoes, theta):
+        n = len(xs)
+        k = math.sqrt(1.0 / n)
+        k2 = k * k
+        theta2 = theta * theta
+        temperatura = 0.1
+        resfriamento = temperatura / (iteracoes + 1)
+        for _ in range(iteracoes):
+            niveis, lado = LayoutForcas._quadtree(xs, ys)
+            lados2 = [(lado / (1 << nivel)) ** 2 for nivel in range(len(niveis))]
+            ultimo = len(niveis) - 1
+            dx_total = [0.0] * n
+            dy_total = [0.0] * n
+            for v in range(n):
+                x, y = xs[v], ys[v]
+                fx = fy = 0.0
+                stack = [(0, 0)]
+                while stack:
+                    nivel, no = stack.pop()
+                    massa, soma_x, soma_y, primeiro, quantos, _ = niveis[nivel]
+                    m = massa[no]
+                    dx = x - soma_x[no] / m
+                    dy = y - soma_y[no] / m
+                    d2 = dx * dx + dy * dy
+                    if m == 1 or nivel == ultimo or lados2[nivel] < theta2 * d2:
+                        if d2 > 0:
+                            f = k2 * m / d2
+                            fx += dx * f
+                            fy += dy * f
+                    else:
+                        inicio = primeiro[no]
+                        for filho in range(inicio, inicio + quantos[no]):
+                            stack.append((nivel + 1, filho))
+                dx_total[v] = fx
+                dy_total[v] = fy
+            for u, v in zip(origens, destinos):
+                dx = xs[u] - xs[v]
+                dy = ys[u] - ys[v]
+                f = math.sqrt(dx * dx + dy * dy) / k
+                dx_total[u] -= dx * f
+                dy_total[u] -= dy * f
+                dx_total[v] += dx * f
+                dy_total[v] += dy * f
+            for v in range(n):
+                # Gravidade fraca em direção ao centro mantém componentes
+                # desconexas próximas umas das outras.
+                dx = dx_total[v] - k * (xs[v] - 0.5)
+                dy = dy_total[v] - k * (ys[v] - 0.5)
+                d = math.sqrt(dx * dx + dy * dy)
+                if d > 0:
+                    passo = min(d, temperatura) / d
+                    xs[v] += dx * passo
+                    ys[v] += dy * passo
+            temperatura -= resfriamento
+        return xs, ys
+
+    @staticmethod
+    def _quadtree_numpy(x, y):
+        min_x, min_y = x.min(), y.min()
+        lado = float(max(x.max() - min_x, y.max() - min_y)) or 1.0
+        maximo = (1 << PROFUNDIDADE) - 1
+        qx = np.minimum(((x - min_x) * (maximo / lado)).astype(np.int64), maximo)
+        qy = np.minimum(((y - min_y) * (maximo / lado)).astype(np.int64), maximo)
+        codigos = _espalhar_bits(qx) | (_espalhar_bits(qy) << 1)
+        ordem = np.argsort(codigos, kind='stable')
+        prefixos = codigos[ordem]
+        inicios = np.flatnonzero(np.r_[True, prefixos[1:] != prefixos[:-1]])
+        massa = np.diff(np.r_[inicios, len(prefixos)])
+        soma_x = np.add.reduceat(x[ordem], inicios)
+        soma_y = np.add.reduceat(y[ordem], inicios)
+        prefixos = prefixos[inicios]
+        niveis = [(massa, soma_x / massa, soma_y / massa, None, None)]
+        for _ in range(PROFUNDIDADE):
+            prefixos = prefixos >> 2
+            inicios = np.flatnonzero(np.r_[True, prefixos[1:] != prefixos[:-1]])
+            quantos = np.diff(np.r_[inicios, len(prefixos)])
+            massa_filhos = niveis[-1][0]
+            massa = np.add.reduceat(massa_filhos, inicios)
+            centro_x = np.add.reduceat(niveis[-1][1] * massa_filhos, inicios) / massa
+            centro_y = np.add.reduceat(niveis[-1][2] * massa_filhos, inicios) / massa
+            prefixos = prefixos[inicios]
+            niveis.append((massa, centro_x, centro_y, inicios, quantos))
+        niveis.reverse()
+        return niveis, lado
+
+    @staticmethod
+    def _iterar_numpy(xs, ys, origens, destinos, iteracoes, theta):
+        x = np.array(xs, dtype=np.float64)
+        y = np.array(ys, dtype=np.float64)
+        n = len(x)
+        origens = np.array(origens, dtype=np.int64)
+        destinos = np.array(destinos, dtype=np.int64)
+        k = math.sqrt(1.0 / n)
+        k2 = k * k
+        theta2 = theta * theta
+        temperatura = 0.1
+        resfriamento = temperatura / (iteracoes + 1)
+        for _ in range(iteracoes):
+            niveis, lado = LayoutForcas._quadtree_numpy(x, y)
+            ultimo = len(niveis) - 1
+            fx = np.zeros(n)
+            fy = np.zeros(n)
+            # Pares (vértice, nó) ainda abertos; a cada nível os pares aceitos
+            # contribuem com a força e os demais descem para os filhos.
+            vs = np.arange(n)
+            nos = np.zeros(n, dtype=np.int64)
+            for nivel, (massa, centro_x, centro_y, primeiro, quantos) in enumerate(niveis):
+                m = massa[nos]
+                dx = x[vs] - centro_x[nos]
+                dy = y[vs] - centro_y[nos]
+                d2 = dx * dx + dy * dy
+                if nivel == ultimo:
+                    aceitos = np.ones(len(vs), dtype=bool)
+                else:
+                    aceitos = (m == 1) | ((lado / (1 << nivel)) ** 2 < theta2 * d2)
+                validos = aceitos & (d2 > 0)
+                f = k2 * m[validos] / d2[validos]
+                fx += np.bincount(vs[validos], weights=dx[validos] * f, minlength=n)
+                fy += np.bincount(vs[validos], weights=dy[validos] * f, minlength=n)
+                abertos = ~aceitos
+                if not abertos.any():
+                    break
+                nos_abertos = nos[abertos]
+                contagem = quantos[nos_abertos]
+                vs = np.repeat(vs[abertos], contagem)
+                deslocamento = np.arange(len(vs)) - np.repeat(np.cumsum(contagem) - contagem, contagem)
+                nos = np.repeat(primeiro[nos_abertos], contagem) + deslocamento
+            dx = x[origens] - x[destinos]
+            dy = y[origens] - y[destinos]
+            f = np.sqrt(dx * dx + dy * dy) / k
+            fx -= np.bincount(origens, weights=dx * f, minlength=n)
+            fy -= np.bincount(origens, weights=dy * f, minlength=n)
+            fx += np.bincount(destinos, weights=dx * f, minlength=n)
+            fy += np.bincount(destinos, weights=dy * f, minlength=n)
+            fx -= k * (x - 0.5)
+            fy -= k * (y - 0.5)
+            d = np.sqrt(fx * fx + fy * fy)
+            passo = np.where(d > 0, np.minimum(d, temperatura) / np.where(d > 0, d, 1.0), 0.0)
+            x += fx * passo
+            y += fy * passo
+            temperatura -= resfriamento
+        return x.tolist(), y.tolist()
@@ -0,0 +1,91 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+# Snapshot somente-leitura usado pelos processos trabalhadores; é enviado uma
+# única vez por processo através do inicializador do pool.
+_snapshot = None
+
+
+def _inicializar_trabalhador(snapshot):
+    global _snapshot
+    _snapshot = snapshot
+
+
+def _pontes_do_bloco(bloco):
+    offsets, vizinhos, ids = _snapshot
+    return [k for k, u, v in bloco if not _alcanca_sem_aresta(offsets, vizinhos, ids, u, v, k)]
+
+
+def _alcanca_sem_aresta(offsets, vizinhos, ids, origem, destino, ignorada):
+    visitados = bytearray(len(offsets) - 1)
+    visitados[origem] = 1
+    stack = [origem]
+    while stack:
+        x = stack.pop()
+        for i in range(offsets[x], offsets[x + 1]):
+            if ids[i] == ignorada:
+                continue
+            w = vizinhos[i]
+            if not visitados[w]:
+                if w == destino:
+                    return True
+                visitados[w] = 1
+                stack.append(w)
+    return False
+
+
+class OraculoPontes:
+    LIMITE_SEQUENCIAL = 256
+
+    @staticmethod
+    def snapshot(grafo):
+        # CSR do grafo subjacente não direcionado: cada aresta aparece nas duas
+        # pontas com o mesmo índice, o que permite ignorá-la sem alterar o grafo.
+        n = grafo.num_vertices
+        graus = [0] * (n + 1)
+        for edge in grafo.edge_list:
+            graus[edge['u'] + 1] += 1
+            graus[edge['v'] + 1] += 1
+        for v in range(n):
+            graus[v + 1] += graus[v]
+        offsets = array('q', graus)
+        proximo = list(graus[:n])
+        vizinhos = array('q', bytes(8 * graus[n]))
+        ids = array('q', bytes(8 * graus[n]))
+        for k, edge in enumerate(grafo.edge_list):
+            u, v = edge['u'], edge['v']
+            vizinhos[proximo[u]] = v
+            ids[proximo[u]] = k
+            proximo[u] += 1
+            vizinhos[proximo[v]] = u
+            ids[proximo[v]] = k
+            proximo[v] += 1
+        return offsets, vizinhos, ids
+
+    @staticmethod
+    def identificar_pontes(grafo, processos=None):
+        snapshot = OraculoPontes.snapshot(grafo)
+        candidatos = [(k, edge['u'], edge['v']) for k, edge in enumerate(grafo.edge_list)
+                      if edge['u'] != edge['v']]
+        if processos is None:
+            processos = os.cpu_count() or 1
+        if processos <= 1 or len(candidatos) < OraculoPontes.LIMITE_SEQUENCIAL:
+            offsets, vizinhos, ids = snapshot
+            indices = [k for k, u, v in candidatos
+                       if not _alcanca_sem_aresta(offsets, vizinhos, ids, u, v, k)]
+        else:
+            tamanho_bloco = max(1, len(candidatos) // (processos * 4))
+            blocos = [candidatos[i:i + tamanho_bloco] for i in range(0, len(candidatos), tamanho_bloco)]
+            indices = []
+            with ProcessPoolExecutor(max_workers=processos, initializer=_inicializar_trabalhador,
+                                     initargs=(snapshot,)) as executor:
+                for resultado in executor.map(_pontes_do_bloco, blocos):
+                    indices.extend(resultado)
+        pontes = []
+        for k in indices:
+            u, v = grafo.edge_list[k]['u'], grafo.edge_list[k]['v']
+            if not grafo.dirigido and u > v:
+                u, v = v, u
+            pontes.append((u, v))
+        return pontes
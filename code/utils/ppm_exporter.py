@@ -0,0 +1,186 @@
+import math
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from utils.desenhador import Desenhador
+from utils.canvas import Canvas
+from utils.layout import LayoutForcas
+
+LARGURA = 800
+ALTURA = 800
+
+
+def _renderizar_intervalo(tarefa):
+    # Executado num processo do pool: parte do quadro-chave, desenha só as
+    # arestas do intervalo e entrega cada quadro pronto para a saída: bytes já
+    # codificados (codificador da saída), arquivo gravado aqui mesmo, ou só
+    # as linhas que mudaram em relação ao quadro anterior.
+    quadro_chave, anterior, dirigido, segmentos, inicio, marcos, primeiro_quadro, caminho_frames, codificador = tarefa
+    imagem = Canvas(LARGURA, ALTURA, pixels=quadro_chave)
+    largura3 = LARGURA * 3
+    quadros = []
+    numero = primeiro_quadro
+    j = 0
+    for i, (p1, p2) in enumerate(segmentos, start=inicio):
+        PPMExporter._desenhar_segmento(imagem, dirigido, p1, p2)
+        if i + 1 == marcos[j]:
+            if codificador is not None:
+                quadros.append(codificador.codificar(imagem.pixels, anterior))
+                anterior = bytes(imagem.pixels)
+            elif caminho_frames is not None:
+                PPMExporter.salvar_imagem_ppm(imagem, os.path.join(caminho_frames, f"frame_{numero}.ppm"))
+            else:
+                atual = bytes(imagem.pixels)
+                linhas = [y for y in range(ALTURA)
+                          if atual[y * largura3:(y + 1) * largura3] != anterior[y * largura3:(y + 1) * largura3]]
+                if linhas:
+                    quadros.append((linhas[0], atual[linhas[0] * largura3:(linhas[-1] + 1) * largura3]))
+                else:
+                    quadros.append((0, b""))
+                anterior = atual
+            numero += 1
+            j += 1
+            if j == len(marcos):
+                break
+    return quadros
+
+
+class PPMExporter:
+    @staticmethod
+    def exportar(grafo, nome_arquivo="grafo.ppm", saida=None, passo=1, max_quadros=None, processos=None,
+                 layout=None):
+        # Sem 'saida' cada quadro vira um arquivo em dados/imagens_ppm; com uma
+        # saída de animação (utils.animacao) os quadros vão direto para ela.
+        # 'passo' grava um quadro a cada k arestas, 'max_quadros' limita o total
+        # e 'processos' > 1 distribui intervalos de quadros entre processos.
+        # 'layout' escolhe entre layout por forças e grade (ver LayoutForcas.posicoes).
+        dados_dir = "dados"
+        if not os.path.exists(dados_dir):
+            os.makedirs(dados_dir)
+        largura = LARGURA
+        altura = ALTURA
+        raio_vertice = 20
+        # Posições normalizadas (forças ou grade), com margem para os círculos.
+        margem = 2 * raio_vertice
+        posicoes = {v: (margem + round(x * (largura - 2 * margem)), margem + round(y * (altura - 2 * margem)))
+                    for v, (x, y) in enumerate(LayoutForcas.posicoes(grafo, layout))}
+        caminho_frames = os.path.join(dados_dir, "imagens_ppm")
+        if saida is None and not os.path.exists(caminho_frames):
+            os.makedirs(caminho_frames)
+        # Uma única tela acumula o desenho: cada quadro só acrescenta as arestas
+        # novas e a imagem final é o último quadro.
+        imagem = Canvas(largura, altura)
+        for i in range(grafo.num_vertices):
+            x, y = posicoes[i]
+            Desenhador.desenhar_circulo(imagem, x, y, raio_vertice, (0, 0, 255))
+        segmentos = [(posicoes[edge['u']], posicoes[edge['v']]) for edge in grafo.edge_list]
+        marcos = PPMExporter._marcos_quadros(len(segmentos), passo, max_quadros)
+        if processos is not None and processos > 1 and len(marcos) > 1:
+            PPMExporter._renderizar_paralelo(imagem, grafo, segmentos, marcos, saida, caminho_frames, processos)
+        else:
+            j = 0
+            for i, (p1, p2) in enumerate(segmentos):
+                PPMExporter._desenhar_segmento(imagem, grafo.dirigido, p1, p2)
+                if j < len(marcos) and i + 1 == marcos[j]:
+                    PPMExporter._emitir_quadro(imagem, grafo, saida, caminho_frames)
+                    j += 1
+        PPMExporter.salvar_imagem_ppm(imagem, os.path.join(dados_dir, nome_arquivo))
+        print(f"Imagem PPM exportada como {os.path.join(dados_dir, nome_arquivo)}")
+
+    @staticmethod
+    def _marcos_quadros(num_arestas, passo=1, max_quadros=None):
+        # Quantidades de arestas desenhadas após as quais sai um quadro; o
+        # último quadro sempre mostra o grafo completo.
+        if num_arestas == 0:
+            return []
+        if max_quadros is not None:
+            passo = max(passo, math.ceil(num_arestas / max(1, max_quadros)))
+        marcos = list(range(passo, num_arestas + 1, passo))
+        if not marcos or marcos[-1] != num_arestas:
+            marcos.append(num_arestas)
+        return marcos
+
+    @staticmethod
+    def _emitir_quadro(imagem, grafo, saida, caminho_frames):
+        if saida is None:
+            frame_nome = f"frame_{grafo.frame_count}.ppm"
+            PPMExporter.salvar_imagem_ppm(imagem, os.path.join(caminho_frames, frame_nome))
+        else:
+            saida.adicionar_quadro(imagem)
+        grafo.frame_count += 1
+
+    @staticmethod
+    def _renderizar_paralelo(imagem, grafo, segmentos, marcos, saida, caminho_frames, processos):
+        # O processo principal só desenha as arestas uma vez, para tirar um
+        # quadro-chave no início de cada intervalo; desenhar os quadros e
+        # codificá-los (a parte cara) fica no pool. Os intervalos são consumidos
+        # na ordem original, com no máximo 2 * processos tarefas em voo.
+        # Saídas com codificador (SaidaGIF) recebem bytes prontos; as demais
+        # recebem o quadro remontado a partir das linhas alteradas.
+        tamanho_bloco = max(1, min(64, math.ceil(len(marcos) / (processos * 4))))
+        destino_frames = caminho_frames if saida is None else None
+        codificador = anterior_saida = tela = None
+        if saida is not None and hasattr(saida, "codificador"):
+            codificador, anterior_saida = saida.codificador(LARGURA, ALTURA)
+        elif saida is not None:
+            tela = imagem.copiar()
+        estado = {"consumidos": 0, "total": len(marcos), "imagem": imagem, "tela": tela}
+        pendentes = deque()
+        desenhadas = 0
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            for b in range(0, len(marcos), tamanho_bloco):
+                bloco = marcos[b:b + tamanho_bloco]
+                inicio = marcos[b - 1] if b > 0 else 0
+                while desenhadas < inicio:
+                    p1, p2 = segmentos[desenhadas]
+                    PPMExporter._desenhar_segmento(imagem, grafo.dirigido, p1, p2)
+                    desenhadas += 1
+                quadro_chave = bytes(imagem.pixels)
+                # O quadro anterior ao primeiro do intervalo é o próprio quadro-chave,
+                # exceto no início, quando é o último que a saída recebeu.
+                anterior = anterior_saida if b == 0 and codificador is not None else quadro_chave
+                tarefa = (quadro_chave, anterior, grafo.dirigido, segmentos[inicio:bloco[-1]], inicio, bloco,
+                          grafo.frame_count + b, destino_frames, codificador)
+                pendentes.append(executor.submit(_renderizar_intervalo, tarefa))
+                if len(pendentes) >= 2 * processos:
+                    PPMExporter._consumir_bloco(pendentes.popleft(), saida, estado)
+            # A tela principal termina no grafo completo, que é o último quadro.
+            while desenhadas < len(segmentos):
+                p1, p2 = segmentos[desenhadas]
+                PPMExporter._desenhar_segmento(imagem, grafo.dirigido, p1, p2)
+                desenhadas += 1
+            while pendentes:
+                PPMExporter._consumir_bloco(pendentes.popleft(), saida, estado)
+        grafo.frame_count += len(marcos)
+
+    @staticmethod
+    def _consumir_bloco(futuro, saida, estado):
+        quadros = futuro.result()
+        if saida is None:
+            return
+        tela = estado["tela"]
+        largura3 = LARGURA * 3
+        for quadro in quadros:
+            estado["consumidos"] += 1
+            if tela is None:
+                ultimo = estado["consumidos"] == estado["total"]
+                saida.adicionar_codificado(quadro, bytes(estado["imagem"].pixels) if ultimo else None)
+            else:
+                y0, linhas = quadro
+                tela.pixels[y0 * largura3:y0 * largura3 + len(linhas)] = linhas
+                saida.adicionar_quadro(tela)
+
+    @staticmethod
+    def _desenhar_segmento(imagem, dirigido, p1, p2):
+        x1, y1 = p1
+        x2, y2 = p2
+        if dirigido:
+            Desenhador.desenhar_seta(imagem, x1, y1, x2, y2, (0, 0, 0))
+        else:
+            Desenhador.desenhar_linha_basica(imagem, x1, y1, x2, y2, (0, 0, 0))
+
+    @staticmethod
+    def salvar_imagem_ppm(imagem, nome_arquivo):
+        with open(nome_arquivo, "wb") as f:
+            f.write(imagem.cabecalho_ppm())
+            f.write(memoryview(imagem.pixels))
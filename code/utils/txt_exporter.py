@@ -0,0 +1,96 @@
+import os
+
+TAMANHO_BUFFER = 1 << 20
+# Acima deste número de células uma matriz é escrita em coordenadas (COO).
+LIMITE_CELULAS_DENSAS = 40_000
+
+
+class TXTExporter:
+    @staticmethod
+    def exportar(grafo, nome_arquivo="grafo.txt", esparso=None, limite_denso=LIMITE_CELULAS_DENSAS):
+        # esparso=None escolhe por matriz: densa só até 'limite_denso' células.
+        # Nenhuma matriz é montada; as linhas saem direto da lista de
+        # adjacência e da lista de arestas.
+        dados_dir = "dados"
+        if not os.path.exists(dados_dir):
+            os.makedirs(dados_dir)
+        n = grafo.num_vertices
+        m = len(grafo.edge_list)
+        adj_esparsa = esparso if esparso is not None else n * n > limite_denso
+        inc_esparsa = esparso if esparso is not None else n * m > limite_denso
+        with open(os.path.join(dados_dir, nome_arquivo), 'w', encoding='utf-8', buffering=TAMANHO_BUFFER) as f:
+            f.write(f"Grafo: {grafo.nome}\n")
+            f.write(f"Direcionado: {'Sim' if grafo.dirigido else 'Não'}\n")
+            f.write(f"Vértices: {n}\n")
+            f.write(f"Arestas: {m}\n\n")
+
+            f.write("Lista de Adjacência:\n")
+            f.writelines(TXTExporter._linhas_lista(grafo))
+
+            if adj_esparsa:
+                f.write("\nMatriz de Adjacência (linha coluna valor):\n")
+                f.writelines(f"{u + 1} {v + 1} {peso}\n" for u, adj in grafo.lista_adj.adjacencias.items()
+                             for v, peso in adj.items())
+            else:
+                f.write("\nMatriz de Adjacência:\n")
+                f.write("   " + " ".join([f"{i+1:3}" for i in range(n)]) + "\n")
+                f.writelines(TXTExporter._linha_densa(u, sorted(adj.items()), n)
+                             for u, adj in grafo.lista_adj.adjacencias.items())
+
+            if not grafo.edge_list:
+                f.write("\nMatriz de Incidência:\n")
+                f.write("Sem arestas.\n")
+            elif inc_esparsa:
+                f.write("\nMatriz de Incidência (vértice aresta valor):\n")
+                f.writelines(TXTExporter._triplas_incidencia(grafo))
+            else:
+                f.write("\nMatriz de Incidência:\n")
+                f.write("   " + " ".join([f"{i+1:3}" for i in range(m)]) + "\n")
+                linhas = TXTExporter._linhas_incidencia(grafo)
+                f.writelines(TXTExporter._linha_densa(v, linhas[v], m) for v in range(n))
+
+    @staticmethod
+    def _linhas_lista(grafo):
+        for vertice, adj in grafo.lista_adj.adjacencias.items():
+            adj_exibicao = ", ".join([f"{v + 1}({peso})" for v, peso in adj.items()])
+            yield f"{vertice + 1}: {adj_exibicao}\n"
+
+    @staticmethod
+    def _linha_densa(i, entradas, largura):
+        # Mesmo formato da matriz densa ({:3} por célula), mas as sequências de
+        # zeros entre as entradas não nulas saem por repetição de string.
+        partes = [f"{i+1:3} "]
+        coluna = 0
+        for j, valor in entradas:
+            partes.append("  0 " * (j - coluna))
+            partes.append(f"{valor:3} ")
+            coluna = j + 1
+        partes.append("  0 " * (largura - coluna))
+        return "".join(partes)[:-1] + "\n"
+
+    @staticmethod
+    def _linhas_incidencia(grafo):
+        # Colunas na ordem de edge_list, como em MatrizIncidencia.inc_matrix.
+        linhas = [[] for _ in range(grafo.num_vertices)]
+        for j, edge in enumerate(grafo.edge_list):
+            u, v = edge['u'], edge['v']
+            if grafo.dirigido:
+                linhas[u].append((j, 1 if u != v else -1))
+                if u != v:
+                    linhas[v].append((j, -1))
+            else:
+                linhas[u].append((j, 1))
+                if u != v:
+                    linhas[v].append((j, 1))
+        return linhas
+
+    @staticmethod
+    def _triplas_incidencia(grafo):
+        for j, edge in enumerate(grafo.edge_list):
+            u, v = edge['u'], edge['v']
+            if u == v:
+                yield f"{u + 1} {j + 1} {-1 if grafo.dirigido else 1}\n"
+            elif grafo.dirigido:
+                yield f"{u + 1} {j + 1} 1\n{v + 1} {j + 1} -1\n"
+            else:
+                yield f"{u + 1} {j + 1} 1\n{v + 1} {j + 1} 1\n"